@@ -10,9 +10,31 @@ from typing import Any
 
 from provide.foundation.eventsets.registry import get_registry
 from provide.foundation.eventsets.types import EventMapping, FieldMapping
+from provide.foundation.logger.message import LazyMessage
 
 """Event set resolution and enrichment logic."""
 
+# Dotted field prefixes that also match underscored mapping names
+# (e.g. "http.method" -> "http_method")
+_DOTTED_FIELD_PREFIXES = ("http.", "llm.", "db.", "task.")
+
+# Upper bound on cached field key lookups (positive and negative)
+_FIELD_CACHE_SIZE_LIMIT = 4096
+
+
+class _MappingEntry:
+    """Indexed EventMapping with its precomputed default marker."""
+
+    __slots__ = ("default_marker", "mapping", "position")
+
+    def __init__(self, position: int, mapping: EventMapping) -> None:
+        self.position = position
+        self.mapping = mapping
+        self.default_marker = mapping.visual_markers.get(mapping.default_key, "")
+
+    def marker_for(self, value_str: str) -> str:
+        return self.mapping.visual_markers.get(value_str, self.default_marker)
+
 
 class EventSetResolver:
     """Resolves and applies event set enrichments to log events."""
@@ -21,13 +43,16 @@ class EventSetResolver:
         """Initialize the resolver with cached configurations."""
         self._field_mappings: list[FieldMapping] = []
         self._event_mappings_by_set: dict[str, list[EventMapping]] = {}
+        self._mapping_index: dict[str, _MappingEntry] = {}
+        self._field_cache: dict[str, _MappingEntry | None] = {}
         self._resolved = False
 
     def resolve(self) -> None:
         """Resolve all registered event sets into a unified configuration.
 
         This merges all registered event sets by priority, building
-        the field mapping and event mapping lookup tables.
+        the field mapping and event mapping lookup tables. Mappings are
+        indexed by name, keeping the first mapping in priority order.
         """
         registry = get_registry()
         event_sets = registry.list_event_sets()  # Already sorted by priority
@@ -35,8 +60,11 @@ class EventSetResolver:
         # Clear existing state
         self._field_mappings.clear()
         self._event_mappings_by_set.clear()
+        self._mapping_index.clear()
+        self._field_cache.clear()
 
         # Process each event set in priority order
+        position = 0
         for event_set in event_sets:
             # Store event mappings by event set name
             self._event_mappings_by_set[event_set.name] = event_set.mappings
@@ -44,6 +72,11 @@ class EventSetResolver:
             # Add field mappings
             self._field_mappings.extend(event_set.field_mappings)
 
+            for mapping in event_set.mappings:
+                if mapping.name not in self._mapping_index:
+                    self._mapping_index[mapping.name] = _MappingEntry(position, mapping)
+                position += 1
+
         self._resolved = True
 
     def _process_field_enrichment(
@@ -54,25 +87,23 @@ class EventSetResolver:
         Returns:
             Visual marker if found, None otherwise
         """
-        event_mapping = self._find_event_mapping_for_field(field_key, field_value)
-        if not event_mapping:
+        entry = self._find_entry_for_field(field_key)
+        if entry is None:
             return None
 
+        event_mapping = entry.mapping
         value_str = str(field_value).lower()
 
         # Apply transformations
-        if value_str in event_mapping.transformations:
+        if event_mapping.transformations and value_str in event_mapping.transformations:
             field_value = event_mapping.transformations[value_str](field_value)
             value_str = str(field_value).lower()
 
         # Get visual marker
-        visual_marker = event_mapping.visual_markers.get(
-            value_str,
-            event_mapping.visual_markers.get(event_mapping.default_key, ""),
-        )
+        visual_marker = entry.marker_for(value_str)
 
         # Apply metadata fields
-        if value_str in event_mapping.metadata_fields:
+        if event_mapping.metadata_fields and value_str in event_mapping.metadata_fields:
             for meta_key, meta_value in event_mapping.metadata_fields[value_str].items():
                 if meta_key not in event_dict:
                     event_dict[meta_key] = meta_value
@@ -86,7 +117,10 @@ class EventSetResolver:
 
         prefix = "".join(f"[{e}]" for e in enrichments)
         event_msg = event_dict.get("event", "")
-        event_dict["event"] = f"{prefix} {event_msg}" if event_msg else prefix
+        if isinstance(event_msg, LazyMessage):
+            event_dict["event"] = event_msg.with_step(lambda text: f"{prefix} {text}" if text else prefix)
+        else:
+            event_dict["event"] = f"{prefix} {event_msg}" if event_msg else prefix
 
     def enrich_event(self, event_dict: dict[str, Any]) -> dict[str, Any]:
         """Enrich a log event with event set data.
@@ -124,46 +158,35 @@ class EventSetResolver:
         1. Direct field name mapping (e.g., "domain" -> "domain" mapping)
         2. Field prefix mapping (e.g., "http.method" -> "http_method" mapping)
         3. Field pattern matching
+
+        When several candidates match, the one earliest in priority order wins.
         """
-        # First check for direct field name matches
-        simple_key = field_key.split(".")[-1]  # Get last part of dotted key
-
-        for _event_set_name, mappings in self._event_mappings_by_set.items():
-            for mapping in mappings:
-                # Direct name match
-                if mapping.name == simple_key or mapping.name == field_key:
-                    return mapping
-
-                # Pattern matching for common cases
-                if (
-                    field_key.startswith("http.")
-                    and mapping.name.startswith("http_")
-                    and field_key.replace(".", "_") == mapping.name
-                ):
-                    return mapping
-
-                if (
-                    field_key.startswith("llm.")
-                    and mapping.name.startswith("llm_")
-                    and field_key.replace(".", "_") == mapping.name
-                ):
-                    return mapping
-
-                if (
-                    field_key.startswith("db.")
-                    and mapping.name.startswith("db_")
-                    and field_key.replace(".", "_") == mapping.name
-                ):
-                    return mapping
-
-                if (
-                    field_key.startswith("task.")
-                    and mapping.name.startswith("task_")
-                    and field_key.replace(".", "_") == mapping.name
-                ):
-                    return mapping
-
-        return None
+        entry = self._find_entry_for_field(field_key)
+        return entry.mapping if entry is not None else None
+
+    def _find_entry_for_field(self, field_key: str) -> _MappingEntry | None:
+        """Look up the indexed mapping for a field key, caching misses too."""
+        try:
+            return self._field_cache[field_key]
+        except KeyError:
+            pass
+
+        index = self._mapping_index
+        simple_key = field_key.rpartition(".")[2]  # Get last part of dotted key
+        best = index.get(simple_key)
+
+        candidate = index.get(field_key)
+        if candidate is not None and (best is None or candidate.position < best.position):
+            best = candidate
+
+        if field_key.startswith(_DOTTED_FIELD_PREFIXES):
+            candidate = index.get(field_key.replace(".", "_"))
+            if candidate is not None and (best is None or candidate.position < best.position):
+                best = candidate
+
+        if len(self._field_cache) < _FIELD_CACHE_SIZE_LIMIT:
+            self._field_cache[field_key] = best
+        return best
 
     def get_visual_markers(self, event_dict: dict[str, Any]) -> list[str]:
         """Extract visual markers for an event without modifying it.
@@ -184,15 +207,11 @@ class EventSetResolver:
             if field_key == "event" or field_value is None:
                 continue
 
-            event_mapping = self._find_event_mapping_for_field(field_key, field_value)
-            if not event_mapping:
+            entry = self._find_entry_for_field(field_key)
+            if entry is None:
                 continue
 
-            value_str = str(field_value).lower()
-            marker = event_mapping.visual_markers.get(
-                value_str,
-                event_mapping.visual_markers.get(event_mapping.default_key, ""),
-            )
+            marker = entry.marker_for(str(field_value).lower())
 
             if marker:
                 markers.append(marker)
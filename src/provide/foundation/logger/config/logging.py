@@ -19,17 +19,26 @@ from provide.foundation.config.converters import (
     parse_log_level,
     parse_module_levels,
     parse_rate_limits,
+    validate_choice,
     validate_log_level,
+    validate_non_negative,
     validate_overflow_policy,
     validate_positive,
 )
 from provide.foundation.config.defaults import path_converter
 from provide.foundation.config.env import RuntimeConfig
 from provide.foundation.logger.defaults import (
+    DEFAULT_ASYNC_SINK_BATCH_SIZE,
+    DEFAULT_ASYNC_SINK_BUFFER_SIZE,
+    DEFAULT_ASYNC_SINK_ENABLED,
+    DEFAULT_ASYNC_SINK_FLUSH_INTERVAL,
+    DEFAULT_ASYNC_SINK_OVERFLOW_POLICY,
+    DEFAULT_COMPILED_PROCESSORS,
     DEFAULT_CONSOLE_FORMATTER,
     DEFAULT_DAS_EMOJI_ENABLED,
     DEFAULT_FOUNDATION_LOG_OUTPUT,
     DEFAULT_FOUNDATION_SETUP_LOG_LEVEL,
+    DEFAULT_JSON_BACKEND,
     DEFAULT_LOG_LEVEL,
     DEFAULT_LOGGER_NAME_EMOJI_ENABLED,
     DEFAULT_OMIT_TIMESTAMP,
@@ -38,6 +47,8 @@ from provide.foundation.logger.defaults import (
     DEFAULT_RATE_LIMIT_GLOBAL,
     DEFAULT_RATE_LIMIT_GLOBAL_CAPACITY,
     DEFAULT_RATE_LIMIT_OVERFLOW_POLICY,
+    DEFAULT_RATE_LIMIT_SHARDS,
+    DEFAULT_RATE_LIMIT_STRATEGY,
     DEFAULT_SANITIZATION_ENABLED,
     DEFAULT_SANITIZATION_MASK_PATTERNS,
     DEFAULT_SANITIZATION_SANITIZE_DICTS,
@@ -75,6 +86,13 @@ class LoggingConfig(RuntimeConfig):
         converter=parse_console_formatter,
         description="Console output formatter (key_value or json)",
     )
+    json_backend: str = field(
+        default=DEFAULT_JSON_BACKEND,
+        env_var="PROVIDE_LOG_JSON_BACKEND",
+        converter=lambda x: str(x).lower(),
+        validator=validate_choice(["auto", "orjson", "msgspec", "stdlib"]),
+        description="JSON encoder for the json formatter (auto, orjson, msgspec, or stdlib)",
+    )
     logger_name_emoji_prefix_enabled: bool = field(
         default=DEFAULT_LOGGER_NAME_EMOJI_ENABLED,
         env_var="PROVIDE_LOG_LOGGER_NAME_EMOJI_ENABLED",
@@ -93,6 +111,12 @@ class LoggingConfig(RuntimeConfig):
         converter=parse_bool_extended,
         description="Omit timestamps from console output",
     )
+    compiled_processors: bool = field(
+        default=DEFAULT_COMPILED_PROCESSORS,
+        env_var="PROVIDE_LOG_COMPILED_PROCESSORS",
+        converter=parse_bool_extended,
+        description="Fuse config-determined processor steps into compiled processors",
+    )
     # File logging configuration
     log_file: Path | None = field(
         default=None,
@@ -100,6 +124,42 @@ class LoggingConfig(RuntimeConfig):
         converter=path_converter,
         description="Path to log file",
     )
+    # Async sink configuration
+    async_sink_enabled: bool = field(
+        default=DEFAULT_ASYNC_SINK_ENABLED,
+        env_var="PROVIDE_LOG_ASYNC_SINK_ENABLED",
+        converter=parse_bool_extended,
+        description="Write log output from a background thread in batches",
+    )
+    async_sink_buffer_size: int = field(
+        default=DEFAULT_ASYNC_SINK_BUFFER_SIZE,
+        env_var="PROVIDE_LOG_ASYNC_SINK_BUFFER_SIZE",
+        converter=int,
+        validator=validate_positive,
+        description="Maximum number of log lines queued for the async sink",
+    )
+    async_sink_batch_size: int = field(
+        default=DEFAULT_ASYNC_SINK_BATCH_SIZE,
+        env_var="PROVIDE_LOG_ASYNC_SINK_BATCH_SIZE",
+        converter=int,
+        validator=validate_positive,
+        description="Queued lines that trigger an async sink write before the flush interval",
+    )
+    async_sink_flush_interval: float = field(
+        default=DEFAULT_ASYNC_SINK_FLUSH_INTERVAL,
+        env_var="PROVIDE_LOG_ASYNC_SINK_FLUSH_INTERVAL",
+        converter=lambda x: (
+            parse_float_with_validation(x, min_val=0.0) if x else DEFAULT_ASYNC_SINK_FLUSH_INTERVAL
+        ),
+        validator=validate_positive,
+        description="Seconds between async sink writes while traffic is light",
+    )
+    async_sink_overflow_policy: str = field(
+        default=DEFAULT_ASYNC_SINK_OVERFLOW_POLICY,
+        env_var="PROVIDE_LOG_ASYNC_SINK_OVERFLOW_POLICY",
+        validator=validate_overflow_policy,
+        description="Policy when the async sink buffer is full: drop_oldest, drop_newest, or block",
+    )
     foundation_setup_log_level: LogLevelStr = field(
         default=DEFAULT_FOUNDATION_SETUP_LOG_LEVEL,
         env_var="FOUNDATION_LOG_LEVEL",
@@ -169,6 +229,20 @@ class LoggingConfig(RuntimeConfig):
         validator=validate_overflow_policy,
         description="Policy when queue is full: drop_oldest, drop_newest, or block",
     )
+    rate_limit_strategy: str = field(
+        default=DEFAULT_RATE_LIMIT_STRATEGY,
+        env_var="PROVIDE_LOG_RATE_LIMIT_STRATEGY",
+        converter=lambda x: str(x).lower(),
+        validator=validate_choice(["locked", "sharded"]),
+        description="Token bucket strategy: locked (one shared bucket) or sharded (per-thread buckets)",
+    )
+    rate_limit_shards: int = field(
+        default=DEFAULT_RATE_LIMIT_SHARDS,
+        env_var="PROVIDE_LOG_RATE_LIMIT_SHARDS",
+        converter=int,
+        validator=validate_non_negative,
+        description="Number of token bucket shards for the sharded strategy (0 = one per CPU)",
+    )
     # Sanitization configuration
     sanitization_enabled: bool = field(
         default=DEFAULT_SANITIZATION_ENABLED,
@@ -13,8 +13,10 @@ from attrs import define
 from provide.foundation.config.base import field
 from provide.foundation.config.converters import (
     parse_bool_extended,
+    parse_float_with_validation,
     parse_headers,
     parse_sample_rate,
+    validate_positive,
     validate_sample_rate,
 )
 from provide.foundation.config.env import RuntimeConfig
@@ -22,6 +24,10 @@ from provide.foundation.logger.config.logging import LoggingConfig
 from provide.foundation.logger.defaults import default_logging_config
 from provide.foundation.telemetry.defaults import (
     DEFAULT_METRICS_ENABLED,
+    DEFAULT_OTLP_LOG_BATCH_ENABLED,
+    DEFAULT_OTLP_LOG_BATCH_SIZE,
+    DEFAULT_OTLP_LOG_FLUSH_INTERVAL,
+    DEFAULT_OTLP_LOG_QUEUE_SIZE,
     DEFAULT_OTLP_PROTOCOL,
     DEFAULT_TELEMETRY_GLOBALLY_DISABLED,
     DEFAULT_TRACE_SAMPLE_RATE,
@@ -118,6 +124,35 @@ class TelemetryConfig(RuntimeConfig):
         env_var="OTEL_EXPORTER_OTLP_PROTOCOL",
         description="OTLP protocol (grpc, http/protobuf)",
     )
+    otlp_log_batch_enabled: bool = field(
+        default=DEFAULT_OTLP_LOG_BATCH_ENABLED,
+        env_var="PROVIDE_OTLP_LOG_BATCH_ENABLED",
+        converter=parse_bool_extended,
+        description="Queue OTLP log records and emit them in batches from a background thread",
+    )
+    otlp_log_batch_size: int = field(
+        default=DEFAULT_OTLP_LOG_BATCH_SIZE,
+        env_var="PROVIDE_OTLP_LOG_BATCH_SIZE",
+        converter=int,
+        validator=validate_positive,
+        description="Queued OTLP log records that trigger an emit",
+    )
+    otlp_log_flush_interval: float = field(
+        default=DEFAULT_OTLP_LOG_FLUSH_INTERVAL,
+        env_var="PROVIDE_OTLP_LOG_FLUSH_INTERVAL",
+        converter=lambda x: (
+            parse_float_with_validation(x, min_val=0.0) if x else DEFAULT_OTLP_LOG_FLUSH_INTERVAL
+        ),
+        validator=validate_positive,
+        description="Maximum seconds OTLP log records wait in the batch queue",
+    )
+    otlp_log_queue_size: int = field(
+        default=DEFAULT_OTLP_LOG_QUEUE_SIZE,
+        env_var="PROVIDE_OTLP_LOG_QUEUE_SIZE",
+        converter=int,
+        validator=validate_positive,
+        description="Maximum queued OTLP log records before the oldest are dropped",
+    )
     trace_sample_rate: float = field(
         default=DEFAULT_TRACE_SAMPLE_RATE,
         env_var="OTEL_TRACE_SAMPLE_RATE",
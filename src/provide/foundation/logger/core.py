@@ -15,6 +15,16 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from provide.foundation.concurrency.locks import get_lock_manager
+from provide.foundation.logger.constants import (
+    CRITICAL_LEVEL,
+    DEBUG_LEVEL,
+    ERROR_LEVEL,
+    INFO_LEVEL,
+    TRACE_LEVEL,
+    WARNING_LEVEL,
+)
+from provide.foundation.logger.levels import EffectiveLevelTable, get_numeric_level
+from provide.foundation.logger.message import LazyMessage
 from provide.foundation.logger.types import TRACE_LEVEL_NAME
 
 """Core FoundationLogger implementation.
@@ -26,6 +36,94 @@ if TYPE_CHECKING:
 
 _LAZY_SETUP_STATE: dict[str, Any] = {"done": False, "error": None, "in_progress": False}
 
+# Effective-level table for the active configuration. None means "unknown":
+# calls take the full path and the processor chain decides.
+_LEVEL_TABLE_STATE: dict[str, EffectiveLevelTable | None] = {"table": None}
+
+
+def build_level_table(config: TelemetryConfig) -> EffectiveLevelTable | None:
+    """Build the effective-level table for a telemetry configuration.
+
+    Returns None when every level is consumed by the processor chain (the
+    OTLP processor exports all levels before console level filtering), in
+    which case no call may be short-circuited.
+
+    Args:
+        config: Telemetry configuration being applied
+
+    Returns:
+        Level table, or None if early level filtering is not safe
+    """
+    if config.otlp_endpoint and not config.globally_disabled:
+        return None
+    return EffectiveLevelTable(config.logging.default_level, config.logging.module_levels)
+
+
+def set_level_table(table: EffectiveLevelTable | None) -> None:
+    """Install the effective-level table used for early level short-circuiting."""
+    _LEVEL_TABLE_STATE["table"] = table
+
+
+def invalidate_level_table() -> None:
+    """Drop the effective-level table so calls take the full processor path."""
+    _LEVEL_TABLE_STATE["table"] = None
+
+
+# Bound loggers keyed by logger name. Entries are only valid for the structlog
+# configuration they were bound under, recorded in _BOUND_LOGGER_CACHE_STATE.
+_BOUND_LOGGER_CACHE: dict[str, Any] = {}
+_BOUND_LOGGER_CACHE_STATE: dict[str, Any] = {"config": None}
+_BOUND_LOGGER_CACHE_SIZE_LIMIT: int = 1024
+
+
+def clear_bound_logger_cache() -> None:
+    """Drop all cached bound loggers."""
+    _BOUND_LOGGER_CACHE.clear()
+    _BOUND_LOGGER_CACHE_STATE["config"] = None
+
+
+def _bound_logger_cache_is_current(config: dict[str, Any]) -> bool:
+    cached_config = _BOUND_LOGGER_CACHE_STATE["config"]
+    return (
+        cached_config is not None
+        and cached_config["processors"] is config["processors"]
+        and cached_config["logger_factory"] is config["logger_factory"]
+        and cached_config["wrapper_class"] is config["wrapper_class"]
+        and cached_config["context_class"] is config["context_class"]
+    )
+
+
+def get_bound_logger(name: str) -> Any:
+    """Get a structlog logger bound to a logger name, reusing cached instances.
+
+    Bound loggers are immutable, so one instance per name can be shared.
+    The cache is dropped whenever structlog is reconfigured (a bound logger
+    captures the processors and logger factory it was created with) and is
+    bypassed entirely when ``cache_logger_on_first_use`` is disabled.
+
+    Args:
+        name: Logger name to bind
+
+    Returns:
+        Bound structlog logger
+    """
+    config = structlog.get_config()
+    if not config["cache_logger_on_first_use"]:
+        return structlog.get_logger().bind(logger_name=name)
+
+    if _bound_logger_cache_is_current(config):
+        bound_logger = _BOUND_LOGGER_CACHE.get(name)
+        if bound_logger is not None:
+            return bound_logger
+    else:
+        _BOUND_LOGGER_CACHE.clear()
+        _BOUND_LOGGER_CACHE_STATE["config"] = config
+
+    bound_logger = structlog.get_logger().bind(logger_name=name)
+    if len(_BOUND_LOGGER_CACHE) < _BOUND_LOGGER_CACHE_SIZE_LIMIT:
+        _BOUND_LOGGER_CACHE[name] = bound_logger
+    return bound_logger
+
 
 class FoundationLogger:
     """A `structlog`-based logger providing a standardized logging interface."""
@@ -169,6 +267,9 @@ class FoundationLogger:
         """Set up emergency fallback logging when normal setup fails."""
         from provide.foundation.utils.streams import get_safe_stderr
 
+        invalidate_level_table()
+        clear_bound_logger_cache()
+
         with contextlib.suppress(Exception):
             structlog.configure(
                 processors=[structlog.dev.ConsoleRenderer()],
@@ -180,14 +281,14 @@ class FoundationLogger:
     def get_logger(self, name: str | None = None) -> Any:
         self._ensure_configured()
         effective_name = name if name is not None else "foundation.default"
-        return structlog.get_logger().bind(logger_name=effective_name)
+        return get_bound_logger(effective_name)
 
-    def _log_with_level(self, level_method_name: str, event: str, **kwargs: Any) -> None:
+    def _log_with_level(self, level_method_name: str, event: str | LazyMessage, **kwargs: Any) -> None:
         self._ensure_configured()
 
         # Use the logger name from kwargs if provided, otherwise default
         logger_name = kwargs.pop("_foundation_logger_name", "foundation")
-        log = self.get_logger(logger_name)
+        log = get_bound_logger(logger_name if logger_name is not None else "foundation.default")
 
         # Handle trace level specially since PrintLogger doesn't have trace method
         if level_method_name == "trace":
@@ -196,15 +297,60 @@ class FoundationLogger:
         else:
             getattr(log, level_method_name)(event, **kwargs)
 
-    def _format_message_with_args(self, event: str | Any, args: tuple[Any, ...]) -> str:
-        """Format a log message with positional arguments using % formatting."""
+    def _format_message_with_args(self, event: str | Any, args: tuple[Any, ...]) -> str | LazyMessage:
+        """Prepare a log message with positional arguments for % formatting.
+
+        With arguments, returns a LazyMessage so the formatting only happens
+        if the event survives filtering and reaches a renderer.
+        """
         if args:
-            try:
-                return str(event) % args
-            except (TypeError, ValueError):
-                return f"{event} {args}"
+            return LazyMessage(event, args)
         return str(event)
 
+    def _is_disabled(self, level_num: int, kwargs: dict[str, Any]) -> bool:
+        """Check whether a call can be dropped before any formatting or binding.
+
+        Mirrors how the event's logger name is resolved in the processor
+        chain: an explicit ``logger_name`` kwarg overrides the bound name.
+        Calls carrying an explicit ``level`` kwarg are never short-circuited.
+        """
+        table = _LEVEL_TABLE_STATE["table"]
+        if table is None or "level" in kwargs:
+            return False
+        logger_name = kwargs.get("logger_name") or kwargs.get("_foundation_logger_name") or "foundation"
+        return level_num < table.threshold_for(logger_name)
+
+    def is_enabled_for(self, level: str | int, name: str | None = None) -> bool:
+        """Check whether an event at the given level would be emitted.
+
+        Use this to guard expensive argument construction on hot paths.
+
+        Args:
+            level: Level name (e.g. "DEBUG") or numeric level
+            name: Logger name to check (defaults to "foundation")
+
+        Returns:
+            True if events at this level are processed for the logger name
+
+        """
+        self._ensure_configured()
+        level_num = level if isinstance(level, int) else get_numeric_level(level)
+        table = _LEVEL_TABLE_STATE["table"]
+        if table is None:
+            return True
+        return table.is_enabled_for(name or "foundation", level_num)
+
+    # stdlib logging compatible alias
+    isEnabledFor = is_enabled_for
+
+    def is_trace_enabled(self, name: str | None = None) -> bool:
+        """Check whether trace-level events would be emitted."""
+        return self.is_enabled_for(TRACE_LEVEL, name)
+
+    def is_debug_enabled(self, name: str | None = None) -> bool:
+        """Check whether debug-level events would be emitted."""
+        return self.is_enabled_for(DEBUG_LEVEL, name)
+
     def trace(
         self,
         event: str,
@@ -213,39 +359,53 @@ class FoundationLogger:
         **kwargs: Any,
     ) -> None:
         """Log trace-level event for detailed debugging."""
-        formatted_event = self._format_message_with_args(event, args)
         if _foundation_logger_name is not None:
             kwargs["_foundation_logger_name"] = _foundation_logger_name
+        if self._is_disabled(TRACE_LEVEL, kwargs):
+            return
+        formatted_event = self._format_message_with_args(event, args)
         self._log_with_level(TRACE_LEVEL_NAME.lower(), formatted_event, **kwargs)
 
     def debug(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log debug-level event."""
+        if self._is_disabled(DEBUG_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         self._log_with_level("debug", formatted_event, **kwargs)
 
     def info(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log info-level event."""
+        if self._is_disabled(INFO_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         self._log_with_level("info", formatted_event, **kwargs)
 
     def warning(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log warning-level event."""
+        if self._is_disabled(WARNING_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         self._log_with_level("warning", formatted_event, **kwargs)
 
     def error(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log error-level event."""
+        if self._is_disabled(ERROR_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         self._log_with_level("error", formatted_event, **kwargs)
 
     def exception(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log error-level event with exception traceback."""
+        if self._is_disabled(ERROR_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         kwargs["exc_info"] = True
         self._log_with_level("error", formatted_event, **kwargs)
 
     def critical(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log critical-level event."""
+        if self._is_disabled(CRITICAL_LEVEL, kwargs):
+            return
         formatted_event = self._format_message_with_args(event, args)
         self._log_with_level("critical", formatted_event, **kwargs)
 
@@ -15,7 +15,8 @@ from typing import Any, Protocol
 import structlog
 
 from provide.foundation.logger.constants import DEFAULT_FALLBACK_NUMERIC
-from provide.foundation.logger.levels import get_numeric_level, normalize_level
+from provide.foundation.logger.levels import EffectiveLevelTable, get_numeric_level, normalize_level
+from provide.foundation.logger.message import prefix_message
 from provide.foundation.logger.types import TRACE_LEVEL_NAME, TRACE_LEVEL_NUM, LogLevelStr
 
 """Foundation Telemetry Custom Structlog Processors.
@@ -71,12 +72,11 @@ class _LevelFilter:
         module_levels: dict[str, LogLevelStr],
         level_to_numeric_map: dict[LogLevelStr, int],
     ) -> None:
-        self.default_numeric_level: int = level_to_numeric_map[default_level_str]
-        self.module_numeric_levels: dict[str, int] = {
-            module: level_to_numeric_map[level_str] for module, level_str in module_levels.items()
-        }
+        self.level_table = EffectiveLevelTable(default_level_str, module_levels, level_to_numeric_map)
+        self.default_numeric_level: int = self.level_table.default_numeric_level
+        self.module_numeric_levels: dict[str, int] = self.level_table.module_numeric_levels
         self.level_to_numeric_map = level_to_numeric_map
-        self.sorted_module_paths: list[str] = sorted(self.module_numeric_levels.keys(), key=len, reverse=True)
+        self.sorted_module_paths: list[str] = self.level_table.sorted_module_paths
 
     def __call__(
         self,
@@ -93,12 +93,7 @@ class _LevelFilter:
             normalized_level,
             fallback=DEFAULT_FALLBACK_NUMERIC,
         )
-        threshold_num_level: int = self.default_numeric_level
-        for path_prefix in self.sorted_module_paths:
-            if logger_name.startswith(path_prefix):
-                threshold_num_level = self.module_numeric_levels[path_prefix]
-                break
-        if event_num_level < threshold_num_level:
+        if event_num_level < self.level_table.threshold_for(logger_name):
             raise structlog.DropEvent
         return event_dict
 
@@ -164,7 +159,7 @@ def add_logger_name_emoji_prefix(
             _EMOJI_LOOKUP_CACHE[logger_name] = chosen_emoji
     event_msg = event_dict.get("event")
     if event_msg is not None:
-        event_dict["event"] = f"{chosen_emoji} {event_msg}"
+        event_dict["event"] = prefix_message(chosen_emoji, event_msg)
     elif chosen_emoji:
         event_dict["event"] = chosen_emoji
     return event_dict
@@ -21,6 +21,8 @@ DEFAULT_CONSOLE_FORMATTER = "key_value"
 DEFAULT_LOGGER_NAME_EMOJI_ENABLED = True
 DEFAULT_DAS_EMOJI_ENABLED = True
 DEFAULT_OMIT_TIMESTAMP = False
+DEFAULT_COMPILED_PROCESSORS = False
+DEFAULT_JSON_BACKEND = "auto"
 DEFAULT_FOUNDATION_SETUP_LOG_LEVEL = "WARNING"
 DEFAULT_FOUNDATION_LOG_OUTPUT = "stderr"
 
@@ -32,6 +34,8 @@ DEFAULT_RATE_LIMIT_EMIT_WARNINGS = True
 DEFAULT_RATE_LIMIT_GLOBAL = 5.0
 DEFAULT_RATE_LIMIT_GLOBAL_CAPACITY = 1000
 DEFAULT_RATE_LIMIT_OVERFLOW_POLICY = "drop_oldest"
+DEFAULT_RATE_LIMIT_STRATEGY = "locked"
+DEFAULT_RATE_LIMIT_SHARDS = 0  # 0 = one shard per CPU
 
 # =================================
 # Sanitization Defaults
@@ -40,6 +44,15 @@ DEFAULT_SANITIZATION_ENABLED = True
 DEFAULT_SANITIZATION_MASK_PATTERNS = True
 DEFAULT_SANITIZATION_SANITIZE_DICTS = True
 
+# =================================
+# Async Sink Defaults
+# =================================
+DEFAULT_ASYNC_SINK_ENABLED = False
+DEFAULT_ASYNC_SINK_BUFFER_SIZE = 10000
+DEFAULT_ASYNC_SINK_BATCH_SIZE = 256
+DEFAULT_ASYNC_SINK_FLUSH_INTERVAL = 0.1
+DEFAULT_ASYNC_SINK_OVERFLOW_POLICY = "drop_oldest"
+
 # =================================
 # Logger System Defaults
 # =================================
@@ -71,11 +84,18 @@ def default_logging_config() -> LoggingConfig:
 
 
 __all__ = [
+    "DEFAULT_ASYNC_SINK_BATCH_SIZE",
+    "DEFAULT_ASYNC_SINK_BUFFER_SIZE",
+    "DEFAULT_ASYNC_SINK_ENABLED",
+    "DEFAULT_ASYNC_SINK_FLUSH_INTERVAL",
+    "DEFAULT_ASYNC_SINK_OVERFLOW_POLICY",
+    "DEFAULT_COMPILED_PROCESSORS",
     "DEFAULT_CONSOLE_FORMATTER",
     "DEFAULT_DAS_EMOJI_ENABLED",
     "DEFAULT_FALLBACK_LOG_LEVEL",
     "DEFAULT_FALLBACK_LOG_LEVEL_NUMERIC",
     "DEFAULT_FOUNDATION_LOG_OUTPUT",
+    "DEFAULT_JSON_BACKEND",
     "DEFAULT_FOUNDATION_SETUP_LOG_LEVEL",
     "DEFAULT_LOGGER_NAME_EMOJI_ENABLED",
     "DEFAULT_LOG_LEVEL",
@@ -85,6 +105,8 @@ __all__ = [
     "DEFAULT_RATE_LIMIT_GLOBAL",
     "DEFAULT_RATE_LIMIT_GLOBAL_CAPACITY",
     "DEFAULT_RATE_LIMIT_OVERFLOW_POLICY",
+    "DEFAULT_RATE_LIMIT_SHARDS",
+    "DEFAULT_RATE_LIMIT_STRATEGY",
     "DEFAULT_SANITIZATION_ENABLED",
     "DEFAULT_SANITIZATION_MASK_PATTERNS",
     "DEFAULT_SANITIZATION_SANITIZE_DICTS",
@@ -90,6 +90,86 @@ def is_valid_level(level: str) -> bool:
     return normalized in VALID_LEVEL_NAMES
 
 
+class EffectiveLevelTable:
+    """Precomputed effective level thresholds keyed by logger name.
+
+    Resolves the threshold for a logger name once (longest matching module
+    prefix, falling back to the default level) and memoizes the result so
+    repeated lookups for the same name are a single dict access.
+
+    Args:
+        default_level: Default level applied when no module prefix matches
+        module_levels: Per-module level overrides keyed by logger name prefix
+        level_to_numeric_map: Mapping of level names to numeric values
+
+    Examples:
+        >>> table = EffectiveLevelTable("INFO", {"noisy": "WARNING"})
+        >>> table.threshold_for("noisy.child")
+        30
+        >>> table.is_enabled_for("app", 10)
+        False
+    """
+
+    __slots__ = (
+        "_cache",
+        "default_numeric_level",
+        "module_numeric_levels",
+        "sorted_module_paths",
+    )
+
+    _CACHE_SIZE_LIMIT: int = 4096
+
+    def __init__(
+        self,
+        default_level: str,
+        module_levels: dict[str, LogLevelStr] | None = None,
+        level_to_numeric_map: dict[LogLevelStr, int] | None = None,
+    ) -> None:
+        numeric_map = level_to_numeric_map if level_to_numeric_map is not None else LEVEL_TO_NUMERIC
+        self.default_numeric_level: int = numeric_map[cast(LogLevelStr, default_level)]
+        self.module_numeric_levels: dict[str, int] = {
+            module: numeric_map[level_str] for module, level_str in (module_levels or {}).items()
+        }
+        self.sorted_module_paths: list[str] = sorted(self.module_numeric_levels.keys(), key=len, reverse=True)
+        self._cache: dict[str, int] = {}
+
+    def threshold_for(self, logger_name: str) -> int:
+        """Get the numeric threshold that applies to a logger name.
+
+        Args:
+            logger_name: Logger name to resolve
+
+        Returns:
+            Numeric level below which events for this logger are dropped
+        """
+        try:
+            return self._cache[logger_name]
+        except KeyError:
+            pass
+
+        threshold = self.default_numeric_level
+        for path_prefix in self.sorted_module_paths:
+            if logger_name.startswith(path_prefix):
+                threshold = self.module_numeric_levels[path_prefix]
+                break
+
+        if len(self._cache) < self._CACHE_SIZE_LIMIT:
+            self._cache[logger_name] = threshold
+        return threshold
+
+    def is_enabled_for(self, logger_name: str, level: int) -> bool:
+        """Check whether an event at a numeric level would pass for a logger name.
+
+        Args:
+            logger_name: Logger name to resolve
+            level: Numeric level of the event
+
+        Returns:
+            True if the event meets the effective threshold
+        """
+        return level >= self.threshold_for(logger_name)
+
+
 def get_fallback_level() -> str:
     """Get the default fallback level name.
 
@@ -109,6 +189,7 @@ def get_fallback_numeric() -> int:
 
 
 __all__ = [
+    "EffectiveLevelTable",
     "get_fallback_level",
     "get_fallback_numeric",
     "get_numeric_level",
@@ -0,0 +1,125 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+"""Lazily formatted log messages.
+
+FoundationLogger passes %-style calls through the processor chain as a
+LazyMessage, so events dropped by level filtering or rate limiting never
+pay for formatting their arguments. Processors that rewrite the message
+(emoji prefixes, secret masking) stack their change on the message instead
+of rendering it, and render_lazy_message turns it into a plain string just
+before the formatter runs.
+"""
+
+
+class LazyMessage:
+    """Message template and arguments rendered on first use.
+
+    Behaves like the rendered string for comparison, hashing, ``in`` and
+    string methods, so code that inspects the event still works; any of
+    those forces rendering.
+
+    Args:
+        template: Message template (anything; ``str()`` is applied)
+        args: Arguments for ``%`` formatting
+        steps: Rewrites applied to the formatted text, in order
+
+    """
+
+    __slots__ = ("_rendered", "args", "steps", "template")
+
+    def __init__(
+        self,
+        template: Any,
+        args: tuple[Any, ...],
+        steps: tuple[Callable[[str], str], ...] = (),
+    ) -> None:
+        self.template = template
+        self.args = args
+        self.steps = steps
+        self._rendered: str | None = None
+
+    def with_step(self, step: Callable[[str], str]) -> LazyMessage:
+        """Get a copy with a rewrite of the rendered text appended."""
+        return LazyMessage(self.template, self.args, (*self.steps, step))
+
+    def with_prefix(self, prefix: str) -> LazyMessage:
+        """Get a copy rendered as ``f"{prefix} {message}"``."""
+        return self.with_step(lambda text: f"{prefix} {text}")
+
+    def render(self) -> str:
+        """Format the message once and cache the result."""
+        rendered = self._rendered
+        if rendered is None:
+            try:
+                rendered = str(self.template) % self.args
+            except (TypeError, ValueError):
+                rendered = f"{self.template} {self.args}"
+            for step in self.steps:
+                rendered = step(rendered)
+            self._rendered = rendered
+        return rendered
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return repr(self.render())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyMessage):
+            return self.render() == other.render()
+        if isinstance(other, str):
+            return self.render() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.render())
+
+    def __len__(self) -> int:
+        return len(self.render())
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.render()
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate str methods (startswith, lower, ...) to the rendered text
+        return getattr(self.render(), name)
+
+
+def prefix_message(prefix: str, message: Any) -> Any:
+    """Prefix an event message, keeping lazy messages lazy."""
+    if isinstance(message, LazyMessage):
+        return message.with_prefix(prefix)
+    return f"{prefix} {message}"
+
+
+def render_lazy_message(
+    _logger: Any,
+    _method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    """Render a lazy event message into a plain string for the formatter."""
+    event = event_dict.get("event")
+    if isinstance(event, LazyMessage):
+        event_dict["event"] = event.render()
+    return event_dict
+
+
+__all__ = [
+    "LazyMessage",
+    "prefix_message",
+    "render_lazy_message",
+]
+
+# 🧱🏗️🔚
@@ -11,6 +11,7 @@ with any OTLP-compatible backend (OpenObserve, Datadog, Honeycomb, etc.).
 Key Components:
 - OTLPLogClient: Generic client for sending logs via OTLP
 - OTLPCircuitBreaker: Reliability pattern for handling endpoint failures
+- OTLPLogBatcher: Bounded background batch queue for log records
 - Helper functions for resource creation, trace context, severity mapping
 
 Example:
@@ -26,6 +27,7 @@ Example:
 
 from __future__ import annotations
 
+from provide.foundation.logger.otlp.batch import OTLPLogBatcher
 from provide.foundation.logger.otlp.circuit import (
     OTLPCircuitBreaker,
     get_otlp_circuit_breaker,
@@ -37,6 +39,7 @@ from provide.foundation.logger.otlp.helpers import (
     build_otlp_endpoint,
     build_otlp_headers,
     extract_trace_context,
+    normalize_attribute_value,
     normalize_attributes,
 )
 from provide.foundation.logger.otlp.resource import (
@@ -50,6 +53,7 @@ from provide.foundation.logger.otlp.severity import (
 
 __all__ = [
     "OTLPCircuitBreaker",
+    "OTLPLogBatcher",
     "OTLPLogClient",
     "add_trace_context_to_attributes",
     "build_otlp_endpoint",
@@ -60,6 +64,7 @@ __all__ = [
     "get_otlp_circuit_breaker",
     "map_level_to_severity",
     "map_severity_to_level",
+    "normalize_attribute_value",
     "normalize_attributes",
     "reset_otlp_circuit_breaker",
 ]
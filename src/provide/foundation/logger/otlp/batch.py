@@ -0,0 +1,192 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Bounded batch queue for OTLP log records.
+
+The OTLP processor hands prepared record fields to an OTLPLogBatcher instead
+of building and emitting a LogRecord on the logging thread. A background
+thread emits them in batches once ``batch_size`` records are queued or
+``flush_interval`` seconds have passed. When the queue is full the oldest
+records are dropped, and batches are dropped rather than emitted while the
+OTLP circuit breaker is open."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import threading
+import time
+from typing import Any
+
+from provide.foundation.logger.otlp.circuit import OTLPCircuitBreaker, get_otlp_circuit_breaker
+
+
+class OTLPLogBatcher:
+    """Queue OTLP log records and emit them from a background thread.
+
+    Args:
+        emit_batch: Called with a list of queued items from the worker thread
+        max_queue_size: Maximum queued items; the oldest are dropped beyond this
+        batch_size: Queued items that wake the worker before the interval
+        flush_interval: Seconds between emits while traffic is light
+        circuit_breaker: Breaker consulted before each batch (None for the
+            shared OTLP breaker)
+
+    Examples:
+        >>> emitted = []
+        >>> batcher = OTLPLogBatcher(emitted.extend)
+        >>> batcher.submit(("record",))
+        >>> batcher.flush()
+        True
+        >>> emitted
+        [('record',)]
+    """
+
+    def __init__(
+        self,
+        emit_batch: Callable[[list[Any]], None],
+        *,
+        max_queue_size: int = 4096,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        circuit_breaker: OTLPCircuitBreaker | None = None,
+    ) -> None:
+        self.emit_batch = emit_batch
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.circuit_breaker = circuit_breaker or get_otlp_circuit_breaker()
+
+        self._queue: deque[Any] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closing = False
+        self._closed = False
+
+        self.emitted = 0
+        self.dropped_overflow = 0
+        self.dropped_circuit_open = 0
+        self.emit_errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="foundation-otlp-logs", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for the next batch, dropping the oldest if full."""
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                self._queue.popleft()
+                self.dropped_overflow += 1
+            self._queue.append(item)
+            if len(self._queue) >= self.batch_size:
+                self._not_empty.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._queue) < self.batch_size and not (self._closing or self._flush_requested):
+                    self._not_empty.wait(self.flush_interval)
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_flight = len(batch)
+                if not batch:
+                    self._flush_requested = False
+                    self._idle.notify_all()
+                    if self._closing:
+                        return
+                    continue
+
+            self._emit(batch)
+
+            with self._lock:
+                self._in_flight = 0
+                if not self._queue:
+                    self._flush_requested = False
+                    self._idle.notify_all()
+
+    def _emit(self, batch: list[Any]) -> None:
+        breaker = self.circuit_breaker
+        if not breaker.can_attempt():
+            with self._lock:
+                self.dropped_circuit_open += len(batch)
+            return
+
+        try:
+            self.emit_batch(batch)
+        except Exception as e:
+            breaker.record_failure(e)
+            with self._lock:
+                self.emit_errors += 1
+            return
+
+        if breaker.state != "closed":
+            breaker.record_success()
+        with self._lock:
+            self.emitted += len(batch)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every queued item has been handed to ``emit_batch``.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the queue was fully emitted
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._queue or self._in_flight:
+                if self._closed:
+                    break
+                self._flush_requested = True
+                self._not_empty.notify()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Emit everything queued and stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closing = True
+            self._not_empty.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            self._idle.notify_all()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batcher counters.
+
+        Returns:
+            Dictionary with queue depth, emitted and dropped record counts
+
+        """
+        with self._lock:
+            return {
+                "queued": len(self._queue),
+                "emitted": self.emitted,
+                "dropped_overflow": self.dropped_overflow,
+                "dropped_circuit_open": self.dropped_circuit_open,
+                "emit_errors": self.emit_errors,
+            }
+
+
+__all__ = [
+    "OTLPLogBatcher",
+]
+
+# 🧱🏗️🔚
@@ -13,6 +13,7 @@ Provides utility functions for working with OTLP/OpenTelemetry including:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import json
 from typing import Any
 
@@ -144,6 +145,56 @@ def build_otlp_headers(
     return headers
 
 
+def _keep_value(value: Any) -> Any:
+    return value
+
+
+def _empty_value(_value: Any) -> str:
+    return ""
+
+
+def _json_value(value: Any) -> str:
+    try:
+        return json.dumps(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+# Converter per value type, filled on first sight of each type so later
+# values of that type skip the isinstance chain.
+_ATTRIBUTE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: _keep_value,
+    int: _keep_value,
+    float: _keep_value,
+    bool: _keep_value,
+    type(None): _empty_value,
+    dict: _json_value,
+    list: _json_value,
+}
+_MAX_ATTRIBUTE_CONVERTERS = 1024
+
+
+def _attribute_converter(value_type: type) -> Callable[[Any], Any]:
+    """Get (and cache) the converter for attribute values of a type."""
+    if issubclass(value_type, (str, int, float, bool)):
+        converter: Callable[[Any], Any] = _keep_value
+    elif issubclass(value_type, (dict, list)):
+        converter = _json_value
+    else:
+        converter = str
+    if len(_ATTRIBUTE_CONVERTERS) < _MAX_ATTRIBUTE_CONVERTERS:
+        _ATTRIBUTE_CONVERTERS[value_type] = converter
+    return converter
+
+
+def normalize_attribute_value(value: Any) -> Any:
+    """Normalize a single attribute value for OTLP (see normalize_attributes)."""
+    converter = _ATTRIBUTE_CONVERTERS.get(type(value))
+    if converter is None:
+        converter = _attribute_converter(type(value))
+    return converter(value)
+
+
 def normalize_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
     """Normalize attribute values for OTLP compatibility.
 
@@ -171,20 +222,14 @@ def normalize_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
         >>> normalize_attributes({"nested": {"a": 1}})
         {'nested': '{"a": 1}'}
     """
+    converters = _ATTRIBUTE_CONVERTERS
     normalized: dict[str, Any] = {}
 
     for key, value in attributes.items():
-        if value is None:
-            normalized[key] = ""
-        elif isinstance(value, (str, int, float, bool)):
-            normalized[key] = value
-        elif isinstance(value, (dict, list)):
-            try:
-                normalized[key] = json.dumps(value)
-            except (TypeError, ValueError):
-                normalized[key] = str(value)
-        else:
-            normalized[key] = str(value)
+        converter = converters.get(type(value))
+        if converter is None:
+            converter = _attribute_converter(type(value))
+        normalized[key] = converter(value)
 
     return normalized
 
@@ -194,6 +239,7 @@ __all__ = [
     "build_otlp_endpoint",
     "build_otlp_headers",
     "extract_trace_context",
+    "normalize_attribute_value",
     "normalize_attributes",
 ]
 
@@ -0,0 +1,140 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+#
+# compiled.py
+#
+import datetime
+from typing import Any, cast
+
+import structlog
+
+from provide.foundation.logger.constants import DEFAULT_FALLBACK_NUMERIC, LEVEL_TO_NUMERIC
+from provide.foundation.logger.custom_processors import StructlogProcessor
+from provide.foundation.logger.levels import EffectiveLevelTable, get_numeric_level
+
+"""Compiled processors for the Foundation logging pipeline.
+
+The default pipeline is a list of small processors, each doing one dict
+operation. In compiled mode the steps that are fully determined by the
+configuration (level normalization, early level filtering, timestamping,
+service name injection, context stripping) are fused into a single
+processor whose source is generated once per configuration, so disabled
+steps cost nothing per event rather than a call and a branch.
+"""
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+_METHOD_LEVEL_ALIASES: dict[str, str] = {
+    "exception": "error",
+    "warn": "warning",
+    "msg": "info",
+}
+_LOWER_LEVEL_TO_NUMERIC: dict[str, int] = {name.lower(): num for name, num in LEVEL_TO_NUMERIC.items()}
+_SENTINEL = object()
+
+
+def _numeric_level(level: Any) -> int:
+    """Resolve an event level to its numeric value, matching _LevelFilter."""
+    num = _LOWER_LEVEL_TO_NUMERIC.get(level)
+    if num is None:
+        num = get_numeric_level(str(level), fallback=DEFAULT_FALLBACK_NUMERIC)
+    return num
+
+
+def _generate_head_source(*, filter_levels: bool, add_timestamp: bool, add_service_name: bool) -> str:
+    lines = [
+        "def compiled_head_processor(_logger, method_name, event_dict):",
+        "    level_hint = event_dict.pop('_foundation_level_hint', None)",
+        "    if level_hint is not None:",
+        "        level = event_dict['level'] = level_hint.lower()",
+        "    elif 'level' in event_dict:",
+        "        level = event_dict['level']",
+        "    else:",
+        "        level = event_dict['level'] = _aliases.get(method_name) or method_name.lower()",
+    ]
+    if filter_levels:
+        lines += [
+            "    if _numeric_level(level) < _threshold_for(event_dict.get('logger_name', 'unnamed_filter_target')):",
+            "        raise _DropEvent",
+        ]
+    if add_timestamp:
+        # The format has no timezone directives, so the astimezone() call
+        # TimeStamper performs for local time is unnecessary.
+        lines.append("    event_dict['timestamp'] = _now().strftime(_timestamp_format)")
+    if add_service_name:
+        lines.append("    event_dict['service_name'] = _service_name")
+    lines.append("    return event_dict")
+    return "\n".join(lines) + "\n"
+
+
+def compile_head_processor(
+    *,
+    omit_timestamp: bool,
+    service_name: str | None,
+    level_table: EffectiveLevelTable | None,
+) -> StructlogProcessor:
+    """Generate the fused processor that runs at the start of the chain.
+
+    Replaces ``add_log_level_custom``, ``TimeStamper`` (plus the timestamp
+    pop when ``omit_timestamp`` is set) and the service name processor.
+    When a level table is given, level filtering happens here too, before
+    any enrichment work is done for events that will be dropped.
+
+    Args:
+        omit_timestamp: Skip timestamping entirely
+        service_name: Service name to inject, or None
+        level_table: Level thresholds for early filtering, or None to leave
+            filtering to the regular level filter
+
+    Returns:
+        The compiled processor
+
+    """
+    source = _generate_head_source(
+        filter_levels=level_table is not None,
+        add_timestamp=not omit_timestamp,
+        add_service_name=service_name is not None,
+    )
+    namespace: dict[str, Any] = {
+        "_aliases": _METHOD_LEVEL_ALIASES,
+        "_numeric_level": _numeric_level,
+        "_threshold_for": level_table.threshold_for if level_table is not None else None,
+        "_DropEvent": structlog.DropEvent,
+        "_now": datetime.datetime.now,
+        "_timestamp_format": TIMESTAMP_FORMAT,
+        "_service_name": service_name,
+    }
+    exec(compile(source, "<foundation compiled head processor>", "exec"), namespace)  # noqa: S102
+    processor = namespace["compiled_head_processor"]
+    processor.__foundation_source__ = source
+    return cast("StructlogProcessor", processor)
+
+
+def compiled_tail_processor(
+    _logger: Any,
+    method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    """Fused ``set_exc_info`` and Foundation context stripping.
+
+    The level hint was already consumed by the head processor, so only the
+    bound logger name needs removing before rendering.
+    """
+    if method_name == "exception" and event_dict.get("exc_info", _SENTINEL) is _SENTINEL:
+        event_dict["exc_info"] = True
+    event_dict.pop("logger_name", None)
+    return event_dict
+
+
+__all__ = [
+    "compile_head_processor",
+    "compiled_tail_processor",
+]
+
+# 🧱🏗️🔚
@@ -0,0 +1,157 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import datetime
+from enum import Enum
+import json
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+import attrs
+import structlog
+
+"""JSON log rendering with pluggable encoding backends.
+
+orjson and msgspec are used when installed; otherwise a preconfigured
+stdlib encoder is reused for every event instead of building one per call
+as ``json.dumps`` does with non-default arguments.
+"""
+
+JSON_BACKEND_AUTO = "auto"
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_MSGSPEC = "msgspec"
+JSON_BACKEND_STDLIB = "stdlib"
+
+JSON_BACKENDS = (JSON_BACKEND_AUTO, JSON_BACKEND_ORJSON, JSON_BACKEND_MSGSPEC, JSON_BACKEND_STDLIB)
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the encoders do not handle natively.
+
+    Unknown types fall back to ``repr()``, as structlog's JSONRenderer does.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (PurePath, UUID)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if attrs.has(type(obj)):
+        return attrs.asdict(obj, recurse=False)
+    return repr(obj)
+
+
+def is_json_backend_available(backend: str) -> bool:
+    """Check whether a JSON backend can be used in this environment."""
+    if backend == JSON_BACKEND_ORJSON:
+        return _HAS_ORJSON
+    if backend == JSON_BACKEND_MSGSPEC:
+        return _HAS_MSGSPEC
+    return backend in (JSON_BACKEND_AUTO, JSON_BACKEND_STDLIB)
+
+
+def resolve_json_backend(backend: str = JSON_BACKEND_AUTO) -> str:
+    """Resolve a requested backend to one that is installed.
+
+    ``auto`` prefers orjson, then msgspec, then the stdlib encoder. An
+    explicitly requested backend that is not installed falls back to stdlib.
+    """
+    if backend == JSON_BACKEND_AUTO:
+        if _HAS_ORJSON:
+            return JSON_BACKEND_ORJSON
+        if _HAS_MSGSPEC:
+            return JSON_BACKEND_MSGSPEC
+        return JSON_BACKEND_STDLIB
+    if is_json_backend_available(backend):
+        return backend
+    return JSON_BACKEND_STDLIB
+
+
+class FoundationJSONRenderer(structlog.processors.JSONRenderer):
+    """JSONRenderer that encodes with the fastest available backend.
+
+    Events a fast backend rejects (non-string keys msgspec cannot encode,
+    integers beyond 64 bits) are re-encoded with the stdlib encoder, so
+    rendering never fails where ``json.dumps`` would succeed.
+
+    Args:
+        backend: One of ``JSON_BACKENDS``
+
+    """
+
+    def __init__(self, backend: str = JSON_BACKEND_AUTO) -> None:
+        super().__init__()
+        self.backend = resolve_json_backend(backend)
+        self._stdlib_encoder = json.JSONEncoder(ensure_ascii=False, default=_json_default)
+        self._encode_bytes: Callable[[Any], bytes] | None = None
+
+        if self.backend == JSON_BACKEND_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS
+
+            def encode_orjson(event_dict: Any) -> bytes:
+                return orjson.dumps(event_dict, default=_json_default, option=option)
+
+            self._encode_bytes = encode_orjson
+        elif self.backend == JSON_BACKEND_MSGSPEC:
+            self._encode_bytes = msgspec.json.Encoder(enc_hook=_json_default).encode
+
+    def encode(self, event_dict: structlog.types.EventDict) -> bytes:
+        """Render an event as UTF-8 JSON bytes for bytes-capable sinks."""
+        if self._encode_bytes is not None:
+            try:
+                return self._encode_bytes(event_dict)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return self._stdlib_encoder.encode(event_dict).encode("utf-8")
+
+    def __call__(
+        self,
+        _logger: Any,
+        _method_name: str,
+        event_dict: structlog.types.EventDict,
+    ) -> str:
+        if self._encode_bytes is not None:
+            try:
+                return self._encode_bytes(event_dict).decode("utf-8")
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return self._stdlib_encoder.encode(event_dict)
+
+
+__all__ = [
+    "JSON_BACKENDS",
+    "JSON_BACKEND_AUTO",
+    "JSON_BACKEND_MSGSPEC",
+    "JSON_BACKEND_ORJSON",
+    "JSON_BACKEND_STDLIB",
+    "FoundationJSONRenderer",
+    "is_json_backend_available",
+    "resolve_json_backend",
+]
+
+# 🧱🏗️🔚
@@ -21,8 +21,9 @@ from provide.foundation.logger.custom_processors import (
     add_logger_name_emoji_prefix,
     filter_by_level_custom,
 )
+from provide.foundation.logger.levels import EffectiveLevelTable
+from provide.foundation.logger.message import render_lazy_message
 from provide.foundation.logger.processors.trace import inject_trace_context
-from provide.foundation.serialization import json_dumps
 
 """Structlog processors for Foundation Telemetry."""
 
@@ -128,8 +129,64 @@ def reset_event_enrichment_state() -> None:
     _event_enrichment_initialized = False
 
 
+def _config_create_sanitization_processors(
+    logging_config: LoggingConfig,
+) -> list[StructlogProcessor]:
+    if not logging_config.sanitization_enabled:
+        return []
+
+    from provide.foundation.logger.processors.sanitization import (
+        create_sanitization_processor,
+    )
+
+    sanitization_processor = create_sanitization_processor(
+        enabled=logging_config.sanitization_enabled,
+        mask_patterns=logging_config.sanitization_mask_patterns,
+        sanitize_dicts=logging_config.sanitization_sanitize_dicts,
+    )
+    return [cast("StructlogProcessor", sanitization_processor)]
+
+
+def _config_create_otlp_processors(config: TelemetryConfig) -> list[StructlogProcessor]:
+    if not config.otlp_endpoint:
+        return []
+
+    from provide.foundation.logger.processors.otlp import create_otlp_processor
+
+    otlp_processor = create_otlp_processor(config)
+    if otlp_processor is None:
+        return []
+    return [cast("StructlogProcessor", otlp_processor)]
+
+
+def _config_create_rate_limit_processors(
+    logging_config: LoggingConfig,
+) -> list[StructlogProcessor]:
+    if not logging_config.rate_limit_enabled:
+        return []
+
+    from provide.foundation.logger.ratelimit import create_rate_limiter_processor
+
+    rate_limiter_processor = create_rate_limiter_processor(
+        global_rate=logging_config.rate_limit_global,
+        global_capacity=logging_config.rate_limit_global_capacity,
+        per_logger_rates=logging_config.rate_limit_per_logger,
+        emit_warnings=logging_config.rate_limit_emit_warnings,
+        summary_interval=logging_config.rate_limit_summary_interval,
+        max_queue_size=logging_config.rate_limit_max_queue_size,
+        max_memory_mb=logging_config.rate_limit_max_memory_mb,
+        overflow_policy=logging_config.rate_limit_overflow_policy,
+        strategy=logging_config.rate_limit_strategy,
+        shards=logging_config.rate_limit_shards or None,
+    )
+    return [cast("StructlogProcessor", rate_limiter_processor)]
+
+
 def _build_core_processors_list(config: TelemetryConfig) -> list[StructlogProcessor]:
     log_cfg = config.logging
+    if log_cfg.compiled_processors:
+        return _build_compiled_core_processors_list(config)
+
     processors: list[StructlogProcessor] = [
         structlog.contextvars.merge_contextvars,
         cast("StructlogProcessor", add_log_level_custom),
@@ -145,29 +202,14 @@ def _build_core_processors_list(config: TelemetryConfig) -> list[StructlogProces
         processors.append(cast("StructlogProcessor", inject_trace_context))
 
     # Add sanitization processor early to sanitize all logged data
-    if log_cfg.sanitization_enabled:
-        from provide.foundation.logger.processors.sanitization import (
-            create_sanitization_processor,
-        )
-
-        sanitization_processor = create_sanitization_processor(
-            enabled=log_cfg.sanitization_enabled,
-            mask_patterns=log_cfg.sanitization_mask_patterns,
-            sanitize_dicts=log_cfg.sanitization_sanitize_dicts,
-        )
-        processors.append(cast("StructlogProcessor", sanitization_processor))
+    processors.extend(_config_create_sanitization_processors(log_cfg))
 
     # Add event enrichment (emojis) BEFORE OTLP so enriched logs are exported
     processors.extend(_config_create_event_enrichment_processors(log_cfg))
 
     # Add OTLP processor AFTER enrichment but BEFORE level filtering
     # This ensures emoji-enriched logs are sent to OpenTelemetry/OpenObserve for ALL log levels
-    if config.otlp_endpoint:
-        from provide.foundation.logger.processors.otlp import create_otlp_processor
-
-        otlp_processor = create_otlp_processor(config)
-        if otlp_processor is not None:
-            processors.append(cast("StructlogProcessor", otlp_processor))
+    processors.extend(_config_create_otlp_processors(config))
 
     # Add level filter for console output (this doesn't affect OTLP which already processed logs)
     processors.append(
@@ -203,33 +245,92 @@ def _build_core_processors_list(config: TelemetryConfig) -> list[StructlogProces
     processors.append(cast("StructlogProcessor", strip_foundation_context))
 
     # Add rate limiting processor if enabled
-    if log_cfg.rate_limit_enabled:
-        from provide.foundation.logger.ratelimit import create_rate_limiter_processor
-
-        rate_limiter_processor = create_rate_limiter_processor(
-            global_rate=log_cfg.rate_limit_global,
-            global_capacity=log_cfg.rate_limit_global_capacity,
-            per_logger_rates=log_cfg.rate_limit_per_logger,
-            emit_warnings=log_cfg.rate_limit_emit_warnings,
-            summary_interval=log_cfg.rate_limit_summary_interval,
-            max_queue_size=log_cfg.rate_limit_max_queue_size,
-            max_memory_mb=log_cfg.rate_limit_max_memory_mb,
-            overflow_policy=log_cfg.rate_limit_overflow_policy,
+    processors.extend(_config_create_rate_limit_processors(log_cfg))
+
+    return processors
+
+
+def _build_compiled_core_processors_list(config: TelemetryConfig) -> list[StructlogProcessor]:
+    """Build the core chain with config-determined steps fused into compiled processors.
+
+    Produces the same events as the default chain. Without an OTLP processor
+    (which must see every level), level filtering moves into the head
+    processor so dropped events skip timestamping, sanitization and enrichment.
+    """
+    from provide.foundation.logger.processors.compiled import (
+        compile_head_processor,
+        compiled_tail_processor,
+    )
+
+    log_cfg = config.logging
+    otlp_processors = _config_create_otlp_processors(config)
+    level_table = EffectiveLevelTable(log_cfg.default_level, log_cfg.module_levels, LEVEL_TO_NUMERIC)
+
+    processors: list[StructlogProcessor] = [
+        structlog.contextvars.merge_contextvars,
+        compile_head_processor(
+            omit_timestamp=log_cfg.omit_timestamp,
+            service_name=config.service_name,
+            level_table=None if otlp_processors else level_table,
+        ),
+    ]
+
+    if config.tracing_enabled and not config.globally_disabled:
+        processors.append(cast("StructlogProcessor", inject_trace_context))
+
+    processors.extend(_config_create_sanitization_processors(log_cfg))
+    processors.extend(_config_create_event_enrichment_processors(log_cfg))
+
+    if otlp_processors:
+        processors.extend(otlp_processors)
+        processors.append(
+            cast(
+                "StructlogProcessor",
+                filter_by_level_custom(
+                    default_level_str=log_cfg.default_level,
+                    module_levels=log_cfg.module_levels,
+                    level_to_numeric_map=LEVEL_TO_NUMERIC,
+                ),
+            )
         )
-        processors.append(cast("StructlogProcessor", rate_limiter_processor))
+
+    processors.extend(
+        [
+            structlog.processors.StackInfoRenderer(),
+            cast("StructlogProcessor", compiled_tail_processor),
+        ]
+    )
+    processors.extend(_config_create_rate_limit_processors(log_cfg))
 
     return processors
 
 
-def _config_create_json_formatter_processors() -> list[StructlogProcessor]:
+def _config_create_json_formatter_processors(json_backend: str = "auto") -> list[StructlogProcessor]:
+    from provide.foundation.logger.processors.json_renderer import (
+        FoundationJSONRenderer,
+        is_json_backend_available,
+    )
+
+    if not is_json_backend_available(json_backend):
+        from provide.foundation.logger.setup.coordinator import (
+            create_foundation_internal_logger,
+        )
+
+        setup_logger = create_foundation_internal_logger()
+        setup_logger.warning(
+            f"JSON backend '{json_backend}' is not installed, using 'stdlib'",
+        )
+
     return [
+        cast("StructlogProcessor", render_lazy_message),
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(serializer=json_dumps, sort_keys=False),
+        FoundationJSONRenderer(backend=json_backend),
     ]
 
 
 def _config_create_keyvalue_formatter_processors(
     output_stream: TextIO,
+    strip_logger_name: bool = True,
 ) -> list[StructlogProcessor]:
     def pop_logger_name_processor(
         _logger: object,
@@ -240,9 +341,13 @@ def _config_create_keyvalue_formatter_processors(
         return event_dict
 
     is_tty = hasattr(output_stream, "isatty") and output_stream.isatty()
+    renderer = structlog.dev.ConsoleRenderer(colors=is_tty, exception_formatter=structlog.dev.plain_traceback)
+    if not strip_logger_name:
+        return [cast("StructlogProcessor", render_lazy_message), renderer]
     return [
+        cast("StructlogProcessor", render_lazy_message),
         cast("StructlogProcessor", pop_logger_name_processor),
-        structlog.dev.ConsoleRenderer(colors=is_tty, exception_formatter=structlog.dev.plain_traceback),
+        renderer,
     ]
 
 
@@ -252,9 +357,13 @@ def _build_formatter_processors_list(
 ) -> list[StructlogProcessor]:
     match logging_config.console_formatter:
         case "json":
-            return _config_create_json_formatter_processors()
+            return _config_create_json_formatter_processors(logging_config.json_backend)
         case "key_value":
-            return _config_create_keyvalue_formatter_processors(output_stream)
+            # The compiled core chain already stripped logger_name
+            return _config_create_keyvalue_formatter_processors(
+                output_stream,
+                strip_logger_name=not logging_config.compiled_processors,
+            )
         case _:
             # Unknown formatter, warn and default to key_value
             # Use setup coordinator logger
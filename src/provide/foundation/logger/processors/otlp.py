@@ -9,15 +9,24 @@ This processor uses the generic OTLPLogClient to send logs to any OTLP-compatibl
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import contextlib
+import time
 from typing import Any
 
 from provide.foundation.logger.otlp.client import OTLPLogClient
+from provide.foundation.logger.otlp.helpers import normalize_attribute_value
 from provide.foundation.logger.otlp.severity import map_level_to_severity
 
 # Global logger provider instance
 _OTLP_LOGGER_PROVIDER: Any | None = None
 
+# Background batcher used when log batching is enabled
+_OTLP_LOG_BATCHER: Any | None = None
+
+# Event keys that are sent as the record body/timestamp rather than attributes
+_NON_ATTRIBUTE_KEYS = frozenset({"event", "timestamp"})
+
 
 def _convert_timestamp_to_nanos(timestamp: Any) -> int | None:
     """Convert timestamp to nanoseconds for OTLP.
@@ -45,9 +54,26 @@ def _convert_timestamp_to_nanos(timestamp: Any) -> int | None:
     return None
 
 
+def _shutdown_log_batcher() -> None:
+    """Emit anything queued in the log batcher and stop it."""
+    global _OTLP_LOG_BATCHER
+    batcher = _OTLP_LOG_BATCHER
+    if batcher is not None:
+        _OTLP_LOG_BATCHER = None
+        with contextlib.suppress(Exception):
+            batcher.shutdown()
+
+
 def create_otlp_processor(config: Any) -> Any | None:
     """Create an OTLP processor for structlog that sends logs to OpenTelemetry.
 
+    Severity objects and the OpenTelemetry record class are resolved once
+    here rather than per event. The record timestamp is taken from
+    ``time.time_ns()`` instead of parsing the string TimeStamper wrote a few
+    processors earlier in the same call. With ``otlp_log_batch_enabled`` the
+    processor only queues the prepared fields; an OTLPLogBatcher builds and
+    emits the records from a background thread.
+
     Args:
         config: TelemetryConfig with OTLP settings
 
@@ -66,7 +92,7 @@ def create_otlp_processor(config: Any) -> Any | None:
         return None
 
     try:
-        global _OTLP_LOGGER_PROVIDER
+        global _OTLP_LOGGER_PROVIDER, _OTLP_LOG_BATCHER
 
         # Create logger provider if not already created
         if _OTLP_LOGGER_PROVIDER is None:
@@ -83,6 +109,53 @@ def create_otlp_processor(config: Any) -> Any | None:
         # Get the OTLP logger
         otlp_logger = _OTLP_LOGGER_PROVIDER.get_logger(__name__)
 
+        from opentelemetry._logs import LogRecord, SeverityNumber
+
+        # level -> (severity_text, SeverityNumber), filled on first use
+        severities: dict[str, tuple[str, Any]] = {}
+
+        def resolve_severity(level: str) -> tuple[str, Any]:
+            severity = severities.get(level)
+            if severity is None:
+                severity_text = level.upper()
+                severity = (severity_text, SeverityNumber(map_level_to_severity(level)))
+                severities[level] = severity
+            return severity
+
+        def build_record(fields: tuple[int, int, str, Any, str, dict[str, Any]]) -> Any:
+            timestamp, observed_timestamp, severity_text, severity_number, message, attributes = fields
+            return LogRecord(
+                timestamp=timestamp,
+                observed_timestamp=observed_timestamp,
+                severity_text=severity_text,
+                severity_number=severity_number,
+                body=message,
+                attributes=attributes,
+            )
+
+        def emit_now(fields: tuple[int, int, str, Any, str, dict[str, Any]]) -> None:
+            otlp_logger.emit(build_record(fields))
+
+        submit: Callable[[Any], None] = emit_now
+
+        # A processor from a previous configuration may still own a batcher
+        _shutdown_log_batcher()
+        # Only a real True enables batching (config may be a Mock in tests)
+        if getattr(config, "otlp_log_batch_enabled", False) is True:
+            from provide.foundation.logger.otlp.batch import OTLPLogBatcher
+
+            def emit_batch(batch: list[Any]) -> None:
+                for fields in batch:
+                    otlp_logger.emit(build_record(fields))
+
+            _OTLP_LOG_BATCHER = OTLPLogBatcher(
+                emit_batch,
+                max_queue_size=config.otlp_log_queue_size,
+                batch_size=config.otlp_log_batch_size,
+                flush_interval=config.otlp_log_flush_interval,
+            )
+            submit = _OTLP_LOG_BATCHER.submit
+
         def otlp_processor(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
             """Structlog processor that sends logs to OTLP.
 
@@ -102,38 +175,33 @@ def create_otlp_processor(config: Any) -> Any | None:
                 return event_dict
 
             try:
+                now_ns = time.time_ns()
+
                 # Extract message and attributes
                 message: str = str(event_dict.get("event", ""))
                 level: str = str(event_dict.get("level", "info")).lower()
+                severity_text, severity_number = resolve_severity(level)
 
-                # Build attributes (everything except 'event' and 'timestamp')
+                # Build normalized attributes (everything except 'event' and 'timestamp')
                 attributes: dict[str, Any] = {
-                    k: v for k, v in event_dict.items() if k not in ("event", "timestamp")
+                    k: normalize_attribute_value(v)
+                    for k, v in event_dict.items()
+                    if k not in _NON_ATTRIBUTE_KEYS
                 }
 
                 # Add message and level attributes
                 attributes["message"] = message
-                attributes["level"] = level.upper()
-
-                # Convert timestamp to nanoseconds
-                timestamp = _convert_timestamp_to_nanos(event_dict.get("timestamp"))
+                attributes["level"] = severity_text
 
-                # Map level to severity
-                severity_number_int = map_level_to_severity(level)
-                severity_text: str = level.upper()
+                # TimeStamper output is formatted from the current time, so the
+                # clock is read directly; numeric timestamps are still honored.
+                raw_timestamp = event_dict.get("timestamp")
+                if isinstance(raw_timestamp, (int, float)) and not isinstance(raw_timestamp, bool):
+                    timestamp = _convert_timestamp_to_nanos(raw_timestamp) or now_ns
+                else:
+                    timestamp = now_ns
 
-                # Emit to OTLP using public API
-                from opentelemetry._logs import LogRecord, SeverityNumber
-
-                log_record = LogRecord(
-                    timestamp=timestamp,
-                    observed_timestamp=timestamp,
-                    severity_text=severity_text,
-                    severity_number=SeverityNumber(severity_number_int),
-                    body=message,
-                    attributes=attributes,
-                )
-                otlp_logger.emit(log_record)
+                submit((timestamp, now_ns, severity_text, severity_number, message, attributes))
 
             except Exception:
                 # Silently ignore OTLP errors to not break logging
@@ -157,6 +225,10 @@ def flush_otlp_logs() -> None:
         >>> # Ensures all pending logs are sent
     """
     global _OTLP_LOGGER_PROVIDER
+    batcher = _OTLP_LOG_BATCHER
+    if batcher is not None:
+        with contextlib.suppress(Exception):
+            batcher.flush()
     if _OTLP_LOGGER_PROVIDER is not None:
         with contextlib.suppress(Exception):
             _OTLP_LOGGER_PROVIDER.force_flush(timeout_millis=5000)
@@ -178,6 +250,7 @@ def reset_otlp_provider() -> None:
         >>> # Forces recreation on next use
     """
     global _OTLP_LOGGER_PROVIDER
+    _shutdown_log_batcher()
     if _OTLP_LOGGER_PROVIDER is not None:
         # Flush any pending logs before resetting
         flush_otlp_logs()
@@ -10,7 +10,8 @@ from typing import Any
 
 import structlog
 
-from provide.foundation.security import mask_secrets, sanitize_dict
+from provide.foundation.logger.message import LazyMessage
+from provide.foundation.security import mask_secrets, redact_sensitive_keys
 
 """Security sanitization processor for logger.
 
@@ -19,6 +20,14 @@ security utilities.
 """
 
 
+def _passthrough_processor(
+    _logger: Any,
+    _method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    return event_dict
+
+
 def create_sanitization_processor(
     enabled: bool = True,
     mask_patterns: bool = True,
@@ -52,26 +61,40 @@ def create_sanitization_processor(
         _method_name: str,
         event_dict: structlog.types.EventDict,
     ) -> structlog.types.EventDict:
-        """Apply sanitization to event dictionary."""
-        if not enabled:
+        """Apply sanitization to event dictionary.
+
+        Values are checked in a single pass. The event dict is only copied
+        when a value actually changes, so the original is never modified.
+        """
+        changes: dict[str, Any] | None = None
+        for key, value in event_dict.items():
+            if isinstance(value, str):
+                if not mask_patterns:
+                    continue
+                new_value: Any = mask_secrets(value)
+            elif isinstance(value, LazyMessage):
+                if not mask_patterns:
+                    continue
+                # Mask when (if ever) the message is rendered
+                new_value = value.with_step(mask_secrets)
+            elif isinstance(value, (dict, list)):
+                if not sanitize_dicts:
+                    continue
+                # Sanitize dictionary values (headers, config, etc.)
+                new_value = redact_sensitive_keys(value)
+            else:
+                continue
+            if new_value is not value:
+                if changes is None:
+                    changes = {}
+                changes[key] = new_value
+
+        if changes is None:
             return event_dict
+        return {**event_dict, **changes}
 
-        # Create a new dict to avoid modifying the original
-        sanitized = event_dict.copy()
-
-        # Sanitize dictionary values (headers, config, etc.)
-        if sanitize_dicts:
-            for key, value in list(sanitized.items()):
-                if isinstance(value, dict):
-                    sanitized[key] = sanitize_dict(value)
-
-        # Mask secrets in string values
-        if mask_patterns:
-            for key, value in list(sanitized.items()):
-                if isinstance(value, str):
-                    sanitized[key] = mask_secrets(value)
-
-        return sanitized
+    if not enabled or not (mask_patterns or sanitize_dicts):
+        return _passthrough_processor
 
     return sanitization_processor
 
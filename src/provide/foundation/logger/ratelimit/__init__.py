@@ -12,6 +12,7 @@ from __future__ import annotations
 from provide.foundation.logger.ratelimit.limiters import (
     AsyncRateLimiter,
     GlobalRateLimiter,
+    ShardedRateLimiter,
     SyncRateLimiter,
 )
 from provide.foundation.logger.ratelimit.processor import (
@@ -33,6 +34,7 @@ __all__ = [
     "GlobalRateLimiter",
     "QueuedRateLimiter",
     "RateLimiterProcessor",
+    "ShardedRateLimiter",
     "SyncRateLimiter",
     "create_rate_limiter_processor",
 ]
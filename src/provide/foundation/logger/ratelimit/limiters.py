@@ -10,12 +10,21 @@ from __future__ import annotations
 # limiters.py
 #
 import asyncio
+import itertools
+import os
 import threading
 import time
 from typing import Any
 
 """Rate limiter implementations for Foundation's logging system."""
 
+RATE_LIMIT_STRATEGY_LOCKED = "locked"
+RATE_LIMIT_STRATEGY_SHARDED = "sharded"
+RATE_LIMIT_STRATEGIES = (RATE_LIMIT_STRATEGY_LOCKED, RATE_LIMIT_STRATEGY_SHARDED)
+
+# Upper bound on automatically chosen shard counts
+_MAX_AUTO_SHARDS = 16
+
 
 class SyncRateLimiter:
     """Synchronous token bucket rate limiter for controlling log output rates.
@@ -85,6 +94,173 @@ class SyncRateLimiter:
             }
 
 
+class _TokenShard:
+    """One bucket of a ShardedRateLimiter holding a share of its capacity."""
+
+    __slots__ = (
+        "calls_since_refill",
+        "capacity",
+        "last_denied_time",
+        "last_refill",
+        "lock",
+        "refill_rate",
+        "tokens",
+        "total_allowed",
+        "total_denied",
+    )
+
+    def __init__(self, capacity: float, refill_rate: float, now: float) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = now
+        self.calls_since_refill = 0
+        self.lock = threading.Lock()
+        self.total_allowed = 0
+        self.total_denied = 0
+        self.last_denied_time: float | None = None
+
+    def refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)."""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.last_refill = now
+        self.calls_since_refill = 0
+
+    def try_take(self) -> bool:
+        """Refill from the clock and take a token if one is available (lock held)."""
+        self.refill(time.monotonic())
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.total_allowed += 1
+            return True
+        return False
+
+
+class ShardedRateLimiter:
+    """Token bucket rate limiter split into per-thread shards.
+
+    Capacity and refill rate are divided evenly between the shards, and each
+    thread is pinned to one shard, so concurrent loggers take different locks
+    instead of all contending on one. A shard only reads the clock when it
+    runs dry or every ``clock_tick`` calls, and borrows a token from the other
+    shards before denying, so the combined limit still holds when only a few
+    threads are logging. Statistics are kept per shard and reconciled into
+    totals by ``get_stats()``.
+
+    Refills are coarser than SyncRateLimiter's: tokens accrued while a shard
+    is not reading the clock are capped at the shard's capacity, so the
+    limiter can only admit less than the configured rate, never more.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        shards: int | None = None,
+        clock_tick: int = 32,
+    ) -> None:
+        """Initialize the sharded rate limiter.
+
+        Args:
+            capacity: Maximum number of tokens (burst capacity) across all shards
+            refill_rate: Tokens refilled per second across all shards
+            shards: Number of shards; defaults to the CPU count (at most 16)
+            clock_tick: Calls a shard serves between clock reads while it has tokens
+
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if refill_rate <= 0:
+            raise ValueError("Refill rate must be positive")
+        if shards is not None and shards <= 0:
+            raise ValueError("Shard count must be positive")
+        if clock_tick <= 0:
+            raise ValueError("Clock tick must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.clock_tick = clock_tick
+
+        if shards is None:
+            shards = min(os.cpu_count() or 1, _MAX_AUTO_SHARDS)
+        # Every shard must be able to hold at least one token
+        shard_count = max(1, min(shards, int(self.capacity)))
+
+        now = time.monotonic()
+        self.shards = tuple(
+            _TokenShard(self.capacity / shard_count, self.refill_rate / shard_count, now)
+            for _ in range(shard_count)
+        )
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+
+    def _shard_index(self) -> int:
+        """Get the shard pinned to the calling thread, assigning one round-robin."""
+        try:
+            return self._local.index  # type: ignore[no-any-return]
+        except AttributeError:
+            index = next(self._next_shard) % len(self.shards)
+            self._local.index = index
+            return index
+
+    def is_allowed(self) -> bool:
+        """Check if a log message is allowed based on available tokens.
+
+        Returns:
+            True if the log should be allowed, False if rate limited
+
+        """
+        index = self._shard_index()
+        shard = self.shards[index]
+        with shard.lock:
+            shard.calls_since_refill += 1
+            if shard.tokens < 1.0 or shard.calls_since_refill >= self.clock_tick:
+                shard.refill(time.monotonic())
+            if shard.tokens >= 1.0:
+                shard.tokens -= 1.0
+                shard.total_allowed += 1
+                return True
+
+        # Slow path: borrow from the other shards before denying
+        for offset in range(1, len(self.shards)):
+            other = self.shards[(index + offset) % len(self.shards)]
+            with other.lock:
+                if other.try_take():
+                    return True
+
+        with shard.lock:
+            shard.total_denied += 1
+            shard.last_denied_time = time.monotonic()
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics reconciled across shards."""
+        tokens = 0.0
+        total_allowed = 0
+        total_denied = 0
+        last_denied_time: float | None = None
+        for shard in self.shards:
+            with shard.lock:
+                tokens += shard.tokens
+                total_allowed += shard.total_allowed
+                total_denied += shard.total_denied
+                if shard.last_denied_time is not None and (
+                    last_denied_time is None or shard.last_denied_time > last_denied_time
+                ):
+                    last_denied_time = shard.last_denied_time
+        return {
+            "tokens_available": tokens,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+            "total_allowed": total_allowed,
+            "total_denied": total_denied,
+            "last_denied_time": last_denied_time,
+            "shards": len(self.shards),
+        }
+
+
 class AsyncRateLimiter:
     """Asynchronous token bucket rate limiter.
     Uses asyncio.Lock for thread safety in async contexts.
@@ -176,7 +352,7 @@ class GlobalRateLimiter:
 
         self._initialized = True
         self.global_limiter: Any = None
-        self.logger_limiters: dict[str, SyncRateLimiter] = {}
+        self.logger_limiters: dict[str, SyncRateLimiter | ShardedRateLimiter] = {}
         self.lock = threading.Lock()
 
         # Default configuration (can be overridden)
@@ -190,6 +366,16 @@ class GlobalRateLimiter:
         self.max_memory_mb: float | None = None
         self.overflow_policy = "drop_oldest"
 
+        # Token bucket strategy
+        self.strategy = RATE_LIMIT_STRATEGY_LOCKED
+        self.shards: int | None = None
+
+    def _create_limiter(self, capacity: float, rate: float) -> SyncRateLimiter | ShardedRateLimiter:
+        """Create a token bucket for the configured strategy."""
+        if self.strategy == RATE_LIMIT_STRATEGY_SHARDED:
+            return ShardedRateLimiter(capacity, rate, shards=self.shards)
+        return SyncRateLimiter(capacity, rate)
+
     def configure(
         self,
         global_rate: float | None = None,
@@ -199,6 +385,8 @@ class GlobalRateLimiter:
         max_queue_size: int = 1000,
         max_memory_mb: float | None = None,
         overflow_policy: str = "drop_oldest",
+        strategy: str = RATE_LIMIT_STRATEGY_LOCKED,
+        shards: int | None = None,
     ) -> None:
         """Configure the global rate limiter.
 
@@ -210,9 +398,20 @@ class GlobalRateLimiter:
             max_queue_size: Maximum queue size for buffered limiter
             max_memory_mb: Maximum memory for buffered limiter
             overflow_policy: What to do when queue is full
+            strategy: Token bucket strategy, ``locked`` or ``sharded``; the
+                sharded buckets do not keep dropped-item samples, so they take
+                precedence over ``use_buffered``
+            shards: Shard count for the sharded strategy (None for automatic)
 
         """
+        if strategy not in RATE_LIMIT_STRATEGIES:
+            raise ValueError(f"Invalid rate limit strategy: {strategy}")
+
         with self.lock:
+            self.strategy = strategy
+            self.shards = shards
+            if strategy == RATE_LIMIT_STRATEGY_SHARDED:
+                use_buffered = False
             self.use_buffered = use_buffered
             self.max_queue_size = max_queue_size
             self.max_memory_mb = max_memory_mb
@@ -234,13 +433,17 @@ class GlobalRateLimiter:
                         track_dropped=True,
                     )
                 else:
-                    self.global_limiter = SyncRateLimiter(global_capacity, global_rate)
+                    self.global_limiter = self._create_limiter(global_capacity, global_rate)
 
             if per_logger_rates:
                 self.per_logger_rates = per_logger_rates
-                # Create rate limiters for configured loggers
+                # Create rate limiters for configured loggers. The dict is
+                # replaced rather than mutated so is_allowed() can read it
+                # without taking the lock.
+                logger_limiters = dict(self.logger_limiters)
                 for logger_name, (rate, capacity) in per_logger_rates.items():
-                    self.logger_limiters[logger_name] = SyncRateLimiter(capacity, rate)
+                    logger_limiters[logger_name] = self._create_limiter(capacity, rate)
+                self.logger_limiters = logger_limiters
 
     def is_allowed(self, logger_name: str, item: Any | None = None) -> tuple[bool, str | None]:
         """Check if a log from a specific logger is allowed.
@@ -253,28 +456,29 @@ class GlobalRateLimiter:
             Tuple of (allowed, reason) where reason is set if denied
 
         """
-        with self.lock:
-            # Check per-logger limit first
-            if logger_name in self.logger_limiters and not self.logger_limiters[logger_name].is_allowed():
-                return False, f"Logger '{logger_name}' rate limit exceeded"
-
-            # Check global limit
-            if self.global_limiter:
-                if self.use_buffered:
-                    # BufferedRateLimiter returns tuple
-                    from provide.foundation.logger.ratelimit.queue_limiter import (
-                        BufferedRateLimiter,
-                    )
-
-                    if isinstance(self.global_limiter, BufferedRateLimiter):
-                        allowed, reason = self.global_limiter.is_allowed(item)
-                        if not allowed:
-                            return False, reason or "Global rate limit exceeded"
-                # SyncRateLimiter returns bool
-                elif not self.global_limiter.is_allowed():
-                    return False, "Global rate limit exceeded"
-
-            return True, None
+        # The limiters synchronize themselves and configure() only swaps in
+        # new ones, so the hot path does not serialize on self.lock.
+        logger_limiter = self.logger_limiters.get(logger_name)
+        if logger_limiter is not None and not logger_limiter.is_allowed():
+            return False, f"Logger '{logger_name}' rate limit exceeded"
+
+        global_limiter = self.global_limiter
+        if global_limiter:
+            if self.use_buffered:
+                # BufferedRateLimiter returns tuple
+                from provide.foundation.logger.ratelimit.queue_limiter import (
+                    BufferedRateLimiter,
+                )
+
+                if isinstance(global_limiter, BufferedRateLimiter):
+                    allowed, reason = global_limiter.is_allowed(item)
+                    if not allowed:
+                        return False, reason or "Global rate limit exceeded"
+            # SyncRateLimiter and ShardedRateLimiter return bool
+            elif not global_limiter.is_allowed():
+                return False, "Global rate limit exceeded"
+
+        return True, None
 
     def get_stats(self) -> dict[str, Any]:
         """Get comprehensive rate limiting statistics."""
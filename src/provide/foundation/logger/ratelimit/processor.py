@@ -165,6 +165,8 @@ def create_rate_limiter_processor(
     max_queue_size: int = 1000,
     max_memory_mb: float | None = None,
     overflow_policy: str = "drop_oldest",
+    strategy: str = "locked",
+    shards: int | None = None,
 ) -> RateLimiterProcessor:
     """Factory function to create and configure a rate limiter processor.
 
@@ -177,6 +179,8 @@ def create_rate_limiter_processor(
         max_queue_size: Maximum queue size when buffering
         max_memory_mb: Maximum memory for buffered logs
         overflow_policy: Policy when queue is full
+        strategy: Token bucket strategy, ``locked`` or ``sharded``
+        shards: Shard count for the sharded strategy (None for automatic)
 
     Returns:
         Configured RateLimiterProcessor instance
@@ -202,6 +206,8 @@ def create_rate_limiter_processor(
         max_queue_size=max_queue_size,
         max_memory_mb=max_memory_mb,
         overflow_policy=overflow_policy,
+        strategy=strategy,
+        shards=shards,
     )
 
     return processor
@@ -14,7 +14,11 @@ import structlog
 from provide.foundation.logger.config import TelemetryConfig
 from provide.foundation.logger.core import (
     _LAZY_SETUP_STATE,
+    build_level_table,
+    clear_bound_logger_cache,
+    invalidate_level_table,
     logger as foundation_logger,
+    set_level_table,
 )
 from provide.foundation.logger.setup.processors import (
     configure_structlog_output,
@@ -22,6 +26,7 @@ from provide.foundation.logger.setup.processors import (
 )
 from provide.foundation.logger.setup.stdlib_wrapper import StructuredStdlibLogger
 from provide.foundation.streams import get_log_stream
+from provide.foundation.streams.async_sink import install_async_sink, uninstall_async_sink
 from provide.foundation.utils.streams import get_safe_stderr
 
 """Main setup coordination for Foundation Telemetry.
@@ -394,6 +399,8 @@ def internal_setup(config: TelemetryConfig | None = None, is_explicit_call: bool
     """
     # This function assumes the lock is already held.
     structlog.reset_defaults()
+    invalidate_level_table()
+    clear_bound_logger_cache()
 
     # Reset OTLP provider to ensure new LoggerProvider with updated config
     # This is critical when service_name changes, as OpenTelemetry's Resource is immutable
@@ -450,6 +457,9 @@ def internal_setup(config: TelemetryConfig | None = None, is_explicit_call: bool
                     otlp_traces_endpoint=current_config.otlp_traces_endpoint,
                 )
 
+    # Drain any async sink from a previous setup before streams are swapped
+    uninstall_async_sink()
+
     if current_config.globally_disabled:
         core_setup_logger.trace("Setting up globally disabled telemetry")
         handle_globally_disabled_setup()
@@ -460,6 +470,15 @@ def internal_setup(config: TelemetryConfig | None = None, is_explicit_call: bool
 
             configure_file_logging(log_file_path=str(current_config.logging.log_file))
 
+        if current_config.logging.async_sink_enabled:
+            core_setup_logger.trace("Installing async log sink")
+            install_async_sink(
+                buffer_size=current_config.logging.async_sink_buffer_size,
+                batch_size=current_config.logging.async_sink_batch_size,
+                flush_interval=current_config.logging.async_sink_flush_interval,
+                overflow_policy=current_config.logging.async_sink_overflow_policy,
+            )
+
         core_setup_logger.trace("Configuring structlog output processors")
         configure_structlog_output(current_config, get_log_stream())
 
@@ -467,6 +486,7 @@ def internal_setup(config: TelemetryConfig | None = None, is_explicit_call: bool
     foundation_logger.__dict__["_is_configured_by_setup"] = is_explicit_call
     foundation_logger.__dict__["_active_config"] = current_config
     _LAZY_SETUP_STATE["done"] = True
+    set_level_table(build_level_table(current_config))
 
     # Configure Python stdlib logging for module-level suppression
     if not current_config.globally_disabled and current_config.logging.module_levels:
@@ -8,16 +8,27 @@ from __future__ import annotations
 
 from typing import Any
 
+from provide.foundation.metrics.exposition import (
+    render_json_snapshot,
+    render_prometheus_text,
+    snapshot_metrics,
+    start_metrics_server,
+)
+from provide.foundation.metrics.registry import MetricsRegistry, get_metrics_registry
 from provide.foundation.metrics.simple import (
+    HISTOGRAM_BACKEND_EXACT,
     SimpleCounter,
     SimpleGauge,
     SimpleHistogram,
 )
+from provide.foundation.metrics.sketch import HistogramSketch
 
 """Foundation Metrics Module.
 
 Provides metrics collection with optional OpenTelemetry integration.
 Falls back to simple metrics when OpenTelemetry is not available.
+Every metric created here is registered with the metrics registry, so it
+can be exported as Prometheus text or a JSON snapshot either way.
 """
 
 try:
@@ -43,9 +54,16 @@ except ImportError:
 # Export the main API
 __all__ = [
     "_HAS_OTEL_METRICS",  # For internal use
+    "HistogramSketch",
+    "MetricsRegistry",
     "counter",
     "gauge",
+    "get_metrics_registry",
     "histogram",
+    "render_json_snapshot",
+    "render_prometheus_text",
+    "snapshot_metrics",
+    "start_metrics_server",
 ]
 
 # Global meter instance (will be set during setup)
@@ -64,15 +82,19 @@ def counter(name: str, description: str = "", unit: str = "") -> SimpleCounter:
         Counter instance
 
     """
+    metric: SimpleCounter | None = None
     if _HAS_OTEL_METRICS and _meter:
         try:
             otel_counter = _meter.create_counter(name=name, description=description, unit=unit)
-            return SimpleCounter(name, otel_counter=otel_counter)
+            metric = SimpleCounter(name, otel_counter=otel_counter)
         except Exception:
             # Broad catch intentional: OTEL metrics are optional, gracefully fall back to simple counter
-            pass
+            metric = None
 
-    return SimpleCounter(name)
+    if metric is None:
+        metric = SimpleCounter(name)
+    get_metrics_registry().register(metric, description, unit)
+    return metric
 
 
 def gauge(name: str, description: str = "", unit: str = "") -> SimpleGauge:
@@ -87,38 +109,53 @@ def gauge(name: str, description: str = "", unit: str = "") -> SimpleGauge:
         Gauge instance
 
     """
+    metric: SimpleGauge | None = None
     if _HAS_OTEL_METRICS and _meter:
         try:
             otel_gauge = _meter.create_up_down_counter(name=name, description=description, unit=unit)
-            return SimpleGauge(name, otel_gauge=otel_gauge)
+            metric = SimpleGauge(name, otel_gauge=otel_gauge)
         except Exception:
             # Broad catch intentional: OTEL metrics are optional, gracefully fall back to simple gauge
-            pass
+            metric = None
 
-    return SimpleGauge(name)
+    if metric is None:
+        metric = SimpleGauge(name)
+    get_metrics_registry().register(metric, description, unit)
+    return metric
 
 
-def histogram(name: str, description: str = "", unit: str = "") -> SimpleHistogram:
+def histogram(
+    name: str,
+    description: str = "",
+    unit: str = "",
+    backend: str = HISTOGRAM_BACKEND_EXACT,
+) -> SimpleHistogram:
     """Create a histogram metric.
 
     Args:
         name: Name of the histogram
         description: Description of what this histogram measures
         unit: Unit of measurement
+        backend: ``exact`` to keep every observation, or ``sketch`` for
+            fixed memory with approximate quantiles
 
     Returns:
         Histogram instance
 
     """
+    metric: SimpleHistogram | None = None
     if _HAS_OTEL_METRICS and _meter:
         try:
             otel_histogram = _meter.create_histogram(name=name, description=description, unit=unit)
-            return SimpleHistogram(name, otel_histogram=otel_histogram)
+            metric = SimpleHistogram(name, otel_histogram=otel_histogram, backend=backend)
         except Exception:
             # Broad catch intentional: OTEL metrics are optional, gracefully fall back to simple histogram
-            pass
+            metric = None
 
-    return SimpleHistogram(name)
+    if metric is None:
+        metric = SimpleHistogram(name, backend=backend)
+    get_metrics_registry().register(metric, description, unit)
+    return metric
 
 
 def _set_meter(meter: object) -> None:
@@ -0,0 +1,317 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import re
+import threading
+import time
+from typing import Any
+
+from provide.foundation.logger import get_logger
+from provide.foundation.metrics.registry import (
+    METRIC_TYPE_COUNTER,
+    METRIC_TYPE_HISTOGRAM,
+    MetricsRegistry,
+    RegisteredMetric,
+    get_metrics_registry,
+)
+
+"""Prometheus text and JSON snapshots of registered metrics.
+
+Exposition reads metric values without locking out writers: each metric is
+rendered from a point-in-time copy of its values, one metric at a time, so
+a scrape never pauses the code being measured. ``start_metrics_server``
+serves the snapshots over HTTP for Prometheus to scrape, without the
+OpenTelemetry SDK.
+"""
+
+log = get_logger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = 9464
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+_INVALID_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _metric_name(name: str) -> str:
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _label_name(name: str) -> str:
+    name = _INVALID_LABEL_CHARS.sub("_", str(name))
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _escape(value: str, *, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_value(value: float | None) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, bool):
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels: dict[str, Any], extra: tuple[str, str] | None = None) -> str:
+    pairs = [f'{_label_name(k)}="{_escape(str(v))}"' for k, v in sorted(labels.items())]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _render_metric(entry: RegisteredMetric, *, openmetrics: bool) -> str:
+    name = _metric_name(entry.name)
+    metric = entry.metric
+    lines: list[str] = []
+
+    if entry.type == METRIC_TYPE_COUNTER:
+        base = name.removesuffix("_total")
+        family = base if openmetrics else f"{base}_total"
+        sample_name = f"{base}_total"
+    else:
+        family = sample_name = name
+
+    if entry.description:
+        lines.append(f"# HELP {family} {_escape(entry.description, quote=False)}")
+
+    if entry.type == METRIC_TYPE_HISTOGRAM:
+        lines.append(f"# TYPE {family} summary")
+        for labels, count, total, quantiles in metric.summaries(SUMMARY_QUANTILES):
+            for q, value in quantiles.items():
+                lines.append(f"{name}{_format_labels(labels, ('quantile', repr(q)))} {_format_value(value)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    else:
+        lines.append(f"# TYPE {family} {entry.type}")
+        for labels, value in metric.samples():
+            lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def iter_prometheus_text(
+    registry: MetricsRegistry | None = None,
+    *,
+    openmetrics: bool = False,
+) -> Iterator[str]:
+    """Render registered metrics in the Prometheus text format, one metric per chunk.
+
+    Counters are exposed with a ``_total`` suffix and histograms as
+    summaries with p50/p95/p99 quantiles, ``_sum`` and ``_count``.
+
+    Args:
+        registry: Registry to render (None for the default registry)
+        openmetrics: Render OpenMetrics 1.0 text (ends with ``# EOF``)
+
+    """
+    for entry in (get_metrics_registry() if registry is None else registry).metrics():
+        try:
+            yield _render_metric(entry, openmetrics=openmetrics)
+        except Exception as e:
+            log.debug(f"📊⚠️ Failed to render metric {entry.name}: {e}")
+    if openmetrics:
+        yield "# EOF\n"
+
+
+def render_prometheus_text(registry: MetricsRegistry | None = None, *, openmetrics: bool = False) -> str:
+    """Render registered metrics in the Prometheus (or OpenMetrics) text format.
+
+    Examples:
+        >>> from provide.foundation.metrics.simple import SimpleCounter
+        >>> registry = MetricsRegistry()
+        >>> registry.register(SimpleCounter("jobs"), "Jobs run")
+        >>> print(render_prometheus_text(registry), end="")
+        # HELP jobs_total Jobs run
+        # TYPE jobs_total counter
+        jobs_total 0
+
+    """
+    return "".join(iter_prometheus_text(registry, openmetrics=openmetrics))
+
+
+def _snapshot_metric(entry: RegisteredMetric) -> dict[str, Any]:
+    metric = entry.metric
+    snapshot: dict[str, Any] = {
+        "name": entry.name,
+        "type": entry.type,
+        "description": entry.description,
+        "unit": entry.unit,
+    }
+    if entry.type == METRIC_TYPE_HISTOGRAM:
+        snapshot["samples"] = [
+            {
+                "labels": {k: str(v) for k, v in labels.items()},
+                "count": count,
+                "sum": total,
+                "quantiles": {repr(q): value for q, value in quantiles.items()},
+            }
+            for labels, count, total, quantiles in metric.summaries(SUMMARY_QUANTILES)
+        ]
+    else:
+        snapshot["samples"] = [
+            {"labels": {k: str(v) for k, v in labels.items()}, "value": value}
+            for labels, value in metric.samples()
+        ]
+    return snapshot
+
+
+def snapshot_metrics(registry: MetricsRegistry | None = None) -> dict[str, Any]:
+    """Get a JSON-serializable snapshot of every registered metric.
+
+    Returns:
+        Dictionary with a ``timestamp`` and a ``metrics`` list of
+        name, type, description, unit and per-label-set samples
+
+    """
+    metrics = []
+    for entry in (get_metrics_registry() if registry is None else registry).metrics():
+        try:
+            metrics.append(_snapshot_metric(entry))
+        except Exception as e:
+            log.debug(f"📊⚠️ Failed to snapshot metric {entry.name}: {e}")
+    return {"timestamp": time.time(), "metrics": metrics}
+
+
+def render_json_snapshot(registry: MetricsRegistry | None = None) -> bytes:
+    """Get ``snapshot_metrics()`` as compact UTF-8 JSON."""
+    return json.dumps(snapshot_metrics(registry), separators=(",", ":"), default=str).encode("utf-8")
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry | None = None
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+            self.end_headers()
+            # Stream metric by metric rather than building the whole body first
+            for chunk in iter_prometheus_text(self.registry, openmetrics=openmetrics):
+                self.wfile.write(chunk.encode("utf-8"))
+        elif path == "/metrics.json":
+            body = render_json_snapshot(self.registry)
+            self.send_response(200)
+            self.send_header("Content-Type", JSON_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.trace(f"📊 Metrics request: {format % args}")
+
+
+class MetricsServer:
+    """Minimal HTTP server exposing ``/metrics`` and ``/metrics.json``.
+
+    Runs on a daemon thread and binds to localhost by default; expose it
+    further only behind something that handles authentication.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 for any free port)
+        registry: Registry to serve (None for the default registry)
+
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_METRICS_HOST,
+        port: int = DEFAULT_METRICS_PORT,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        handler = type("MetricsRequestHandler", (_MetricsRequestHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Get the bound ``(host, port)``."""
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the Prometheus endpoint."""
+        host, port = self.address
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> MetricsServer:
+        """Start serving on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="foundation-metrics-server",
+                daemon=True,
+            )
+            self._thread.start()
+            log.debug(f"📊 Serving metrics on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+def start_metrics_server(
+    port: int = DEFAULT_METRICS_PORT,
+    host: str = DEFAULT_METRICS_HOST,
+    registry: MetricsRegistry | None = None,
+) -> MetricsServer:
+    """Serve registered metrics over HTTP for Prometheus to scrape.
+
+    Args:
+        port: Port to bind (0 for any free port)
+        host: Interface to bind (localhost by default)
+        registry: Registry to serve (None for the default registry)
+
+    Returns:
+        The running server; call ``stop()`` to shut it down
+
+    """
+    return MetricsServer(host, port, registry).start()
+
+
+__all__ = [
+    "DEFAULT_METRICS_HOST",
+    "DEFAULT_METRICS_PORT",
+    "JSON_CONTENT_TYPE",
+    "OPENMETRICS_CONTENT_TYPE",
+    "PROMETHEUS_CONTENT_TYPE",
+    "MetricsServer",
+    "iter_prometheus_text",
+    "render_json_snapshot",
+    "render_prometheus_text",
+    "snapshot_metrics",
+    "start_metrics_server",
+]
+
+# 🧱🏗️🔚
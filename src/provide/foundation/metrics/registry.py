@@ -0,0 +1,117 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from attrs import define
+
+from provide.foundation.metrics.simple import SimpleCounter, SimpleGauge, SimpleHistogram
+
+"""Registry of the metrics created through the metrics API.
+
+``counter()``, ``gauge()`` and ``histogram()`` register every metric they
+create here, so exporters can enumerate them without the OpenTelemetry SDK.
+"""
+
+METRIC_TYPE_COUNTER = "counter"
+METRIC_TYPE_GAUGE = "gauge"
+METRIC_TYPE_HISTOGRAM = "histogram"
+
+
+@define(frozen=True, slots=True)
+class RegisteredMetric:
+    """A registered metric with the metadata it was created with."""
+
+    metric: SimpleCounter | SimpleGauge | SimpleHistogram
+    type: str
+    description: str = ""
+    unit: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.metric.name
+
+
+class MetricsRegistry:
+    """Name-indexed collection of metrics.
+
+    Registering a metric under a name that is already taken replaces the
+    earlier one. Readers get a point-in-time copy of the entries, so
+    exporting never holds the lock while metric values are read.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, RegisteredMetric] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        metric: SimpleCounter | SimpleGauge | SimpleHistogram,
+        description: str = "",
+        unit: str = "",
+    ) -> None:
+        """Register a metric, replacing any metric of the same name."""
+        if isinstance(metric, SimpleCounter):
+            metric_type = METRIC_TYPE_COUNTER
+        elif isinstance(metric, SimpleGauge):
+            metric_type = METRIC_TYPE_GAUGE
+        elif isinstance(metric, SimpleHistogram):
+            metric_type = METRIC_TYPE_HISTOGRAM
+        else:
+            raise TypeError(f"Unsupported metric type: {type(metric).__name__}")
+
+        entry = RegisteredMetric(metric, metric_type, description, unit)
+        with self._lock:
+            self._metrics[metric.name] = entry
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric by name, if registered."""
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def get(self, name: str) -> RegisteredMetric | None:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[RegisteredMetric]:
+        """Get the registered metrics, sorted by name."""
+        with self._lock:
+            entries = list(self._metrics.values())
+        return sorted(entries, key=lambda entry: entry.name)
+
+    def clear(self) -> None:
+        """Remove every registered metric."""
+        with self._lock:
+            self._metrics.clear()
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._metrics
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the registry that the metrics API registers metrics with."""
+    return _registry
+
+
+__all__ = [
+    "METRIC_TYPE_COUNTER",
+    "METRIC_TYPE_GAUGE",
+    "METRIC_TYPE_HISTOGRAM",
+    "MetricsRegistry",
+    "RegisteredMetric",
+    "get_metrics_registry",
+]
+
+# 🧱🏗️🔚
@@ -7,23 +7,157 @@
 from __future__ import annotations
 
 from collections import defaultdict
+import sys
+import threading
 from typing import Any
 
 from provide.foundation.logger import get_logger
+from provide.foundation.metrics.sketch import DEFAULT_RELATIVE_ACCURACY, HistogramSketch
 
 """Simple metrics implementations that work with or without OpenTelemetry."""
 
 log = get_logger(__name__)
 
+# Canonical label keys, interned per label set as passed by callers
+_LABEL_KEYS: dict[tuple[Any, ...], str] = {}
+_MAX_LABEL_KEYS = 4096
+
+
+def _build_label_key(labels: dict[str, Any]) -> str:
+    return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
+def _label_key(labels: dict[str, Any]) -> str:
+    """Get the canonical ``k1=v1,k2=v2`` key for a label set.
+
+    Keys are cached by the labels' items and value types (so ``1`` and
+    ``True`` stay distinct), which skips the sort and string building for
+    label sets that have been seen before.
+    """
+    try:
+        cache_key = (*labels.items(), *map(type, labels.values()))
+        key = _LABEL_KEYS.get(cache_key)
+    except TypeError:
+        # Unhashable label value
+        return _build_label_key(labels)
+    if key is None:
+        key = sys.intern(_build_label_key(labels))
+        if len(_LABEL_KEYS) < _MAX_LABEL_KEYS:
+            _LABEL_KEYS[cache_key] = key
+    return key
+
+
+class _StripedValue:
+    """Accumulator with one cell per writing thread, summed on read.
+
+    Each thread only ever adds to its own cell, so increments need no lock
+    and are never lost. Cells of threads that have exited are folded into
+    a base value on read.
+    """
+
+    __slots__ = ("_base", "_cells", "_local", "_lock")
+
+    def __init__(self) -> None:
+        self._base: float = 0
+        self._cells: list[tuple[threading.Thread, list[float]]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def add(self, amount: float) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell[0] += amount
+
+    def _new_cell(self) -> list[float]:
+        cell: list[float] = [0]
+        with self._lock:
+            self._cells.append((threading.current_thread(), cell))
+        self._local.cell = cell
+        return cell
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            live = []
+            total = self._base
+            for thread, cell in self._cells:
+                if thread.is_alive():
+                    live.append((thread, cell))
+                    total += cell[0]
+                else:
+                    self._base += cell[0]
+                    total += cell[0]
+            self._cells = live
+            return total
+
+
+class BoundCounter:
+    """Counter child bound to one label set.
+
+    Returned by ``SimpleCounter.labels()``; the label key and attributes
+    are computed once, so ``inc`` is a single per-thread cell update.
+    """
+
+    __slots__ = ("_otel_counter", "_value", "attributes", "labels_key")
+
+    def __init__(self, labels_key: str, attributes: dict[str, Any], otel_counter: Any | None) -> None:
+        self.labels_key = labels_key
+        self.attributes = attributes
+        self._otel_counter = otel_counter
+        self._value = _StripedValue()
+
+    def inc(self, value: float = 1) -> None:
+        """Increment the counter for this label set."""
+        self._value.add(value)
+
+        if self._otel_counter:
+            try:
+                self._otel_counter.add(value, attributes=self.attributes)
+            except Exception as e:
+                log.debug(f"📊⚠️ Failed to record OpenTelemetry counter: {e}")
+
+    @property
+    def value(self) -> float:
+        """Get the current value for this label set."""
+        return self._value.value
+
 
 class SimpleCounter:
-    """Counter metric that increments monotonically."""
+    """Counter metric that increments monotonically.
+
+    Safe to increment from many threads. For hot paths, bind the label set
+    once with ``labels()`` and increment the returned child.
+    """
 
     def __init__(self, name: str, otel_counter: Any | None = None) -> None:
         self.name = name
         self._otel_counter = otel_counter
-        self._value: float = 0
-        self._labels_values: dict[str, float] = defaultdict(float)
+        self._unlabeled = _StripedValue()
+        self._children: dict[str, BoundCounter] = {}
+        self._children_lock = threading.Lock()
+
+    def labels(self, **labels: Any) -> BoundCounter:
+        """Get the child counter for a label set.
+
+        Examples:
+            >>> requests = SimpleCounter("requests")
+            >>> ok = requests.labels(route="/users", status="200")
+            >>> ok.inc()
+            >>> requests.value
+            1
+
+        """
+        key = _label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = BoundCounter(key, dict(labels), self._otel_counter)
+                    self._children[key] = child
+        return child
 
     def inc(self, value: float = 1, **labels: Any) -> None:
         """Increment the counter.
@@ -33,12 +167,12 @@ class SimpleCounter:
             **labels: Label key-value pairs
 
         """
-        self._value += value
-
-        # Track per-label values for simple mode
         if labels:
-            labels_key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            self._labels_values[labels_key] += value
+            child = self._children.get(_label_key(labels))
+            (child or self.labels(**labels)).inc(value)
+            return
+
+        self._unlabeled.add(value)
 
         # Use OpenTelemetry counter if available
         if self._otel_counter:
@@ -47,20 +181,102 @@ class SimpleCounter:
             except Exception as e:
                 log.debug(f"📊⚠️ Failed to record OpenTelemetry counter: {e}")
 
+    @property
+    def _labels_values(self) -> dict[str, float]:
+        """Per-label-set values, merged from the child counters."""
+        return {key: child.value for key, child in list(self._children.items())}
+
+    def samples(self) -> list[tuple[dict[str, Any], float]]:
+        """Get ``(labels, value)`` pairs for the unlabeled value and each label set.
+
+        The unlabeled value is left out once label sets exist and it has
+        never been incremented.
+        """
+        children = list(self._children.values())
+        unlabeled = self._unlabeled.value
+        samples = [({}, unlabeled)] if unlabeled or not children else []
+        samples.extend((child.attributes, child.value) for child in children)
+        return samples
+
     @property
     def value(self) -> float:
         """Get the current counter value."""
+        return self._unlabeled.value + sum(child.value for child in list(self._children.values()))
+
+
+class BoundGauge:
+    """Gauge child bound to one label set, returned by ``SimpleGauge.labels()``."""
+
+    __slots__ = ("_gauge", "_value", "attributes", "labels_key")
+
+    def __init__(self, gauge: SimpleGauge, labels_key: str, attributes: dict[str, Any]) -> None:
+        self._gauge = gauge
+        self.labels_key = labels_key
+        self.attributes = attributes
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the gauge value for this label set."""
+        gauge = self._gauge
+        with gauge._lock:
+            delta = value - self._value
+            self._value = value
+            gauge._value = value
+        gauge._record(delta, self.attributes)
+
+    def inc(self, value: float = 1) -> None:
+        """Increment the gauge value for this label set."""
+        gauge = self._gauge
+        with gauge._lock:
+            self._value += value
+            gauge._value += value
+        gauge._record(value, self.attributes)
+
+    def dec(self, value: float = 1) -> None:
+        """Decrement the gauge value for this label set."""
+        self.inc(-value)
+
+    @property
+    def value(self) -> float:
+        """Get the current value for this label set."""
         return self._value
 
 
 class SimpleGauge:
-    """Gauge metric that can go up or down."""
+    """Gauge metric that can go up or down.
+
+    Updates are serialized by a per-gauge lock, since ``set`` cannot be
+    merged from per-thread accumulators. Bind a label set once with
+    ``labels()`` to skip rebuilding its key on every update.
+    """
 
     def __init__(self, name: str, otel_gauge: Any | None = None) -> None:
         self.name = name
         self._otel_gauge = otel_gauge
         self._value: float = 0
-        self._labels_values: dict[str, float] = defaultdict(float)
+        self._unlabeled_value: float = 0
+        self._children: dict[str, BoundGauge] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: Any) -> BoundGauge:
+        """Get the child gauge for a label set."""
+        key = _label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = BoundGauge(self, key, dict(labels))
+                    self._children[key] = child
+        return child
+
+    def _record(self, delta: float, attributes: dict[str, Any]) -> None:
+        # The OpenTelemetry instrument is an up-down counter, so it gets deltas
+        if self._otel_gauge:
+            try:
+                self._otel_gauge.add(delta, attributes=attributes)
+            except Exception as e:
+                log.debug(f"📊⚠️ Failed to record OpenTelemetry gauge: {e}")
 
     def set(self, value: float, **labels: Any) -> None:
         """Set the gauge value.
@@ -70,26 +286,15 @@ class SimpleGauge:
             **labels: Label key-value pairs
 
         """
-        self._value = value
-
-        # Track per-label values for simple mode
         if labels:
-            labels_key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            self._labels_values[labels_key] = value
+            self.labels(**labels).set(value)
+            return
 
-        # Use OpenTelemetry gauge if available
-        if self._otel_gauge:
-            try:
-                self._otel_gauge.add(
-                    value
-                    - self._labels_values.get(
-                        ",".join(f"{k}={v}" for k, v in sorted(labels.items())) if labels else "",
-                        0,
-                    ),
-                    attributes=labels,
-                )
-            except Exception as e:
-                log.debug(f"📊⚠️ Failed to record OpenTelemetry gauge: {e}")
+        with self._lock:
+            delta = value - self._unlabeled_value
+            self._unlabeled_value = value
+            self._value = value
+        self._record(delta, labels)
 
     def inc(self, value: float = 1, **labels: Any) -> None:
         """Increment the gauge value.
@@ -99,17 +304,14 @@ class SimpleGauge:
             **labels: Label key-value pairs
 
         """
-        self._value += value
-
         if labels:
-            labels_key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            self._labels_values[labels_key] += value
+            self.labels(**labels).inc(value)
+            return
 
-        if self._otel_gauge:
-            try:
-                self._otel_gauge.add(value, attributes=labels)
-            except Exception as e:
-                log.debug(f"📊⚠️ Failed to increment OpenTelemetry gauge: {e}")
+        with self._lock:
+            self._unlabeled_value += value
+            self._value += value
+        self._record(value, labels)
 
     def dec(self, value: float = 1, **labels: Any) -> None:
         """Decrement the gauge value.
@@ -121,20 +323,75 @@ class SimpleGauge:
         """
         self.inc(-value, **labels)
 
+    @property
+    def _labels_values(self) -> dict[str, float]:
+        """Per-label-set values of the child gauges."""
+        return {key: child.value for key, child in list(self._children.items())}
+
+    def samples(self) -> list[tuple[dict[str, Any], float]]:
+        """Get ``(labels, value)`` pairs for the unlabeled value and each label set.
+
+        The unlabeled value is left out once label sets exist and it is zero.
+        """
+        children = list(self._children.values())
+        unlabeled = self._unlabeled_value
+        samples = [({}, unlabeled)] if unlabeled or not children else []
+        samples.extend((child.attributes, child.value) for child in children)
+        return samples
+
     @property
     def value(self) -> float:
         """Get the current gauge value."""
         return self._value
 
 
+HISTOGRAM_BACKEND_EXACT = "exact"
+HISTOGRAM_BACKEND_SKETCH = "sketch"
+
+
 class SimpleHistogram:
-    """Histogram metric for recording distributions of values."""
+    """Histogram metric for recording distributions of values.
+
+    Count, sum, min and max are kept as running totals. The ``exact``
+    backend also keeps every observation, which gives exact quantiles but
+    grows without bound; the ``sketch`` backend keeps a HistogramSketch per
+    label set instead, so memory stays fixed and quantiles are within the
+    sketch's relative accuracy.
+
+    Args:
+        name: Metric name
+        otel_histogram: OpenTelemetry histogram to record to as well
+        backend: ``exact`` or ``sketch``
+        relative_accuracy: Quantile accuracy for the sketch backend
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        otel_histogram: Any | None = None,
+        backend: str = HISTOGRAM_BACKEND_EXACT,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        if backend not in (HISTOGRAM_BACKEND_EXACT, HISTOGRAM_BACKEND_SKETCH):
+            raise ValueError(f"Unknown histogram backend: {backend}")
 
-    def __init__(self, name: str, otel_histogram: Any | None = None) -> None:
         self.name = name
+        self.backend = backend
+        self.relative_accuracy = relative_accuracy
         self._otel_histogram = otel_histogram
         self._observations: list[float] = []
         self._labels_observations: dict[str, list[float]] = defaultdict(list)
+        self._sketch: HistogramSketch | None = None
+        self._labels_sketches: dict[str, HistogramSketch] = {}
+        self._labels_attributes: dict[str, dict[str, Any]] = {}
+        if backend == HISTOGRAM_BACKEND_SKETCH:
+            self._sketch = HistogramSketch(relative_accuracy)
+
+        self._count = 0
+        self._sum: float = 0
+        self._min: float | None = None
+        self._max: float | None = None
 
     def observe(self, value: float, **labels: Any) -> None:
         """Record an observation.
@@ -144,12 +401,31 @@ class SimpleHistogram:
             **labels: Label key-value pairs
 
         """
-        self._observations.append(value)
+        self._count += 1
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+        sketch = self._sketch
+        if sketch is not None:
+            sketch.add(value)
+        else:
+            self._observations.append(value)
 
         # Track per-label observations for simple mode
         if labels:
-            labels_key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            self._labels_observations[labels_key].append(value)
+            labels_key = _label_key(labels)
+            if labels_key not in self._labels_attributes:
+                self._labels_attributes[labels_key] = dict(labels)
+            if sketch is not None:
+                label_sketch = self._labels_sketches.get(labels_key)
+                if label_sketch is None:
+                    label_sketch = self._labels_sketches[labels_key] = HistogramSketch(self.relative_accuracy)
+                label_sketch.add(value)
+            else:
+                self._labels_observations[labels_key].append(value)
 
         # Use OpenTelemetry histogram if available
         if self._otel_histogram:
@@ -161,19 +437,112 @@ class SimpleHistogram:
     @property
     def count(self) -> int:
         """Get the number of observations."""
-        return len(self._observations)
+        return self._count
 
     @property
     def sum(self) -> float:
         """Get the sum of all observations."""
-        return sum(self._observations)
+        return self._sum
 
     @property
     def avg(self) -> float:
         """Get the average of all observations."""
-        if not self._observations:
+        if not self._count:
             return 0.0
-        return self.sum / self.count
+        return self._sum / self._count
+
+    @property
+    def min(self) -> float | None:
+        """Get the smallest observation, or None if nothing was observed."""
+        return self._min
+
+    @property
+    def max(self) -> float | None:
+        """Get the largest observation, or None if nothing was observed."""
+        return self._max
+
+    def quantile(self, q: float, **labels: Any) -> float | None:
+        """Get the value at quantile ``q`` (0.0 to 1.0).
+
+        Args:
+            q: Quantile to query, e.g. 0.95
+            **labels: Restrict the query to observations with these labels
+
+        Returns:
+            The value (estimated for the sketch backend), or None if there
+            are no matching observations
+
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        labels_key = _label_key(labels) if labels else ""
+        if self._sketch is not None:
+            sketch = self._labels_sketches.get(labels_key) if labels_key else self._sketch
+            return sketch.quantile(q) if sketch is not None else None
+
+        observations = self._labels_observations.get(labels_key, []) if labels_key else self._observations
+        if not observations:
+            return None
+        ordered = sorted(observations)
+        return ordered[round(q * (len(ordered) - 1))]
+
+    def percentiles(self, **labels: Any) -> dict[str, float | None]:
+        """Get p50, p95 and p99 for all observations or a label set."""
+        return {
+            "p50": self.quantile(0.5, **labels),
+            "p95": self.quantile(0.95, **labels),
+            "p99": self.quantile(0.99, **labels),
+        }
+
+    def summaries(
+        self,
+        quantiles: tuple[float, ...] = (0.5, 0.95, 0.99),
+    ) -> list[tuple[dict[str, Any], int, float, dict[float, float | None]]]:
+        """Get ``(labels, count, sum, {q: value})`` for all observations and each label set.
+
+        Observations are copied before quantiles are computed, so writers
+        are never blocked while a summary is being built.
+        """
+        summaries: list[tuple[dict[str, Any], int, float, dict[float, float | None]]] = []
+        if self._sketch is not None:
+            summaries.append(
+                ({}, self._count, self._sum, {q: self._sketch.quantile(q) for q in quantiles}),
+            )
+            for key, sketch in list(self._labels_sketches.items()):
+                summaries.append(
+                    (
+                        self._labels_attributes.get(key, {}),
+                        sketch.count,
+                        sketch.sum,
+                        {q: sketch.quantile(q) for q in quantiles},
+                    ),
+                )
+            return summaries
+
+        groups = [({}, self._observations)]
+        groups.extend(
+            (self._labels_attributes.get(key, {}), observations)
+            for key, observations in list(self._labels_observations.items())
+        )
+        for attributes, observations in groups:
+            ordered = sorted(observations)
+            values = {q: ordered[round(q * (len(ordered) - 1))] if ordered else None for q in quantiles}
+            summaries.append((attributes, len(ordered), sum(ordered), values))
+        return summaries
+
+    def snapshot(self) -> HistogramSketch:
+        """Get a mergeable sketch of every observation so far.
+
+        Snapshots from several histograms (or processes) can be combined
+        with ``HistogramSketch.merge``.
+        """
+        if self._sketch is not None:
+            return self._sketch.copy()
+        sketch = HistogramSketch(self.relative_accuracy)
+        for value in self._observations:
+            sketch.add(value)
+        return sketch
 
 
 # 🧱🏗️🔚
@@ -0,0 +1,279 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any
+
+"""Fixed-memory quantile sketch for histogram metrics.
+
+HistogramSketch is a DDSketch-style log-bucketed histogram: every value is
+counted in the bucket ``ceil(log(|v|) / log(gamma))``, so quantile answers
+are within ``relative_accuracy`` of the true value while memory is bounded
+by ``max_buckets`` counters per sign, however many values are observed.
+"""
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# Magnitudes below this are counted as zero
+_MIN_INDEXABLE = 1e-9
+
+
+class _BucketStore:
+    """Contiguous ``array``-backed counters for a range of bucket keys.
+
+    When the key range would exceed ``max_buckets``, the lowest buckets are
+    collapsed into the lowest one that is kept, which only costs accuracy at
+    the small-magnitude end of the distribution.
+    """
+
+    __slots__ = ("counts", "max_buckets", "offset")
+
+    def __init__(self, max_buckets: int) -> None:
+        self.max_buckets = max_buckets
+        self.counts = array("Q")
+        self.offset = 0
+
+    def add(self, key: int, count: int = 1) -> None:
+        counts = self.counts
+        if not counts:
+            self.counts = array("Q", [count])
+            self.offset = key
+            return
+
+        index = key - self.offset
+        if 0 <= index < len(counts):
+            counts[index] += count
+            return
+
+        if index >= len(counts):
+            # Grow upwards, collapsing the bottom if the range gets too wide
+            counts.extend([0] * (index + 1 - len(counts)))
+            overflow = len(counts) - self.max_buckets
+            if overflow > 0:
+                collapsed = sum(counts[: overflow + 1])
+                del counts[:overflow]
+                counts[0] = collapsed
+                self.offset += overflow
+            counts[key - self.offset] += count
+            return
+
+        # Grow downwards while there is room; below that, count in the lowest bucket
+        room = self.max_buckets - len(counts)
+        grow = min(-index, room)
+        if grow:
+            self.counts = array("Q", [0] * grow) + counts
+            self.offset -= grow
+        self.counts[max(0, key - self.offset)] += count
+
+    def merge(self, other: _BucketStore) -> None:
+        for index, count in enumerate(other.counts):
+            if count:
+                self.add(other.offset + index, count)
+
+    def copy(self) -> _BucketStore:
+        store = _BucketStore(self.max_buckets)
+        store.counts = array("Q", self.counts)
+        store.offset = self.offset
+        return store
+
+
+class HistogramSketch:
+    """Mergeable quantile sketch with running count, sum, min and max.
+
+    Args:
+        relative_accuracy: Maximum relative error of quantile answers
+        max_buckets: Maximum counters kept for each sign of value
+
+    Examples:
+        >>> sketch = HistogramSketch()
+        >>> for value in range(1, 101):
+        ...     sketch.add(value)
+        >>> sketch.count, sketch.min, sketch.max
+        (100, 1.0, 100.0)
+        >>> abs(sketch.quantile(0.5) - 50) <= 50 * 0.01
+        True
+
+    """
+
+    __slots__ = (
+        "_gamma",
+        "_log_gamma",
+        "_max",
+        "_min",
+        "_negative",
+        "_positive",
+        "_sum",
+        "_zero_count",
+        "count",
+        "max_buckets",
+        "relative_accuracy",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        if max_buckets <= 0:
+            raise ValueError("Max buckets must be positive")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = _BucketStore(max_buckets)
+        self._negative = _BucketStore(max_buckets)
+        self._zero_count = 0
+        self.count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of the bucket in relative terms
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        if value > _MIN_INDEXABLE:
+            self._positive.add(self._key(value))
+        elif value < -_MIN_INDEXABLE:
+            self._negative.add(self._key(-value))
+        else:
+            self._zero_count += 1
+
+        self.count += 1
+        self._sum += value
+        if value < self._min:
+            self._min = float(value)
+        if value > self._max:
+            self._max = float(value)
+
+    @property
+    def sum(self) -> float:
+        """Get the sum of all values."""
+        return self._sum
+
+    @property
+    def avg(self) -> float:
+        """Get the mean of all values (0.0 when empty)."""
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def min(self) -> float | None:
+        """Get the smallest value, or None when empty."""
+        return self._min if self.count else None
+
+    @property
+    def max(self) -> float | None:
+        """Get the largest value, or None when empty."""
+        return self._max if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the value at quantile ``q`` (0.0 to 1.0).
+
+        Returns:
+            The estimated value, or None when the sketch is empty
+
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Negative values, most negative (largest magnitude) first
+        negative = self._negative
+        for index in range(len(negative.counts) - 1, -1, -1):
+            seen += negative.counts[index]
+            if seen > rank:
+                return self._clamp(-self._value(negative.offset + index))
+
+        seen += self._zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+
+        positive = self._positive
+        for index, bucket_count in enumerate(positive.counts):
+            seen += bucket_count
+            if seen > rank:
+                return self._clamp(self._value(positive.offset + index))
+
+        return self._max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self._min), self._max)
+
+    def percentiles(self) -> dict[str, float | None]:
+        """Get the p50, p95 and p99 estimates."""
+        return {
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def merge(self, other: HistogramSketch) -> None:
+        """Add another sketch's values into this one.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies
+
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self._sum += other._sum
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def copy(self) -> HistogramSketch:
+        """Get an independent copy, e.g. as a snapshot to merge elsewhere."""
+        sketch = HistogramSketch(self.relative_accuracy, self.max_buckets)
+        sketch._positive = self._positive.copy()
+        sketch._negative = self._negative.copy()
+        sketch._zero_count = self._zero_count
+        sketch.count = self.count
+        sketch._sum = self._sum
+        sketch._min = self._min
+        sketch._max = self._max
+        return sketch
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the sketch as count, sum, min, max, avg and percentiles."""
+        return {
+            "count": self.count,
+            "sum": self._sum,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.avg,
+            **self.percentiles(),
+        }
+
+
+__all__ = [
+    "DEFAULT_MAX_BUCKETS",
+    "DEFAULT_RELATIVE_ACCURACY",
+    "HistogramSketch",
+]
+
+# 🧱🏗️🔚
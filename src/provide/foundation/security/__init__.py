@@ -8,15 +8,19 @@ from __future__ import annotations
 
 from provide.foundation.security.masking import (
     DEFAULT_SECRET_PATTERNS,
+    DEFAULT_SECRET_TRIGGERS,
     MASKED_VALUE,
+    clear_mask_cache,
     mask_command,
     mask_secrets,
     should_mask,
 )
 from provide.foundation.security.sanitization import (
     DEFAULT_SENSITIVE_HEADERS,
+    DEFAULT_SENSITIVE_KEYS,
     DEFAULT_SENSITIVE_PARAMS,
     REDACTED_VALUE,
+    redact_sensitive_keys,
     sanitize_dict,
     sanitize_headers,
     sanitize_uri,
@@ -27,12 +31,16 @@ from provide.foundation.security.sanitization import (
 
 __all__ = [
     "DEFAULT_SECRET_PATTERNS",
+    "DEFAULT_SECRET_TRIGGERS",
     "DEFAULT_SENSITIVE_HEADERS",
+    "DEFAULT_SENSITIVE_KEYS",
     "DEFAULT_SENSITIVE_PARAMS",
     "MASKED_VALUE",
     "REDACTED_VALUE",
+    "clear_mask_cache",
     "mask_command",
     "mask_secrets",
+    "redact_sensitive_keys",
     "sanitize_dict",
     "sanitize_headers",
     "sanitize_uri",
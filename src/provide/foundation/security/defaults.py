@@ -38,6 +38,9 @@ DEFAULT_SENSITIVE_PARAMS = [
     "credentials",
 ]
 
+# Lowercased header and parameter names, the default key set for dict sanitization
+DEFAULT_SENSITIVE_KEYS = frozenset(key.lower() for key in DEFAULT_SENSITIVE_HEADERS + DEFAULT_SENSITIVE_PARAMS)
+
 # Redaction placeholder
 REDACTED_VALUE = "[REDACTED]"
 
@@ -80,6 +83,7 @@ MASKED_VALUE = "[MASKED]"
 __all__ = [
     "DEFAULT_SECRET_PATTERNS",
     "DEFAULT_SENSITIVE_HEADERS",
+    "DEFAULT_SENSITIVE_KEYS",
     "DEFAULT_SENSITIVE_PARAMS",
     "MASKED_VALUE",
     "REDACTED_VALUE",
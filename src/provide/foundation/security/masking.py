@@ -13,6 +13,74 @@ from provide.foundation.security.defaults import DEFAULT_SECRET_PATTERNS, MASKED
 """Secret masking utilities for command execution and sensitive strings."""
 
 
+# Lowercase substrings at least one of which must occur in any ASCII text matched
+# by DEFAULT_SECRET_PATTERNS. Text containing none of them skips the regexes.
+DEFAULT_SECRET_TRIGGERS = ("pass", "pwd", "token", "key", "secret", "auth", "credential", "-p")
+
+# Masked results for repeated short values, default patterns only
+_MASK_CACHE: dict[tuple[str, str], str] = {}
+_MASK_CACHE_SIZE_LIMIT = 4096
+_MASK_CACHE_MAX_TEXT_LENGTH = 512
+
+_COMPILED_PATTERNS: dict[tuple[str, ...], tuple[re.Pattern[str], ...]] = {}
+_COMBINED_PATTERNS: dict[tuple[str, ...], re.Pattern[str] | None] = {}
+
+
+def _compile_patterns(secret_patterns: list[str] | tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile secret patterns case-insensitively, cached per pattern list."""
+    key = tuple(secret_patterns)
+    compiled = _COMPILED_PATTERNS.get(key)
+    if compiled is None:
+        compiled = tuple(re.compile(pattern, re.IGNORECASE) for pattern in key)
+        _COMPILED_PATTERNS[key] = compiled
+    return compiled
+
+
+def _compile_combined(secret_patterns: list[str] | tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile secret patterns into one case-insensitive alternation.
+
+    The alternation is only used to detect whether any pattern matches.
+    Masking still applies the patterns one after another, because a span
+    consumed by one alternative would hide overlapping matches of later
+    patterns. Returns None when the patterns fail to compile together.
+    """
+    key = tuple(secret_patterns)
+    try:
+        return _COMBINED_PATTERNS[key]
+    except KeyError:
+        pass
+
+    combined: re.Pattern[str] | None
+    try:
+        combined = re.compile("|".join(f"(?:{pattern})" for pattern in key), re.IGNORECASE)
+    except re.error:
+        combined = None
+
+    _COMBINED_PATTERNS[key] = combined
+    return combined
+
+
+def _mask_sequential(text: str, secret_patterns: list[str] | tuple[str, ...], masked: str) -> str:
+    # Each pattern has 2 groups: (prefix)(secret_value)
+    # We keep the prefix and mask the value
+    result = text
+    for pattern in _compile_patterns(secret_patterns):
+        result = pattern.sub(lambda m: f"{m.group(1)}{masked}", result)
+    return result
+
+
+def _has_trigger(text: str) -> bool:
+    """Check the default-pattern prefilter.
+
+    Only ASCII text is prefiltered: IGNORECASE also folds characters such
+    as "ſ" onto ASCII letters, which a lowercase substring check would miss.
+    """
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return any(trigger in lowered for trigger in DEFAULT_SECRET_TRIGGERS)
+
+
 def mask_secrets(
     text: str,
     secret_patterns: list[str] | None = None,
@@ -20,6 +88,11 @@ def mask_secrets(
 ) -> str:
     """Mask secrets in text using regex patterns.
 
+    Patterns are precompiled once and applied in order. With the default
+    patterns, ASCII text containing none of the ``DEFAULT_SECRET_TRIGGERS``
+    substrings is returned without running any regex, and results for
+    short repeated values are cached.
+
     Args:
         text: Text to mask secrets in
         secret_patterns: List of regex patterns to match secrets
@@ -29,21 +102,30 @@ def mask_secrets(
         Text with secrets masked
 
     """
-    if secret_patterns is None:
-        secret_patterns = DEFAULT_SECRET_PATTERNS
+    if secret_patterns is None or secret_patterns is DEFAULT_SECRET_PATTERNS:
+        if not _has_trigger(text):
+            return text
 
-    result = text
-    for pattern in secret_patterns:
-        # Pattern should have 2 groups: (prefix)(secret_value)
-        # We keep the prefix and mask the value
-        result = re.sub(
-            pattern,
-            lambda m: f"{m.group(1)}{masked}",
-            result,
-            flags=re.IGNORECASE,
-        )
+        cacheable = len(text) <= _MASK_CACHE_MAX_TEXT_LENGTH
+        if cacheable:
+            cached = _MASK_CACHE.get((text, masked))
+            if cached is not None:
+                return cached
+
+        result = _mask_sequential(text, DEFAULT_SECRET_PATTERNS, masked)
+        if cacheable and len(_MASK_CACHE) < _MASK_CACHE_SIZE_LIMIT:
+            _MASK_CACHE[(text, masked)] = result
+        return result
+
+    return _mask_sequential(text, secret_patterns, masked)
 
-    return result
+
+def clear_mask_cache() -> None:
+    """Drop cached mask results and compiled custom pattern sets."""
+    _MASK_CACHE.clear()
+    _COMPILED_PATTERNS.clear()
+    _COMBINED_PATTERNS.clear()
+    _COMBINED_PATTERNS[tuple(DEFAULT_SECRET_PATTERNS)] = _DEFAULT_COMBINED
 
 
 def mask_command(
@@ -79,15 +161,25 @@ def should_mask(text: str, secret_patterns: list[str] | None = None) -> bool:
         True if text contains secrets
 
     """
-    if secret_patterns is None:
-        secret_patterns = DEFAULT_SECRET_PATTERNS
+    if secret_patterns is None or secret_patterns is DEFAULT_SECRET_PATTERNS:
+        if not _has_trigger(text):
+            return False
+        return _DEFAULT_COMBINED.search(text) is not None
+
+    combined = _compile_combined(secret_patterns)
+    if combined is None:
+        return any(re.search(pattern, text, flags=re.IGNORECASE) for pattern in secret_patterns)
+    return combined.search(text) is not None
+
 
-    return any(re.search(pattern, text, flags=re.IGNORECASE) for pattern in secret_patterns)
+_DEFAULT_COMBINED: re.Pattern[str] = _compile_combined(DEFAULT_SECRET_PATTERNS)  # type: ignore[assignment]
 
 
 __all__ = [
     "DEFAULT_SECRET_PATTERNS",
+    "DEFAULT_SECRET_TRIGGERS",
     "MASKED_VALUE",
+    "clear_mask_cache",
     "mask_command",
     "mask_secrets",
     "should_mask",
@@ -12,6 +12,7 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from provide.foundation.security.defaults import (
     DEFAULT_SENSITIVE_HEADERS,
+    DEFAULT_SENSITIVE_KEYS,
     DEFAULT_SENSITIVE_PARAMS,
     REDACTED_VALUE,
 )
@@ -119,21 +120,30 @@ def sanitize_dict(
     """
     if sensitive_keys is None:
         # Use combined list of headers and params as defaults
-        sensitive_keys = DEFAULT_SENSITIVE_HEADERS + DEFAULT_SENSITIVE_PARAMS
+        sensitive_lower = DEFAULT_SENSITIVE_KEYS
+    else:
+        # Convert sensitive keys to lowercase for case-insensitive matching
+        sensitive_lower = frozenset(k.lower() for k in sensitive_keys)
 
-    # Convert sensitive keys to lowercase for case-insensitive matching
-    sensitive_lower = {k.lower() for k in sensitive_keys}
+    return _sanitize_dict(data, sensitive_lower, redacted, recursive)
 
+
+def _sanitize_dict(
+    data: dict[str, Any],
+    sensitive_lower: frozenset[str],
+    redacted: str,
+    recursive: bool,
+) -> dict[str, Any]:
     sanitized: dict[str, Any] = {}
     for key, value in data.items():
         if key.lower() in sensitive_lower:
             sanitized[key] = redacted
         elif recursive and isinstance(value, dict):
-            sanitized[key] = sanitize_dict(value, sensitive_keys, redacted, recursive)
+            sanitized[key] = _sanitize_dict(value, sensitive_lower, redacted, recursive)
         elif recursive and isinstance(value, list):
             # Sanitize list elements if they're dicts
             sanitized[key] = [
-                sanitize_dict(item, sensitive_keys, redacted, recursive) if isinstance(item, dict) else item
+                _sanitize_dict(item, sensitive_lower, redacted, recursive) if isinstance(item, dict) else item
                 for item in value
             ]
         else:
@@ -142,6 +152,58 @@ def sanitize_dict(
     return sanitized
 
 
+def redact_sensitive_keys(
+    value: Any,
+    sensitive_keys: frozenset[str] = DEFAULT_SENSITIVE_KEYS,
+    redacted: str = REDACTED_VALUE,
+) -> Any:
+    """Redact sensitive keys in nested dicts, copying only what changes.
+
+    Same rules as ``sanitize_dict`` with ``recursive=True``, but dicts and
+    lists without any sensitive key are returned as-is instead of copied.
+    The input is never modified.
+
+    Args:
+        value: Dict (or list of dicts) to sanitize
+        sensitive_keys: Lowercased keys to redact
+        redacted: Replacement value for redacted values
+
+    Returns:
+        The original object if nothing was redacted, otherwise a sanitized copy
+
+    """
+    if isinstance(value, dict):
+        changes: dict[Any, Any] | None = None
+        for key, item in value.items():
+            if isinstance(key, str) and key.lower() in sensitive_keys:
+                new_item: Any = redacted
+            elif isinstance(item, (dict, list)):
+                new_item = redact_sensitive_keys(item, sensitive_keys, redacted)
+            else:
+                continue
+            if new_item is not item:
+                if changes is None:
+                    changes = {}
+                changes[key] = new_item
+        if changes is None:
+            return value
+        return {**value, **changes}
+
+    if isinstance(value, list):
+        new_items: list[Any] | None = None
+        for index, item in enumerate(value):
+            if not isinstance(item, dict):
+                continue
+            new_item = redact_sensitive_keys(item, sensitive_keys, redacted)
+            if new_item is not item:
+                if new_items is None:
+                    new_items = list(value)
+                new_items[index] = new_item
+        return value if new_items is None else new_items
+
+    return value
+
+
 def should_sanitize_body(content_type: str | None) -> bool:
     """Determine if body should be sanitized based on content type.
 
@@ -170,8 +232,10 @@ def should_sanitize_body(content_type: str | None) -> bool:
 
 __all__ = [
     "DEFAULT_SENSITIVE_HEADERS",
+    "DEFAULT_SENSITIVE_KEYS",
     "DEFAULT_SENSITIVE_PARAMS",
     "REDACTED_VALUE",
+    "redact_sensitive_keys",
     "sanitize_dict",
     "sanitize_headers",
     "sanitize_uri",
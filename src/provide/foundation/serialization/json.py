@@ -44,11 +44,12 @@ def json_dumps(
         '{\\n  "a": 2,\\n  "b": 1\\n}'
 
     """
-    from provide.foundation.errors import ValidationError
-
     try:
         return json.dumps(obj, ensure_ascii=ensure_ascii, indent=indent, sort_keys=sort_keys, default=default)
     except (TypeError, ValueError) as e:
+        # Imported here, only on failure, to avoid a circular import
+        from provide.foundation.errors import ValidationError
+
         raise ValidationError(f"Cannot serialize object to JSON: {e}") from e
 
 
@@ -9,6 +9,13 @@ from __future__ import annotations
 #
 # __init__.py
 #
+from provide.foundation.streams.async_sink import (
+    AsyncLogSink,
+    drain_async_sink,
+    get_async_sink,
+    install_async_sink,
+    uninstall_async_sink,
+)
 from provide.foundation.streams.console import (
     get_console_stream,
     is_tty,
@@ -34,19 +41,25 @@ and core stream operations.
 """
 
 __all__ = [
+    # Async sink
+    "AsyncLogSink",
     "close_log_streams",
     # File stream functions
     "configure_file_logging",
+    "drain_async_sink",
     "ensure_stderr_default",
     "flush_log_streams",
+    "get_async_sink",
     # Console stream functions
     "get_console_stream",
     # Core stream functions
     "get_log_stream",
+    "install_async_sink",
     "is_tty",
     "reset_streams",
     "set_log_stream_for_testing",
     "supports_color",
+    "uninstall_async_sink",
     "write_to_console",
 ]
 
@@ -0,0 +1,337 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+#
+# async_sink.py
+#
+import atexit
+from collections import deque
+import contextlib
+import sys
+import threading
+import time
+from typing import Any, TextIO
+
+"""Asynchronous, batched log sink.
+
+Rendered log lines are queued in a bounded buffer and written to the real
+stream by a background writer thread in batches, so logging threads never
+wait on a slow terminal or disk. The sink is file-like and is installed as
+the Foundation log stream, so structlog's PrintLogger writes into it.
+"""
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+_ACTIVE_SINK: AsyncLogSink | None = None
+_SINK_LOCK = threading.Lock()
+_ATEXIT_REGISTERED = False
+
+
+class AsyncLogSink:
+    """File-like stream that hands complete lines to a background writer.
+
+    PrintLogger writes a message and its trailing newline as separate
+    ``write`` calls and flushes after every line. Partial writes are held
+    until their newline arrives, and ``flush`` is a no-op; use ``drain``
+    to wait until everything queued has reached the target stream.
+
+    Args:
+        target: Stream the writer thread writes to
+        buffer_size: Maximum number of queued lines
+        batch_size: Queued lines that wake the writer before the interval
+        flush_interval: Seconds between writes while traffic is light
+        overflow_policy: What to do when the buffer is full: block,
+            drop_newest or drop_oldest
+
+    """
+
+    def __init__(
+        self,
+        target: TextIO,
+        *,
+        buffer_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+    ) -> None:
+        if overflow_policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
+        self.target = target
+        self.buffer_size = max(1, buffer_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+
+        self._buffer: deque[str] = deque()
+        self._partial = ""
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._drain_requested = False
+        self._closing = False
+        self._closed = False
+
+        self.written_lines = 0
+        self.dropped_newest = 0
+        self.dropped_oldest = 0
+        self.blocked_writes = 0
+        self.write_errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="foundation-log-writer", daemon=True)
+        self._thread.start()
+
+    # File-like interface used by PrintLogger and stream helpers
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            if self._closed:
+                self._write_through(text)
+                return len(text)
+
+            data = self._partial + text if self._partial else text
+            if data.endswith("\n"):
+                self._partial = ""
+            else:
+                split_at = data.rfind("\n") + 1
+                self._partial = data[split_at:]
+                data = data[:split_at]
+                if not data:
+                    return len(text)
+            self._enqueue_locked(data)
+        return len(text)
+
+    def writelines(self, lines: Any) -> None:
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        """No-op; lines are written by the background thread (see ``drain``)."""
+
+    def isatty(self) -> bool:
+        return hasattr(self.target, "isatty") and self.target.isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+    # Buffer management
+
+    def _enqueue_locked(self, line: str) -> None:
+        if len(self._buffer) >= self.buffer_size:
+            if self.overflow_policy == OVERFLOW_DROP_NEWEST:
+                self.dropped_newest += 1
+                return
+            if self.overflow_policy == OVERFLOW_DROP_OLDEST:
+                self._buffer.popleft()
+                self.dropped_oldest += 1
+            else:
+                self.blocked_writes += 1
+                self._not_empty.notify()
+                while len(self._buffer) >= self.buffer_size and not self._closing:
+                    self._not_full.wait()
+                if self._closing:
+                    self._write_through(line)
+                    return
+
+        self._buffer.append(line)
+        if len(self._buffer) >= self.batch_size:
+            self._not_empty.notify()
+
+    def _write_through(self, data: str) -> None:
+        try:
+            self.target.write(data)
+            self.target.flush()
+        except Exception:
+            self.write_errors += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._buffer) < self.batch_size and not (self._closing or self._drain_requested):
+                    self._not_empty.wait(self.flush_interval)
+                batch = list(self._buffer)
+                self._buffer.clear()
+                self._in_flight = len(batch)
+                self._not_full.notify_all()
+                if not batch:
+                    self._drain_requested = False
+                    self._idle.notify_all()
+                    if self._closing:
+                        return
+                    continue
+
+            try:
+                # One write per batch: line-buffered files would otherwise
+                # issue a syscall per line even through writelines().
+                self.target.write("".join(batch))
+                self.target.flush()
+            except Exception:
+                with self._lock:
+                    self.write_errors += 1
+
+            with self._lock:
+                self.written_lines += len(batch)
+                self._in_flight = 0
+                if not self._buffer:
+                    self._drain_requested = False
+                    self._idle.notify_all()
+
+    # Control
+
+    def drain(self, timeout: float | None = 5.0) -> bool:
+        """Block until every queued line has been written to the target.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the buffer was fully drained
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self._closed:
+                return True
+            while self._buffer or self._in_flight:
+                self._drain_requested = True
+                self._not_empty.notify()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        with contextlib.suppress(Exception):
+            self.target.flush()
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Drain the buffer, stop the writer thread and write any partial line."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        with self._lock:
+            leftover = "".join(self._buffer) + self._partial
+            self._buffer.clear()
+            self._partial = ""
+            self._closed = True
+            if leftover:
+                self._write_through(leftover)
+
+    def stats(self) -> dict[str, Any]:
+        """Get sink counters.
+
+        Returns:
+            Dictionary with queue depth, written and dropped line counts
+
+        """
+        with self._lock:
+            return {
+                "queued": len(self._buffer),
+                "written_lines": self.written_lines,
+                "dropped_newest": self.dropped_newest,
+                "dropped_oldest": self.dropped_oldest,
+                "dropped_lines": self.dropped_newest + self.dropped_oldest,
+                "blocked_writes": self.blocked_writes,
+                "write_errors": self.write_errors,
+                "overflow_policy": self.overflow_policy,
+            }
+
+
+def get_async_sink() -> AsyncLogSink | None:
+    """Get the installed async log sink, if any."""
+    return _ACTIVE_SINK
+
+
+def install_async_sink(
+    *,
+    buffer_size: int,
+    batch_size: int,
+    flush_interval: float,
+    overflow_policy: str,
+) -> AsyncLogSink:
+    """Wrap the current log stream in an async sink and route structlog to it.
+
+    Any previously installed sink is drained and closed first.
+
+    Returns:
+        The installed sink
+
+    """
+    global _ACTIVE_SINK, _ATEXIT_REGISTERED
+
+    import provide.foundation.streams.core as core_module
+
+    uninstall_async_sink()
+    with core_module._get_stream_lock(), _SINK_LOCK:
+        sink = AsyncLogSink(
+            core_module._PROVIDE_LOG_STREAM,
+            buffer_size=buffer_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            overflow_policy=overflow_policy,
+        )
+        _ACTIVE_SINK = sink
+        core_module._PROVIDE_LOG_STREAM = sink  # type: ignore[assignment]
+        core_module._reconfigure_structlog_stream()
+        if not _ATEXIT_REGISTERED:
+            atexit.register(uninstall_async_sink)
+            _ATEXIT_REGISTERED = True
+    return sink
+
+
+def drain_async_sink(timeout: float | None = 5.0) -> bool:
+    """Wait for the installed sink (if any) to write everything queued."""
+    sink = _ACTIVE_SINK
+    if sink is None:
+        return True
+    return sink.drain(timeout)
+
+
+def uninstall_async_sink() -> None:
+    """Drain and close the installed sink, restoring its target as the log stream."""
+    global _ACTIVE_SINK
+
+    import provide.foundation.streams.core as core_module
+
+    with _SINK_LOCK:
+        sink = _ACTIVE_SINK
+        if sink is None:
+            return
+        _ACTIVE_SINK = None
+
+    sink.close()
+    with core_module._get_stream_lock():
+        if core_module._PROVIDE_LOG_STREAM is sink:
+            core_module._PROVIDE_LOG_STREAM = sink.target
+            core_module._reconfigure_structlog_stream()
+    if sink.write_errors:
+        with contextlib.suppress(Exception):
+            print(f"Async log sink had {sink.write_errors} write errors", file=sys.stderr)
+
+
+__all__ = [
+    "AsyncLogSink",
+    "drain_async_sink",
+    "get_async_sink",
+    "install_async_sink",
+    "uninstall_async_sink",
+]
+
+# 🧱🏗️🔚
@@ -14,6 +14,7 @@ import io
 from pathlib import Path
 import sys
 
+from provide.foundation.streams.async_sink import drain_async_sink, uninstall_async_sink
 from provide.foundation.streams.core import (
     _get_stream_lock,
     _reconfigure_structlog_stream,
@@ -86,9 +87,16 @@ def configure_file_logging(log_file_path: str | None) -> None:
 
 
 def flush_log_streams() -> None:
-    """Flush all log streams."""
+    """Flush all log streams.
+
+    If an async sink is installed, waits for it to write everything queued
+    before flushing the file handle.
+    """
     import provide.foundation.streams.core as core_module
 
+    if not drain_async_sink():
+        _safe_error_output("Timed out draining async log sink")
+
     with _get_stream_lock():
         if core_module._LOG_FILE_HANDLE:
             try:
@@ -104,6 +112,9 @@ def close_log_streams() -> None:
     # Import here to avoid circular dependency
     from provide.foundation.testmode.detection import is_in_click_testing
 
+    # Drain the sink before closing the file handle it writes to
+    uninstall_async_sink()
+
     with _get_stream_lock():
         if core_module._LOG_FILE_HANDLE:
             with contextlib.suppress(Exception):
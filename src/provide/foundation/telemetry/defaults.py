@@ -18,6 +18,14 @@ DEFAULT_OTLP_PROTOCOL = "http/protobuf"
 DEFAULT_TRACE_SAMPLE_RATE = 1.0
 DEFAULT_ENVIRONMENT = None
 
+# =================================
+# OTLP Log Batching Defaults
+# =================================
+DEFAULT_OTLP_LOG_BATCH_ENABLED = False
+DEFAULT_OTLP_LOG_BATCH_SIZE = 512
+DEFAULT_OTLP_LOG_FLUSH_INTERVAL = 1.0
+DEFAULT_OTLP_LOG_QUEUE_SIZE = 4096
+
 # =================================
 # Factory Functions
 # =================================
@@ -31,6 +39,10 @@ def default_otlp_headers() -> dict[str, str]:
 __all__ = [
     "DEFAULT_ENVIRONMENT",
     "DEFAULT_METRICS_ENABLED",
+    "DEFAULT_OTLP_LOG_BATCH_ENABLED",
+    "DEFAULT_OTLP_LOG_BATCH_SIZE",
+    "DEFAULT_OTLP_LOG_FLUSH_INTERVAL",
+    "DEFAULT_OTLP_LOG_QUEUE_SIZE",
     "DEFAULT_OTLP_PROTOCOL",
     "DEFAULT_TELEMETRY_GLOBALLY_DISABLED",
     "DEFAULT_TRACE_SAMPLE_RATE",
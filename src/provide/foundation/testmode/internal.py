@@ -90,6 +90,15 @@ def reset_structlog_state() -> None:
     # Reset first to clear any cached loggers
     structlog.reset_defaults()
 
+    try:
+        from provide.foundation.logger.core import clear_bound_logger_cache, invalidate_level_table
+
+        invalidate_level_table()
+        clear_bound_logger_cache()
+    except ImportError:
+        # Logger state not available, skip
+        pass
+
     def _strip_foundation_context(
         _logger: object,
         _method_name: str,
@@ -127,9 +136,15 @@ def reset_logger_state() -> None:
     without importing the full logger module to avoid circular dependencies.
     """
     try:
-        from provide.foundation.logger.core import _LAZY_SETUP_STATE
+        from provide.foundation.logger.core import (
+            _LAZY_SETUP_STATE,
+            clear_bound_logger_cache,
+            invalidate_level_table,
+        )
 
         _LAZY_SETUP_STATE.update({"done": False, "error": None, "in_progress": False})
+        invalidate_level_table()
+        clear_bound_logger_cache()
     except ImportError:
         # Logger state not available, skip
         pass
@@ -486,6 +501,21 @@ def reset_configuration_state() -> None:
         pass
 
 
+def reset_metrics_registry() -> None:
+    """Remove every metric from the default metrics registry.
+
+    Metrics created in one test would otherwise still be exported
+    by the next.
+    """
+    try:
+        from provide.foundation.metrics.registry import get_metrics_registry
+
+        get_metrics_registry().clear()
+    except ImportError:
+        # Metrics module not available, skip
+        pass
+
+
 def reset_version_cache() -> None:
     """Reset version cache to defaults.
 
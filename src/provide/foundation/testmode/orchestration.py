@@ -153,6 +153,7 @@ def reset_foundation_state() -> None:
             reset_eventsets_state,
             reset_hub_state,
             reset_logger_state,
+            reset_metrics_registry,
             reset_state_managers,
             reset_streams_state,
             reset_structlog_state,
@@ -228,6 +229,7 @@ def reset_foundation_state() -> None:
         # Reset new state management systems
         reset_state_managers()
         reset_configuration_state()
+        reset_metrics_registry()
 
         # Final reset of logger state (after all operations that might trigger setup)
         reset_logger_state()
@@ -44,6 +44,7 @@ class TestBuildFormatterProcessorsList(FoundationTestCase):
             io.StringIO(),
         )
         assert [get_proc_name(p) for p in processors] == [
+            "render_lazy_message",
             "ExceptionRenderer",
             "JSONRenderer",
         ]
@@ -54,6 +55,7 @@ class TestBuildFormatterProcessorsList(FoundationTestCase):
             io.StringIO(),
         )
         assert [get_proc_name(p) for p in processors] == [
+            "render_lazy_message",
             "pop_logger_name_processor",
             "ConsoleRenderer",
         ]
@@ -8,10 +8,11 @@
 from __future__ import annotations
 
 from provide.testkit import FoundationTestCase
+from provide.testkit.mocking import Mock, patch
 
 from provide.foundation import logger as global_logger
 from provide.foundation.eventsets.registry import discover_event_sets, get_registry
-from provide.foundation.eventsets.resolver import get_resolver
+from provide.foundation.eventsets.resolver import EventSetResolver, get_resolver
 from provide.foundation.eventsets.types import EventMapping, EventSet, FieldMapping
 
 
@@ -105,6 +106,49 @@ class TestEventSetResolver(FoundationTestCase):
         assert enriched.get("llm.success") is True
 
 
+class TestEventSetResolverIndex(FoundationTestCase):
+    """Test the precomputed field lookup index."""
+
+    def _resolver_for(self, *event_sets: EventSet) -> EventSetResolver:
+        registry = Mock()
+        registry.list_event_sets.return_value = sorted(event_sets, key=lambda es: es.priority, reverse=True)
+        resolver = EventSetResolver()
+        with patch("provide.foundation.eventsets.resolver.get_registry", return_value=registry):
+            resolver.resolve()
+        return resolver
+
+    def test_higher_priority_mapping_wins(self) -> None:
+        """Test the first mapping in priority order wins for a shared name."""
+        low = EventSet(name="low", mappings=[EventMapping(name="status", visual_markers={"ok": "L"})])
+        high = EventSet(
+            name="high",
+            mappings=[EventMapping(name="status", visual_markers={"ok": "H"})],
+            priority=10,
+        )
+        resolver = self._resolver_for(low, high)
+
+        assert resolver.get_visual_markers({"event": "e", "status": "OK"}) == ["H"]
+
+    def test_dotted_key_matches_underscored_mapping(self) -> None:
+        """Test dotted prefixes resolve to underscored mapping names."""
+        mapping = EventMapping(name="db_system", visual_markers={"postgres": "🐘"})
+        resolver = self._resolver_for(EventSet(name="db", mappings=[mapping]))
+
+        assert resolver._find_event_mapping_for_field("db.system", "postgres") is mapping
+        assert resolver._find_event_mapping_for_field("cache.system", "redis") is None
+
+    def test_unmapped_keys_are_cached(self) -> None:
+        """Test keys without a mapping are remembered as misses."""
+        mapping = EventMapping(name="domain", visual_markers={"default": "❓"})
+        resolver = self._resolver_for(EventSet(name="das", mappings=[mapping]))
+
+        enriched = resolver.enrich_event({"event": "msg", "domain": "anything", "user_id": 1})
+
+        assert enriched["event"] == "[❓] msg"
+        assert resolver._field_cache["user_id"] is None
+        assert resolver._field_cache["domain"].mapping is mapping
+
+
 class TestEventSetTypes(FoundationTestCase):
     """Test event set type definitions."""
 
@@ -0,0 +1,132 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the OTLP log batch queue in logger/otlp/batch.py."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import threading
+from typing import Any
+
+import pytest
+
+from provide.foundation.logger.otlp.batch import OTLPLogBatcher
+from provide.foundation.logger.otlp.circuit import OTLPCircuitBreaker
+
+
+@pytest.fixture
+def batchers() -> Generator[list[OTLPLogBatcher]]:
+    """Collect batchers created by a test and shut them down afterwards."""
+    created: list[OTLPLogBatcher] = []
+    yield created
+    for batcher in created:
+        batcher.shutdown()
+
+
+class TestOTLPLogBatcher:
+    """Tests for batching, overflow and circuit breaker handling."""
+
+    def test_flush_emits_queued_items_in_order(self, batchers: list[OTLPLogBatcher]) -> None:
+        """Test flush hands every queued item to emit_batch."""
+        emitted: list[Any] = []
+        batcher = OTLPLogBatcher(emitted.extend, flush_interval=10.0, circuit_breaker=OTLPCircuitBreaker())
+        batchers.append(batcher)
+
+        for i in range(5):
+            batcher.submit(i)
+
+        assert batcher.flush() is True
+        assert emitted == [0, 1, 2, 3, 4]
+        assert batcher.get_stats()["emitted"] == 5
+
+    def test_full_batch_wakes_worker(self, batchers: list[OTLPLogBatcher]) -> None:
+        """Test reaching batch_size emits without waiting for the interval."""
+        emitted = threading.Event()
+        batcher = OTLPLogBatcher(
+            lambda batch: emitted.set(),
+            batch_size=3,
+            flush_interval=10.0,
+            circuit_breaker=OTLPCircuitBreaker(),
+        )
+        batchers.append(batcher)
+
+        for i in range(3):
+            batcher.submit(i)
+
+        assert emitted.wait(5.0)
+
+    def test_overflow_drops_oldest(self, batchers: list[OTLPLogBatcher]) -> None:
+        """Test a full queue drops its oldest items."""
+        release = threading.Event()
+        emitted: list[Any] = []
+
+        def slow_emit(batch: list[Any]) -> None:
+            release.wait(5.0)
+            emitted.extend(batch)
+
+        batcher = OTLPLogBatcher(
+            slow_emit,
+            max_queue_size=3,
+            batch_size=1,
+            flush_interval=10.0,
+            circuit_breaker=OTLPCircuitBreaker(),
+        )
+        batchers.append(batcher)
+
+        batcher.submit("first")  # picked up by the worker, which then blocks
+        while batcher.get_stats()["queued"]:
+            pass
+        for item in ("a", "b", "c", "d"):
+            batcher.submit(item)
+        release.set()
+
+        assert batcher.flush() is True
+        assert emitted == ["first", "b", "c", "d"]
+        assert batcher.get_stats()["dropped_overflow"] == 1
+
+    def test_open_circuit_drops_batches(self, batchers: list[OTLPLogBatcher]) -> None:
+        """Test batches are dropped instead of emitted while the circuit is open."""
+        breaker = OTLPCircuitBreaker(failure_threshold=1, timeout=60.0)
+        breaker.record_failure()
+        emitted: list[Any] = []
+        batcher = OTLPLogBatcher(emitted.extend, flush_interval=10.0, circuit_breaker=breaker)
+        batchers.append(batcher)
+
+        batcher.submit("record")
+
+        assert batcher.flush() is True
+        assert emitted == []
+        assert batcher.get_stats()["dropped_circuit_open"] == 1
+
+    def test_emit_errors_recorded_on_breaker(self, batchers: list[OTLPLogBatcher]) -> None:
+        """Test failing emits count as circuit breaker failures."""
+        breaker = OTLPCircuitBreaker(failure_threshold=1)
+
+        def failing_emit(batch: list[Any]) -> None:
+            raise RuntimeError("exporter down")
+
+        batcher = OTLPLogBatcher(failing_emit, flush_interval=10.0, circuit_breaker=breaker)
+        batchers.append(batcher)
+
+        batcher.submit("record")
+
+        assert batcher.flush() is True
+        assert breaker.state == "open"
+        assert batcher.get_stats()["emit_errors"] == 1
+
+    def test_shutdown_emits_remaining_items(self) -> None:
+        """Test shutdown emits what is queued and ignores later submits."""
+        emitted: list[Any] = []
+        batcher = OTLPLogBatcher(emitted.extend, flush_interval=10.0, circuit_breaker=OTLPCircuitBreaker())
+
+        batcher.submit("record")
+        batcher.shutdown()
+        batcher.submit("late")
+
+        assert emitted == ["record"]
+
+
+# 🧱🏗️🔚
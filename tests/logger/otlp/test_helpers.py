@@ -24,6 +24,7 @@ from provide.foundation.logger.otlp.helpers import (
     build_otlp_endpoint,
     build_otlp_headers,
     extract_trace_context,
+    normalize_attribute_value,
     normalize_attributes,
 )
 
@@ -468,4 +469,29 @@ class TestNormalizeAttributes:
         assert result["bool_false"] is attributes["bool_false"]
 
 
+class TestNormalizeAttributeValue:
+    """Tests for normalize_attribute_value and its per-type converter cache."""
+
+    def test_matches_normalize_attributes(self) -> None:
+        """Test single values normalize the same way as whole dicts."""
+        from enum import Enum
+
+        class Color(str, Enum):
+            RED = "red"
+
+        values = {"s": "x", "i": 1, "b": True, "n": None, "d": {"a": 1}, "l": [1], "e": Color.RED}
+
+        assert {k: normalize_attribute_value(v) for k, v in values.items()} == normalize_attributes(values)
+
+    def test_subclass_of_primitive_kept(self) -> None:
+        """Test subclasses of primitive types are passed through unchanged."""
+
+        class UserId(int):
+            pass
+
+        value = UserId(5)
+
+        assert normalize_attribute_value(value) is value
+
+
 # 🧱🏗️🔚
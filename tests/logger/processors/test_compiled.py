@@ -0,0 +1,125 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the compiled processor pipeline mode."""
+
+from __future__ import annotations
+
+import io
+from typing import Any
+
+from provide.testkit import FoundationTestCase
+import pytest
+import structlog
+
+from provide.foundation.logger.config import LoggingConfig, TelemetryConfig
+from provide.foundation.logger.levels import EffectiveLevelTable
+from provide.foundation.logger.processors import (
+    _build_core_processors_list,
+    _build_formatter_processors_list,
+)
+from provide.foundation.logger.processors.compiled import (
+    compile_head_processor,
+    compiled_tail_processor,
+)
+
+
+def _run_chain(processors: list[Any], method_name: str, event_dict: dict[str, Any]) -> dict[str, Any] | None:
+    try:
+        for processor in processors:
+            event_dict = processor(None, method_name, event_dict)
+    except structlog.DropEvent:
+        return None
+    return event_dict
+
+
+def _config(compiled: bool, **logging_kwargs: Any) -> TelemetryConfig:
+    logging_kwargs.setdefault("das_emoji_prefix_enabled", False)
+    return TelemetryConfig(
+        service_name="svc",
+        tracing_enabled=False,
+        logging=LoggingConfig(compiled_processors=compiled, **logging_kwargs),
+    )
+
+
+class TestCompileHeadProcessor(FoundationTestCase):
+    def test_omitted_steps_are_not_generated(self) -> None:
+        processor = compile_head_processor(omit_timestamp=True, service_name=None, level_table=None)
+        source = processor.__foundation_source__
+
+        assert "timestamp" not in source
+        assert "service_name" not in source
+        assert "_DropEvent" not in source
+
+    def test_applies_level_timestamp_and_service_name(self) -> None:
+        processor = compile_head_processor(omit_timestamp=False, service_name="svc", level_table=None)
+
+        result = processor(None, "warn", {"event": "hello"})
+
+        assert list(result) == ["event", "level", "timestamp", "service_name"]
+        assert result["level"] == "warning"
+        assert result["service_name"] == "svc"
+
+    def test_level_hint_overrides_method(self) -> None:
+        processor = compile_head_processor(omit_timestamp=True, service_name=None, level_table=None)
+
+        result = processor(None, "msg", {"event": "x", "_foundation_level_hint": "TRACE"})
+
+        assert result == {"event": "x", "level": "trace"}
+
+    def test_filters_early_with_level_table(self) -> None:
+        table = EffectiveLevelTable("INFO", {"chatty": "DEBUG"})
+        processor = compile_head_processor(omit_timestamp=True, service_name=None, level_table=table)
+
+        with pytest.raises(structlog.DropEvent):
+            processor(None, "debug", {"event": "x", "logger_name": "quiet"})
+        assert processor(None, "debug", {"event": "x", "logger_name": "chatty.db"})["level"] == "debug"
+
+
+class TestCompiledTailProcessor(FoundationTestCase):
+    def test_sets_exc_info_and_strips_logger_name(self) -> None:
+        result = compiled_tail_processor(None, "exception", {"event": "x", "logger_name": "app"})
+        assert result == {"event": "x", "exc_info": True}
+
+    def test_keeps_explicit_exc_info(self) -> None:
+        result = compiled_tail_processor(None, "exception", {"event": "x", "exc_info": False})
+        assert result["exc_info"] is False
+
+
+class TestCompiledPipelineEquivalence(FoundationTestCase):
+    @pytest.mark.parametrize(
+        ("method_name", "logger_name"),
+        [("info", "app"), ("error", "app.db"), ("debug", "app"), ("warning", "asyncio")],
+    )
+    def test_matches_default_chain(self, method_name: str, logger_name: str) -> None:
+        kwargs = {"default_level": "INFO", "omit_timestamp": True, "module_levels": {"asyncio": "ERROR"}}
+        default_chain = _build_core_processors_list(_config(False, **kwargs))
+        compiled_chain = _build_core_processors_list(_config(True, **kwargs))
+
+        event = {"event": "hello", "logger_name": logger_name, "password": "hunter2", "n": 1}
+        expected = _run_chain(default_chain, method_name, dict(event))
+        actual = _run_chain(compiled_chain, method_name, dict(event))
+
+        assert actual == expected
+        if expected is not None:
+            assert list(actual) == list(expected)
+
+    def test_compiled_chain_is_shorter(self) -> None:
+        kwargs = {"default_level": "INFO", "omit_timestamp": True}
+        default_chain = _build_core_processors_list(_config(False, **kwargs))
+        compiled_chain = _build_core_processors_list(_config(True, **kwargs))
+
+        assert len(compiled_chain) < len(default_chain)
+
+    def test_keyvalue_formatter_skips_redundant_logger_name_pop(self) -> None:
+        processors = _build_formatter_processors_list(
+            LoggingConfig(console_formatter="key_value", compiled_processors=True),
+            io.StringIO(),
+        )
+        assert len(processors) == 1
+        assert isinstance(processors[0], structlog.dev.ConsoleRenderer)
+
+
+# 🧱🏗️🔚
@@ -0,0 +1,116 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the JSON log renderer and its encoding backends."""
+
+from __future__ import annotations
+
+import datetime
+from enum import Enum
+import json
+from pathlib import Path
+from uuid import UUID
+
+from attrs import define
+from provide.testkit import FoundationTestCase
+import pytest
+
+from provide.foundation.logger.processors.json_renderer import (
+    JSON_BACKEND_STDLIB,
+    FoundationJSONRenderer,
+    is_json_backend_available,
+    resolve_json_backend,
+)
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@define
+class _Request:
+    method: str
+    path: str
+
+
+class TestFoundationJSONRenderer(FoundationTestCase):
+    """Test rendering events to JSON."""
+
+    @pytest.mark.parametrize("backend", ["auto", "orjson", "msgspec", "stdlib"])
+    def test_common_types_render_consistently(self, backend: str) -> None:
+        renderer = FoundationJSONRenderer(backend=backend)
+        event_dict = {
+            "event": "request ✓",
+            "at": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "request_id": UUID(int=1),
+            "path": Path("/tmp/x"),
+            "color": _Color.RED,
+            "request": _Request("GET", "/users"),
+            "count": 3,
+        }
+
+        result = json.loads(renderer(None, "info", event_dict))
+
+        assert result == {
+            "event": "request ✓",
+            "at": "2024-01-02T03:04:05",
+            "request_id": "00000000-0000-0000-0000-000000000001",
+            "path": "/tmp/x",
+            "color": "red",
+            "request": {"method": "GET", "path": "/users"},
+            "count": 3,
+        }
+
+    def test_unknown_objects_use_repr(self) -> None:
+        class Opaque:
+            def __repr__(self) -> str:
+                return "<opaque>"
+
+        renderer = FoundationJSONRenderer()
+
+        assert json.loads(renderer(None, "info", {"value": Opaque()})) == {"value": "<opaque>"}
+
+    def test_values_rejected_by_fast_backend_fall_back(self) -> None:
+        renderer = FoundationJSONRenderer()
+
+        assert json.loads(renderer(None, "info", {"big": 2**70})) == {"big": 2**70}
+
+    def test_encode_returns_bytes(self) -> None:
+        renderer = FoundationJSONRenderer()
+
+        encoded = renderer.encode({"event": "hi"})
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == {"event": "hi"}
+
+
+class TestJSONBackendResolution(FoundationTestCase):
+    """Test backend selection."""
+
+    def test_stdlib_always_available(self) -> None:
+        assert is_json_backend_available(JSON_BACKEND_STDLIB)
+        assert resolve_json_backend(JSON_BACKEND_STDLIB) == JSON_BACKEND_STDLIB
+
+    def test_missing_backend_falls_back_to_stdlib(self) -> None:
+        for backend in ("orjson", "msgspec"):
+            if not is_json_backend_available(backend):
+                assert resolve_json_backend(backend) == JSON_BACKEND_STDLIB
+
+    def test_json_formatter_uses_configured_backend(self) -> None:
+        import io
+
+        from provide.foundation.logger.config import LoggingConfig
+        from provide.foundation.logger.processors import _build_formatter_processors_list
+
+        processors = _build_formatter_processors_list(
+            LoggingConfig(console_formatter="json", json_backend="stdlib"),
+            io.StringIO(),
+        )
+
+        assert isinstance(processors[-1], FoundationJSONRenderer)
+        assert processors[-1].backend == JSON_BACKEND_STDLIB
+
+
+# 🧱🏗️🔚
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 import sys
+from typing import Any
 
 from provide.testkit.mocking import Mock, patch
 import pytest
@@ -391,6 +392,76 @@ class TestOtlpProcessor:
         assert "event" not in attributes  # Should be excluded
 
 
+class TestOtlpProcessorBatching:
+    """Tests for the batched export path of the OTLP processor."""
+
+    @staticmethod
+    def _create(mock_client_class: Mock, mock_logger: Mock) -> Any:
+        config = Mock()
+        config.otlp_endpoint = "https://api.example.com"
+        config.otlp_log_batch_enabled = True
+        config.otlp_log_queue_size = 100
+        config.otlp_log_batch_size = 50
+        config.otlp_log_flush_interval = 10.0
+
+        mock_provider = Mock()
+        mock_provider.get_logger.return_value = mock_logger
+
+        mock_client = Mock()
+        mock_client.is_available.return_value = True
+        mock_client.create_logger_provider.return_value = mock_provider
+        mock_client_class.from_config.return_value = mock_client
+
+        return create_otlp_processor(config)
+
+    @patch("provide.foundation.logger.processors.otlp.OTLPLogClient")
+    @patch("opentelemetry._logs.LogRecord")
+    def test_records_emitted_on_flush(self, mock_log_record_class: Mock, mock_client_class: Mock) -> None:
+        """Test records are queued by the processor and emitted by the batcher."""
+        mock_logger = Mock()
+        processor = self._create(mock_client_class, mock_logger)
+        assert processor is not None
+
+        for i in range(3):
+            processor(Mock(), "info", {"event": f"message {i}", "level": "info"})
+
+        flush_otlp_logs()
+
+        assert mock_logger.emit.call_count == 3
+        reset_otlp_provider()
+
+    @patch("provide.foundation.logger.processors.otlp.OTLPLogClient")
+    @patch("opentelemetry._logs.LogRecord")
+    def test_attributes_normalized_and_timestamp_not_parsed(
+        self,
+        mock_log_record_class: Mock,
+        mock_client_class: Mock,
+    ) -> None:
+        """Test attributes are normalized and string timestamps use the clock."""
+        processor = self._create(mock_client_class, Mock())
+        assert processor is not None
+
+        processor(
+            Mock(),
+            "info",
+            {
+                "event": "Test message",
+                "level": "info",
+                "timestamp": "not a parseable timestamp",
+                "nested": {"a": 1},
+                "missing": None,
+            },
+        )
+        flush_otlp_logs()
+
+        call_kwargs = mock_log_record_class.call_args[1]
+        assert call_kwargs["attributes"]["nested"] == '{"a": 1}'
+        assert call_kwargs["attributes"]["missing"] == ""
+        assert call_kwargs["timestamp"] > 0
+        assert call_kwargs["observed_timestamp"] >= call_kwargs["timestamp"]
+        reset_otlp_provider()
+
+
 class TestFlushOtlpLogs:
     """Tests for flush_otlp_logs function."""
 
@@ -0,0 +1,107 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the single-pass sanitization engine behind the sanitization processor."""
+
+from provide.testkit import FoundationTestCase
+
+
+class TestCombinedSecretMasking(FoundationTestCase):
+    """Test that the combined pattern matches the per-pattern behavior."""
+
+    def test_combined_matches_sequential_masking(self) -> None:
+        """Test masking matches one re.sub per pattern, including overlapping matches."""
+        import re
+
+        from provide.foundation.security.defaults import DEFAULT_SECRET_PATTERNS
+        from provide.foundation.security.masking import mask_secrets
+
+        def mask_per_pattern(text: str) -> str:
+            for pattern in DEFAULT_SECRET_PATTERNS:
+                text = re.sub(pattern, lambda m: f"{m.group(1)}[MASKED]", text, flags=re.IGNORECASE)
+            return text
+
+        samples = [
+            "password=abc token=def",
+            "--api-key k1 -p hunter2",
+            "DB_PASSWORD=x GH_TOKEN=y plain text",
+            "credentials: c1 secret_key=s1 auth=a1",
+            "Token: Bearer abc and my_password=zzz",
+            "nothing sensitive here",
+            "auth token abc123",
+            "mysql -p password hunter2",
+            "using secret token s3cr3t",
+        ]
+        for text in samples:
+            assert mask_secrets(text) == mask_per_pattern(text)
+
+        assert "abc123" not in mask_secrets("auth token abc123")
+        assert "hunter2" not in mask_secrets("mysql -p password hunter2")
+        assert "s3cr3t" not in mask_secrets("using secret token s3cr3t")
+
+    def test_case_folded_triggers_are_masked(self) -> None:
+        """Test non-ASCII text that IGNORECASE folds onto a trigger is not prefiltered out."""
+        from provide.foundation.security.masking import mask_secrets, should_mask
+
+        text = "ſecret=hunter2"
+        assert should_mask(text)
+        assert mask_secrets(text) == "ſecret=[MASKED]"
+
+    def test_text_without_triggers_returned_unchanged(self) -> None:
+        """Test the literal prefilter returns the same object for clean text."""
+        from provide.foundation.security.masking import mask_secrets, should_mask
+
+        text = "GET /users returned 200 in 12ms"
+        assert mask_secrets(text) is text
+        assert not should_mask(text)
+
+    def test_custom_patterns_are_combined(self) -> None:
+        """Test custom pattern lists still mask every pattern."""
+        from provide.foundation.security.masking import mask_secrets
+
+        patterns = [r"(pin=)(\d+)", r"(otp:)(\S+)"]
+        assert mask_secrets("pin=1234 otp:abc", patterns) == "pin=[MASKED] otp:[MASKED]"
+
+    def test_custom_patterns_without_two_groups_fall_back(self) -> None:
+        """Test patterns that cannot be combined are applied one at a time."""
+        from provide.foundation.security.masking import mask_secrets
+
+        patterns = [r"(session=)(\w+)", r"(x)(y)(z)"]
+        assert mask_secrets("session=abc", patterns) == "session=[MASKED]"
+
+
+class TestSanitizationProcessorCopyOnWrite(FoundationTestCase):
+    """Test the processor only copies when something is sanitized."""
+
+    def test_clean_event_returned_without_copy(self) -> None:
+        """Test an event with nothing to sanitize is returned as-is."""
+        from provide.foundation.logger.processors.sanitization import (
+            create_sanitization_processor,
+        )
+
+        processor = create_sanitization_processor()
+        event_dict = {"event": "hello", "config": {"host": "db"}, "ids": [1, 2]}
+
+        assert processor(None, "info", event_dict) is event_dict
+
+    def test_nested_lists_sanitized_without_mutating_input(self) -> None:
+        """Test dicts inside lists are redacted and the input is left intact."""
+        from provide.foundation.logger.processors.sanitization import (
+            create_sanitization_processor,
+        )
+
+        processor = create_sanitization_processor()
+        credentials = [{"token": "abc", "user": "bob"}, "plain"]
+        event_dict = {"event": "login", "attempts": credentials}
+
+        result = processor(None, "info", event_dict)
+
+        assert result["attempts"][0] == {"token": "[REDACTED]", "user": "bob"}
+        assert result["attempts"][1] == "plain"
+        assert credentials[0]["token"] == "abc"
+        assert event_dict["attempts"] is credentials
+
+
+# 🧱🏗️🔚
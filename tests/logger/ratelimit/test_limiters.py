@@ -15,6 +15,7 @@ import pytest
 from provide.foundation.logger.ratelimit.limiters import (
     AsyncRateLimiter,
     GlobalRateLimiter,
+    ShardedRateLimiter,
     SyncRateLimiter,
 )
 
@@ -137,6 +138,103 @@ class TestSyncRateLimiter(FoundationTestCase):
         assert abs(stats["tokens_available"] - 3.0) < 0.01
 
 
+class TestShardedRateLimiter(FoundationTestCase):
+    """Test ShardedRateLimiter class."""
+
+    def test_sharded_rate_limiter_splits_capacity(self) -> None:
+        """Test capacity and rate are divided evenly between shards."""
+        limiter = ShardedRateLimiter(capacity=8.0, refill_rate=4.0, shards=4)
+
+        assert len(limiter.shards) == 4
+        assert all(shard.capacity == 2.0 for shard in limiter.shards)
+        assert all(shard.refill_rate == 1.0 for shard in limiter.shards)
+
+    def test_sharded_rate_limiter_never_more_shards_than_tokens(self) -> None:
+        """Test every shard can hold at least one token."""
+        limiter = ShardedRateLimiter(capacity=2.0, refill_rate=1.0, shards=8)
+
+        assert len(limiter.shards) == 2
+
+    def test_sharded_rate_limiter_init_invalid(self) -> None:
+        """Test ShardedRateLimiter validates its parameters."""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            ShardedRateLimiter(capacity=0, refill_rate=1.0)
+        with pytest.raises(ValueError, match="Shard count must be positive"):
+            ShardedRateLimiter(capacity=10.0, refill_rate=1.0, shards=0)
+        with pytest.raises(ValueError, match="Clock tick must be positive"):
+            ShardedRateLimiter(capacity=10.0, refill_rate=1.0, clock_tick=0)
+
+    def test_single_thread_borrows_whole_capacity(self) -> None:
+        """Test one thread can use the tokens of shards it is not pinned to."""
+        limiter = ShardedRateLimiter(capacity=6.0, refill_rate=0.001, shards=3)
+
+        results = [limiter.is_allowed() for _ in range(8)]
+
+        assert results == [True] * 6 + [False] * 2
+
+    def test_sharded_rate_limiter_refill_over_time(self) -> None:
+        """Test a drained shard reads the clock and refills."""
+        limiter = ShardedRateLimiter(capacity=2.0, refill_rate=20.0, shards=2)
+        assert limiter.is_allowed() is True
+        assert limiter.is_allowed() is True
+        assert limiter.is_allowed() is False
+
+        time.sleep(0.15)
+
+        assert limiter.is_allowed() is True
+
+    def test_sharded_rate_limiter_thread_safety(self) -> None:
+        """Test concurrent threads never exceed the combined capacity."""
+        limiter = ShardedRateLimiter(capacity=100.0, refill_rate=0.001, shards=4)
+        results: list[bool] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            local = [limiter.is_allowed() for _ in range(50)]
+            with lock:
+                results.extend(local)
+
+        threads = [threading.Thread(daemon=True, target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10.0)
+
+        assert sum(results) == 100
+
+        stats = limiter.get_stats()
+        assert stats["total_allowed"] == 100
+        assert stats["total_denied"] == 300
+        assert stats["shards"] == 4
+        assert stats["last_denied_time"] is not None
+
+    def test_global_rate_limiter_sharded_strategy(self) -> None:
+        """Test GlobalRateLimiter builds sharded buckets when configured."""
+        GlobalRateLimiter._instance = None
+        limiter = GlobalRateLimiter()
+
+        limiter.configure(
+            global_rate=1.0,
+            global_capacity=4.0,
+            per_logger_rates={"noisy": (1.0, 2.0)},
+            use_buffered=True,
+            strategy="sharded",
+            shards=2,
+        )
+
+        assert isinstance(limiter.global_limiter, ShardedRateLimiter)
+        assert isinstance(limiter.logger_limiters["noisy"], ShardedRateLimiter)
+        assert limiter.use_buffered is False
+        assert [limiter.is_allowed("noisy")[0] for _ in range(3)] == [True, True, False]
+
+    def test_global_rate_limiter_rejects_unknown_strategy(self) -> None:
+        """Test GlobalRateLimiter rejects unknown strategies."""
+        GlobalRateLimiter._instance = None
+
+        with pytest.raises(ValueError, match="Invalid rate limit strategy"):
+            GlobalRateLimiter().configure(strategy="magic")
+
+
 class TestAsyncRateLimiter(FoundationTestCase):
     """Test AsyncRateLimiter class."""
 
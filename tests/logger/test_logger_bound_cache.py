@@ -0,0 +1,75 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the per-name bound logger cache."""
+
+from __future__ import annotations
+
+import io
+
+from provide.testkit import FoundationTestCase
+import pytest
+import structlog
+
+from provide.foundation.logger.core import (
+    _BOUND_LOGGER_CACHE,
+    _BOUND_LOGGER_CACHE_SIZE_LIMIT,
+    clear_bound_logger_cache,
+    get_bound_logger,
+)
+
+pytestmark = pytest.mark.serial
+
+
+class TestBoundLoggerCache(FoundationTestCase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        structlog.configure(
+            processors=[structlog.processors.JSONRenderer()],
+            logger_factory=structlog.PrintLoggerFactory(file=io.StringIO()),
+            wrapper_class=structlog.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+        clear_bound_logger_cache()
+
+    def teardown_method(self) -> None:
+        clear_bound_logger_cache()
+        super().teardown_method()
+
+    def test_same_name_returns_same_instance(self) -> None:
+        first = get_bound_logger("app.db")
+        second = get_bound_logger("app.db")
+
+        assert first is second
+        assert get_bound_logger("app.http") is not first
+
+    def test_reconfiguration_invalidates_cache(self) -> None:
+        stream = io.StringIO()
+        before = get_bound_logger("app.db")
+
+        structlog.configure(logger_factory=structlog.PrintLoggerFactory(file=stream))
+        after = get_bound_logger("app.db")
+        after.info("hello")
+
+        assert after is not before
+        assert "hello" in stream.getvalue()
+
+    def test_bypassed_when_structlog_caching_disabled(self) -> None:
+        structlog.configure(cache_logger_on_first_use=False)
+
+        assert get_bound_logger("app.db") is not get_bound_logger("app.db")
+        assert "app.db" not in _BOUND_LOGGER_CACHE
+
+    def test_cache_is_bounded(self) -> None:
+        for i in range(_BOUND_LOGGER_CACHE_SIZE_LIMIT + 10):
+            get_bound_logger(f"logger.{i}")
+
+        assert len(_BOUND_LOGGER_CACHE) == _BOUND_LOGGER_CACHE_SIZE_LIMIT
+
+    def test_clear(self) -> None:
+        first = get_bound_logger("app.db")
+        clear_bound_logger_cache()
+
+        assert get_bound_logger("app.db") is not first
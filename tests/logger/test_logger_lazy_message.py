@@ -0,0 +1,108 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for lazily formatted %-style log messages."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from provide.testkit import FoundationTestCase
+from provide.testkit.mocking import patch
+
+from provide.foundation.logger.core import FoundationLogger
+from provide.foundation.logger.message import LazyMessage, prefix_message, render_lazy_message
+
+
+class _CountingArg:
+    """Argument that counts how often it is converted to a string."""
+
+    def __init__(self) -> None:
+        self.str_calls = 0
+
+    def __str__(self) -> str:
+        self.str_calls += 1
+        return "payload"
+
+
+class TestLazyMessage(FoundationTestCase):
+    """Test LazyMessage rendering."""
+
+    def test_renders_once_on_demand(self) -> None:
+        arg = _CountingArg()
+        message = LazyMessage("request %s", (arg,))
+
+        assert arg.str_calls == 0
+        assert str(message) == "request payload"
+        assert message == "request payload"
+        assert arg.str_calls == 1
+
+    def test_bad_format_falls_back_to_args_tuple(self) -> None:
+        message = LazyMessage("value %d", ("abc",))
+
+        assert message.render() == "value %d ('abc',)"
+
+    def test_steps_apply_in_order_without_rendering(self) -> None:
+        arg = _CountingArg()
+        message = prefix_message("🔹", LazyMessage("got %s", (arg,)).with_step(str.upper))
+
+        assert arg.str_calls == 0
+        assert message.render() == "🔹 GOT PAYLOAD"
+
+    def test_behaves_like_string(self) -> None:
+        message = LazyMessage("user %s logged in", ("bob",))
+
+        assert "bob" in message
+        assert message.startswith("user")
+        assert len(message) == len("user bob logged in")
+        assert {message: 1}["user bob logged in"] == 1
+
+    def test_render_processor_replaces_event(self) -> None:
+        event_dict: dict[str, Any] = {"event": LazyMessage("n=%d", (3,))}
+
+        result = render_lazy_message(None, "info", event_dict)
+
+        assert result["event"] == "n=3"
+        assert type(result["event"]) is str
+
+
+class TestFoundationLoggerLazyFormatting(FoundationTestCase):
+    """Test FoundationLogger hands lazy messages to the processor chain."""
+
+    def test_args_passed_as_lazy_message(self) -> None:
+        logger = FoundationLogger()
+        arg = _CountingArg()
+
+        with patch.object(FoundationLogger, "_log_with_level") as mock_log:
+            logger.error("handled %s", arg)
+
+        event = mock_log.call_args.args[1]
+        assert isinstance(event, LazyMessage)
+        assert arg.str_calls == 0
+        assert event == "handled payload"
+
+    def test_no_args_passes_plain_string(self) -> None:
+        logger = FoundationLogger()
+
+        with patch.object(FoundationLogger, "_log_with_level") as mock_log:
+            logger.error("plain 100%")
+
+        assert mock_log.call_args.args[1] == "plain 100%"
+        assert type(mock_log.call_args.args[1]) is str
+
+    def test_sanitization_applies_to_lazy_message(self) -> None:
+        from provide.foundation.logger.processors.sanitization import (
+            create_sanitization_processor,
+        )
+
+        processor = create_sanitization_processor()
+        event_dict = {"event": LazyMessage("connecting with %s", ("password=hunter2",))}
+
+        result = processor(None, "info", event_dict)
+
+        assert str(result["event"]) == "connecting with password=[MASKED]"
+
+
+# 🧱🏗️🔚
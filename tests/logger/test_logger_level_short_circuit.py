@@ -0,0 +1,114 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for early level short-circuiting in FoundationLogger."""
+
+from __future__ import annotations
+
+import io
+
+from provide.testkit import FoundationTestCase, set_log_stream_for_testing
+import pytest
+
+from provide.foundation import LoggingConfig, TelemetryConfig, get_hub, logger
+from provide.foundation.logger.core import _LEVEL_TABLE_STATE, build_level_table
+from provide.foundation.logger.levels import EffectiveLevelTable
+
+pytestmark = pytest.mark.serial
+
+
+class _CountingArg:
+    """Argument that records how often it is rendered."""
+
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def __str__(self) -> str:
+        self.renders += 1
+        return "rendered"
+
+
+class TestEffectiveLevelTable(FoundationTestCase):
+    def test_default_threshold(self) -> None:
+        table = EffectiveLevelTable("WARNING")
+        assert table.threshold_for("any.logger") == 30
+        assert not table.is_enabled_for("any.logger", 20)
+        assert table.is_enabled_for("any.logger", 40)
+
+    def test_longest_module_prefix_wins(self) -> None:
+        table = EffectiveLevelTable("INFO", {"app": "ERROR", "app.db": "DEBUG"})
+        assert table.threshold_for("app.db.pool") == 10
+        assert table.threshold_for("app.http") == 40
+        assert table.threshold_for("other") == 20
+
+    def test_lookups_are_memoized(self) -> None:
+        table = EffectiveLevelTable("INFO", {"app": "ERROR"})
+        table.threshold_for("app.worker")
+        assert table._cache == {"app.worker": 40}
+
+
+class TestLevelShortCircuit(FoundationTestCase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.stream = io.StringIO()
+        set_log_stream_for_testing(self.stream)
+
+    def _setup(self, **logging_kwargs: object) -> None:
+        config = TelemetryConfig(logging=LoggingConfig(**logging_kwargs))
+        get_hub().initialize_foundation(config, force=True)
+
+    def test_disabled_call_skips_formatting(self) -> None:
+        self._setup(default_level="INFO")
+        arg = _CountingArg()
+
+        logger.debug("value=%s", arg)
+        logger.info("value=%s", arg)
+
+        assert arg.renders == 1
+        output = self.stream.getvalue()
+        assert "value=rendered" in output
+
+    def test_is_enabled_for(self) -> None:
+        self._setup(default_level="INFO", module_levels={"noisy": "ERROR"})
+
+        assert logger.is_enabled_for("INFO")
+        assert not logger.is_enabled_for("DEBUG")
+        assert not logger.is_debug_enabled()
+        assert not logger.is_trace_enabled()
+        assert not logger.isEnabledFor(30, "noisy.child")
+        assert logger.is_enabled_for("error", "noisy.child")
+
+    def test_module_level_applies_to_named_calls(self) -> None:
+        self._setup(default_level="ERROR", module_levels={"chatty": "DEBUG"})
+
+        logger.debug("kept", _foundation_logger_name="chatty.worker")
+        logger.debug("dropped", _foundation_logger_name="quiet.worker")
+
+        output = self.stream.getvalue()
+        assert "kept" in output
+        assert "dropped" not in output
+
+    def test_reconfigure_rebuilds_table(self) -> None:
+        self._setup(default_level="INFO")
+        assert not logger.is_debug_enabled()
+
+        self._setup(default_level="DEBUG")
+        assert logger.is_debug_enabled()
+
+    def test_otlp_disables_short_circuit(self) -> None:
+        config = TelemetryConfig(
+            otlp_endpoint="http://localhost:4317",
+            logging=LoggingConfig(default_level="INFO"),
+        )
+        assert build_level_table(config) is None
+
+    def test_reset_invalidates_table(self) -> None:
+        from provide.foundation.testmode.internal import reset_logger_state
+
+        self._setup(default_level="INFO")
+        assert _LEVEL_TABLE_STATE["table"] is not None
+
+        reset_logger_state()
+        assert _LEVEL_TABLE_STATE["table"] is None
@@ -0,0 +1,214 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Unit tests for the metrics registry and Prometheus/JSON exposition."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+from provide.testkit import FoundationTestCase
+import pytest
+
+from provide.foundation.metrics.exposition import (
+    iter_prometheus_text,
+    render_json_snapshot,
+    render_prometheus_text,
+    snapshot_metrics,
+    start_metrics_server,
+)
+from provide.foundation.metrics.registry import MetricsRegistry
+from provide.foundation.metrics.simple import SimpleCounter, SimpleGauge, SimpleHistogram
+
+
+class TestMetricsRegistry(FoundationTestCase):
+    """Tests for MetricsRegistry."""
+
+    def test_register_replaces_same_name(self) -> None:
+        """Test the last metric registered under a name wins."""
+        registry = MetricsRegistry()
+        first = SimpleCounter("jobs")
+        second = SimpleCounter("jobs")
+
+        registry.register(first)
+        registry.register(second, "Jobs run")
+
+        assert len(registry) == 1
+        entry = registry.get("jobs")
+        assert entry is not None
+        assert entry.metric is second
+        assert entry.type == "counter"
+        assert entry.description == "Jobs run"
+
+    def test_metrics_sorted_and_clear(self) -> None:
+        """Test metrics are listed by name and clear removes them."""
+        registry = MetricsRegistry()
+        registry.register(SimpleGauge("b"))
+        registry.register(SimpleHistogram("a"))
+
+        assert [entry.name for entry in registry.metrics()] == ["a", "b"]
+
+        registry.clear()
+        assert registry.metrics() == []
+
+    def test_rejects_unknown_metric(self) -> None:
+        """Test registering something that is not a metric raises."""
+        with pytest.raises(TypeError):
+            MetricsRegistry().register(object())  # type: ignore[arg-type]
+
+
+class TestPrometheusText(FoundationTestCase):
+    """Tests for the Prometheus text format."""
+
+    def test_counter_and_gauge_samples(self) -> None:
+        """Test counters get a _total suffix and labels are rendered and escaped."""
+        registry = MetricsRegistry()
+        requests = SimpleCounter("http.requests")
+        requests.inc(2, method="GET")
+        requests.inc(path='/a"b')
+        registry.register(requests, "HTTP requests")
+        depth = SimpleGauge("queue_depth")
+        depth.set(7)
+        registry.register(depth)
+
+        text = render_prometheus_text(registry)
+
+        assert text.splitlines() == [
+            "# HELP http_requests_total HTTP requests",
+            "# TYPE http_requests_total counter",
+            'http_requests_total{method="GET"} 2',
+            'http_requests_total{path="/a\\"b"} 1',
+            "# TYPE queue_depth gauge",
+            "queue_depth 7",
+        ]
+
+    def test_histogram_as_summary(self) -> None:
+        """Test histograms render quantiles, _sum and _count per label set."""
+        registry = MetricsRegistry()
+        latency = SimpleHistogram("latency", backend="sketch")
+        for value in range(1, 101):
+            latency.observe(float(value), route="/x")
+        registry.register(latency)
+
+        lines = render_prometheus_text(registry).splitlines()
+
+        assert lines[0] == "# TYPE latency summary"
+        assert "latency_count 100" in lines
+        assert "latency_sum 5050.0" in lines
+        assert 'latency_count{route="/x"} 100' in lines
+        p50 = next(line for line in lines if line.startswith('latency{quantile="0.5"}'))
+        assert float(p50.split()[-1]) == pytest.approx(50, rel=0.02)
+
+    def test_empty_histogram_quantiles_are_nan(self) -> None:
+        """Test quantiles of an empty histogram render as NaN."""
+        registry = MetricsRegistry()
+        registry.register(SimpleHistogram("empty"))
+
+        assert 'empty{quantile="0.99"} NaN' in render_prometheus_text(registry).splitlines()
+
+    def test_openmetrics_format(self) -> None:
+        """Test OpenMetrics names the counter family without _total and ends with EOF."""
+        registry = MetricsRegistry()
+        registry.register(SimpleCounter("jobs_total"))
+
+        chunks = list(iter_prometheus_text(registry, openmetrics=True))
+
+        assert chunks == ["# TYPE jobs counter\njobs_total 0\n", "# EOF\n"]
+
+    def test_render_while_writing(self) -> None:
+        """Test rendering does not block or break concurrent writers."""
+        registry = MetricsRegistry()
+        counter = SimpleCounter("busy")
+        histogram = SimpleHistogram("busy_latency")
+        registry.register(counter)
+        registry.register(histogram)
+        stop = threading.Event()
+
+        def write() -> None:
+            while not stop.is_set():
+                counter.inc(shard="a")
+                histogram.observe(1.0, shard="a")
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(50):
+                assert "busy_total" in render_prometheus_text(registry)
+        finally:
+            stop.set()
+            writer.join()
+
+        assert f'busy_total{{shard="a"}} {counter.value}' in render_prometheus_text(registry)
+
+
+class TestJSONSnapshot(FoundationTestCase):
+    """Tests for JSON snapshots."""
+
+    def test_snapshot_contents(self) -> None:
+        """Test snapshots include metadata and per-label samples."""
+        registry = MetricsRegistry()
+        counter = SimpleCounter("jobs")
+        counter.inc(queue="default")
+        registry.register(counter, "Jobs run", "1")
+        histogram = SimpleHistogram("latency")
+        histogram.observe(2.0)
+        registry.register(histogram)
+
+        snapshot = snapshot_metrics(registry)
+
+        jobs, latency = sorted(snapshot["metrics"], key=lambda m: m["name"])
+        assert jobs == {
+            "name": "jobs",
+            "type": "counter",
+            "description": "Jobs run",
+            "unit": "1",
+            "samples": [{"labels": {"queue": "default"}, "value": 1}],
+        }
+        assert latency["samples"][0]["count"] == 1
+        assert latency["samples"][0]["quantiles"]["0.5"] == 2.0
+
+    def test_render_json_is_compact_bytes(self) -> None:
+        """Test the encoded snapshot is compact JSON."""
+        registry = MetricsRegistry()
+        registry.register(SimpleGauge("g"))
+
+        encoded = render_json_snapshot(registry)
+
+        assert b" " not in encoded
+        assert json.loads(encoded)["metrics"][0]["name"] == "g"
+
+
+class TestMetricsServer(FoundationTestCase):
+    """Tests for the built-in HTTP exporter."""
+
+    def test_serves_metrics_on_localhost(self) -> None:
+        """Test /metrics and /metrics.json are served and other paths 404."""
+        registry = MetricsRegistry()
+        counter = SimpleCounter("served")
+        counter.inc()
+        registry.register(counter)
+
+        server = start_metrics_server(port=0, registry=registry)
+        try:
+            host, port = server.address
+            assert host == "127.0.0.1"
+
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert "served_total 1" in response.read().decode()
+
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics.json", timeout=5) as response:
+                assert json.loads(response.read())["metrics"][0]["name"] == "served"
+
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        finally:
+            server.stop()
+
+
+# 🧱🏗️🔚
@@ -263,11 +263,41 @@ class TestModuleConstants(FoundationTestCase):
         assert callable(histogram)
 
 
+class TestRegistration(FoundationTestCase):
+    """Tests for registering created metrics."""
+
+    def test_created_metrics_are_registered(self) -> None:
+        """Test counter(), gauge() and histogram() register with their metadata."""
+        from provide.foundation.metrics import counter, gauge, get_metrics_registry, histogram
+
+        registry = get_metrics_registry()
+        c = counter("registered_counter", description="Counted", unit="1")
+        g = gauge("registered_gauge")
+        h = histogram("registered_histogram", unit="ms")
+
+        assert registry.get("registered_counter").metric is c
+        assert registry.get("registered_counter").description == "Counted"
+        assert registry.get("registered_gauge").metric is g
+        assert registry.get("registered_histogram").unit == "ms"
+        assert registry.get("registered_histogram").metric is h
+
+    def test_recreating_replaces_registration(self) -> None:
+        """Test creating a metric again returns a new instance that replaces the old one."""
+        from provide.foundation.metrics import counter, get_metrics_registry
+
+        first = counter("recreated_counter")
+        second = counter("recreated_counter")
+
+        assert first is not second
+        assert get_metrics_registry().get("recreated_counter").metric is second
+
+
 __all__ = [
     "TestCounterAPI",
     "TestGaugeAPI",
     "TestHistogramAPI",
     "TestModuleConstants",
+    "TestRegistration",
     "TestSetMeter",
 ]
 
@@ -10,8 +10,11 @@ Run with: pytest tests/metrics/test_simple_unit.py -v"""
 
 from __future__ import annotations
 
+import threading
+
 from provide.testkit import FoundationTestCase
 from provide.testkit.mocking import MagicMock
+import pytest
 
 from provide.foundation.metrics.simple import SimpleCounter, SimpleGauge, SimpleHistogram
 
@@ -379,6 +382,126 @@ class TestSimpleHistogram(FoundationTestCase):
         assert histogram.avg == 5.5
 
 
+class TestBoundMetricsAndThreading(FoundationTestCase):
+    """Tests for pre-bound label sets and concurrent updates."""
+
+    def test_counter_labels_returns_same_child(self) -> None:
+        """Test binding the same label set twice returns one child."""
+        counter = SimpleCounter("test_counter")
+
+        child = counter.labels(route="/x", status=200)
+
+        assert counter.labels(status=200, route="/x") is child
+        assert child.labels_key == "route=/x,status=200"
+
+    def test_bound_counter_shares_values_with_kwargs(self) -> None:
+        """Test bound and keyword increments land on the same label set."""
+        mock_otel_counter = MagicMock()
+        counter = SimpleCounter("test_counter", otel_counter=mock_otel_counter)
+        child = counter.labels(route="/x")
+
+        child.inc()
+        counter.inc(2, route="/x")
+        counter.inc(4)
+
+        assert child.value == 3
+        assert counter.value == 7
+        assert counter._labels_values == {"route=/x": 3}
+        mock_otel_counter.add.assert_any_call(1, attributes={"route": "/x"})
+
+    def test_label_keys_distinguish_value_types(self) -> None:
+        """Test interned keys keep labels that only differ by type apart."""
+        counter = SimpleCounter("test_counter")
+
+        counter.inc(flag=True)
+        counter.inc(flag=1)
+
+        assert counter._labels_values == {"flag=True": 1, "flag=1": 1}
+
+    def test_counter_increments_not_lost_across_threads(self) -> None:
+        """Test concurrent increments from many threads are all counted."""
+        counter = SimpleCounter("test_counter")
+        child = counter.labels(route="/x")
+
+        def worker() -> None:
+            for _ in range(10_000):
+                counter.inc()
+                child.inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert child.value == 80_000
+        assert counter.value == 160_000
+
+    def test_gauge_set_records_delta_to_otel(self) -> None:
+        """Test set() sends the change since the previous value to OTEL."""
+        mock_otel_gauge = MagicMock()
+        gauge = SimpleGauge("test_gauge", otel_gauge=mock_otel_gauge)
+        pool = gauge.labels(pool="workers")
+
+        pool.set(10)
+        pool.set(4)
+
+        deltas = [call.args[0] for call in mock_otel_gauge.add.call_args_list]
+        assert deltas == [10, -6]
+        assert gauge._labels_values == {"pool=workers": 4}
+        assert gauge.value == 4
+
+
+class TestSimpleHistogramBackends(FoundationTestCase):
+    """Tests for histogram min/max, quantiles and the sketch backend."""
+
+    def test_exact_backend_quantiles(self) -> None:
+        """Test the exact backend reports exact percentiles."""
+        histogram = SimpleHistogram("test_histogram")
+        for value in range(1, 101):
+            histogram.observe(value, route="/a" if value <= 50 else "/b")
+
+        assert histogram.min == 1
+        assert histogram.max == 100
+        assert histogram.percentiles() == {"p50": 51, "p95": 95, "p99": 99}
+        assert histogram.quantile(1.0, route="/a") == 50
+        assert histogram.quantile(0.5, route="/missing") is None
+
+    def test_sketch_backend_keeps_no_observations(self) -> None:
+        """Test the sketch backend does not store individual observations."""
+        histogram = SimpleHistogram("test_histogram", backend="sketch")
+        for value in range(1, 1001):
+            histogram.observe(value, method="GET")
+
+        assert histogram._observations == []
+        assert histogram._labels_observations == {}
+        assert histogram.count == 1000
+        assert histogram.sum == 500500
+        assert histogram.avg == 500.5
+        p99 = histogram.quantile(0.99, method="GET")
+        assert p99 is not None
+        assert abs(p99 - 990) <= 990 * 0.01
+
+    def test_snapshots_merge_across_histograms(self) -> None:
+        """Test snapshots from separate histograms can be combined."""
+        first = SimpleHistogram("first", backend="sketch")
+        second = SimpleHistogram("second")
+        first.observe(1.0)
+        second.observe(3.0)
+
+        combined = first.snapshot()
+        combined.merge(second.snapshot())
+
+        assert combined.count == 2
+        assert combined.sum == 4.0
+        assert combined.max == 3.0
+
+    def test_unknown_backend_rejected(self) -> None:
+        """Test an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown histogram backend"):
+            SimpleHistogram("test_histogram", backend="tdigest")
+
+
 class TestSimpleMetricsEdgeCases(FoundationTestCase):
     """Tests for edge cases and special scenarios."""
 
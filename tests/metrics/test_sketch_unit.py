@@ -0,0 +1,113 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Unit tests for the fixed-memory histogram sketch."""
+
+from __future__ import annotations
+
+import random
+
+from provide.testkit import FoundationTestCase
+import pytest
+
+from provide.foundation.metrics.sketch import HistogramSketch
+
+
+class TestHistogramSketch(FoundationTestCase):
+    """Tests for HistogramSketch."""
+
+    def test_running_totals(self) -> None:
+        """Test count, sum, min, max and avg are exact."""
+        sketch = HistogramSketch()
+
+        for value in (3.0, -1.0, 0.0, 10.0):
+            sketch.add(value)
+
+        assert sketch.count == 4
+        assert sketch.sum == 12.0
+        assert sketch.min == -1.0
+        assert sketch.max == 10.0
+        assert sketch.avg == 3.0
+
+    def test_empty_sketch(self) -> None:
+        """Test an empty sketch reports no values."""
+        sketch = HistogramSketch()
+
+        assert sketch.quantile(0.5) is None
+        assert sketch.min is None
+        assert sketch.max is None
+        assert sketch.avg == 0.0
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Test quantile estimates stay within the configured accuracy."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 2) for _ in range(20_000)]
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.0, 0.5, 0.95, 0.99, 1.0):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            estimate = sketch.quantile(q)
+            assert estimate is not None
+            assert abs(estimate - expected) <= expected * 0.01 + 1e-12
+
+    def test_negative_and_zero_values_ordered(self) -> None:
+        """Test negative values sort below zero and positive values."""
+        sketch = HistogramSketch()
+        for value in (-100.0, -1.0, 0.0, 1.0, 100.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0.0) == -100.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 100.0
+
+    def test_memory_bounded_by_max_buckets(self) -> None:
+        """Test a wide value range collapses into max_buckets counters."""
+        sketch = HistogramSketch(max_buckets=64)
+
+        for exponent in range(-60, 60):
+            sketch.add(10.0**exponent)
+
+        assert len(sketch._positive.counts) <= 64
+        assert sketch.count == 120
+        assert sketch.quantile(1.0) == 10.0**59
+
+    def test_merge_matches_single_sketch(self) -> None:
+        """Test merging two sketches equals sketching all values at once."""
+        values = [float(i) for i in range(1, 1001)]
+        whole = HistogramSketch()
+        left = HistogramSketch()
+        right = HistogramSketch()
+        for value in values:
+            whole.add(value)
+        for value in values[:400]:
+            left.add(value)
+        for value in values[400:]:
+            right.add(value)
+
+        left.merge(right)
+
+        assert left.to_dict() == whole.to_dict()
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        """Test sketches with different bucket widths cannot be merged."""
+        with pytest.raises(ValueError, match="different relative accuracy"):
+            HistogramSketch(0.01).merge(HistogramSketch(0.02))
+
+    def test_copy_is_independent(self) -> None:
+        """Test a copy does not change when the original does."""
+        sketch = HistogramSketch()
+        sketch.add(1.0)
+        snapshot = sketch.copy()
+
+        sketch.add(2.0)
+
+        assert snapshot.count == 1
+        assert snapshot.max == 1.0
+
+
+# 🧱🏗️🔚
@@ -35,6 +35,7 @@ from provide.testkit import (
 )
 
 from provide.foundation import LoggingConfig, TelemetryConfig, get_hub, logger
+from provide.foundation.logger.processors import _build_core_processors_list
 
 
 @contextmanager
@@ -153,6 +154,40 @@ class TestBasicLoggingPerformance(FoundationTestCase):
             # Performance validated by benchmark output - achieving >250k ops/sec
 
 
+class TestProcessorChainPerformance(FoundationTestCase):
+    """Per-event cost of the core processor chain, default vs compiled."""
+
+    def setup_method(self) -> None:
+        """Reset Foundation state before each test."""
+        super().setup_method()
+
+    @pytest.mark.parametrize("compiled_processors", [False, True], ids=["chain", "compiled"])
+    def test_core_processor_chain_per_event(self, benchmark, compiled_processors: bool) -> None:
+        """Benchmark running 1000 events through the core processor chain."""
+        config = TelemetryConfig(
+            service_name="benchmark-service",
+            tracing_enabled=False,
+            logging=LoggingConfig(
+                default_level="INFO",
+                omit_timestamp=True,
+                compiled_processors=compiled_processors,
+                das_emoji_prefix_enabled=False,
+                sanitization_enabled=False,
+            ),
+        )
+        processors = _build_core_processors_list(config)
+        benchmark.group = "core-processor-chain"
+
+        def run_chain() -> None:
+            """Function to benchmark - run events through the chain."""
+            for i in range(1000):
+                event_dict = {"event": "Chain message", "logger_name": "benchmark.chain", "iteration": i}
+                for processor in processors:
+                    event_dict = processor(None, "info", event_dict)
+
+        benchmark(run_chain)
+
+
 class TestConcurrentPerformance(FoundationTestCase):
     """Concurrent and async performance benchmarks."""
 
@@ -201,6 +236,38 @@ class TestConcurrentPerformance(FoundationTestCase):
 
             # Performance validated by benchmark output - achieving >250k ops/sec
 
+    @pytest.mark.parametrize("strategy", ["locked", "sharded"])
+    def test_rate_limiter_contention_performance(self, benchmark, strategy: str) -> None:
+        """Benchmark rate limit checks from many threads for each bucket strategy."""
+        from provide.foundation.logger.ratelimit import GlobalRateLimiter
+
+        GlobalRateLimiter._instance = None
+        limiter = GlobalRateLimiter()
+        # Capacity high enough that the benchmark measures locking, not denial
+        limiter.configure(
+            global_rate=1_000_000.0,
+            global_capacity=1_000_000.0,
+            use_buffered=False,
+            strategy=strategy,
+        )
+
+        def worker_thread(checks: int) -> None:
+            for _ in range(checks):
+                limiter.is_allowed("benchmark.contention")
+
+        def contended_checks() -> None:
+            """Function to benchmark - concurrent rate limit checks."""
+            thread_count = 8
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                futures = [executor.submit(worker_thread, 2000) for _ in range(thread_count)]
+                for future in futures:
+                    future.result()
+
+        try:
+            benchmark(contended_checks)
+        finally:
+            GlobalRateLimiter._instance = None
+
     def test_level_filtering_performance(self, benchmark) -> None:
         """Benchmark log level filtering efficiency."""
         config = TelemetryConfig(
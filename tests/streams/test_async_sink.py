@@ -0,0 +1,179 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import tempfile
+import threading
+
+from provide.testkit import FoundationTestCase
+import pytest
+
+from provide.foundation.streams import core as core_module
+from provide.foundation.streams.async_sink import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    AsyncLogSink,
+    get_async_sink,
+    install_async_sink,
+    uninstall_async_sink,
+)
+from provide.foundation.streams.file import (
+    close_log_streams,
+    configure_file_logging,
+    flush_log_streams,
+)
+
+#
+# test_async_sink.py
+#
+"""Tests for the asynchronous batched log sink."""
+
+
+class _GatedStream(io.StringIO):
+    """StringIO whose writes wait until the test opens the gate."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.gate.wait(5.0)
+        return super().write(text)
+
+
+class TestAsyncLogSink(FoundationTestCase):
+    def test_lines_reach_target_after_drain(self) -> None:
+        target = io.StringIO()
+        sink = AsyncLogSink(target, flush_interval=10.0)
+        try:
+            for i in range(5):
+                sink.write(f"line {i}")
+                sink.write("\n")
+            assert sink.drain()
+            assert target.getvalue() == "".join(f"line {i}\n" for i in range(5))
+            assert sink.stats()["written_lines"] == 5
+        finally:
+            sink.close()
+
+    def test_partial_line_held_until_newline(self) -> None:
+        target = io.StringIO()
+        sink = AsyncLogSink(target)
+        try:
+            sink.write("partial")
+            sink.drain()
+            assert target.getvalue() == ""
+            sink.write(" done\nnext")
+            sink.drain()
+            assert target.getvalue() == "partial done\n"
+        finally:
+            sink.close()
+        assert target.getvalue() == "partial done\nnext"
+
+    def test_drop_newest_counts_dropped_lines(self) -> None:
+        target = _GatedStream()
+        sink = AsyncLogSink(
+            target,
+            buffer_size=2,
+            batch_size=100,
+            flush_interval=10.0,
+            overflow_policy=OVERFLOW_DROP_NEWEST,
+        )
+        try:
+            for i in range(5):
+                sink.write(f"{i}\n")
+            assert sink.stats()["dropped_newest"] == 3
+            target.gate.set()
+            sink.drain()
+            assert target.getvalue() == "0\n1\n"
+        finally:
+            target.gate.set()
+            sink.close()
+
+    def test_drop_oldest_keeps_recent_lines(self) -> None:
+        target = _GatedStream()
+        sink = AsyncLogSink(
+            target,
+            buffer_size=2,
+            batch_size=100,
+            flush_interval=10.0,
+            overflow_policy=OVERFLOW_DROP_OLDEST,
+        )
+        try:
+            for i in range(5):
+                sink.write(f"{i}\n")
+            stats = sink.stats()
+            assert stats["dropped_oldest"] == 3
+            assert stats["dropped_lines"] == 3
+            target.gate.set()
+            sink.drain()
+            assert target.getvalue() == "3\n4\n"
+        finally:
+            target.gate.set()
+            sink.close()
+
+    def test_block_policy_loses_nothing(self) -> None:
+        target = io.StringIO()
+        sink = AsyncLogSink(target, buffer_size=4, batch_size=2, overflow_policy=OVERFLOW_BLOCK)
+        try:
+            for i in range(200):
+                sink.write(f"{i}\n")
+            sink.drain()
+            assert target.getvalue() == "".join(f"{i}\n" for i in range(200))
+            assert sink.stats()["dropped_lines"] == 0
+        finally:
+            sink.close()
+
+    def test_invalid_policy_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            AsyncLogSink(io.StringIO(), overflow_policy="explode")
+
+    def test_write_after_close_goes_straight_to_target(self) -> None:
+        target = io.StringIO()
+        sink = AsyncLogSink(target)
+        sink.close()
+        sink.write("late\n")
+        assert target.getvalue() == "late\n"
+        assert sink.closed
+
+
+class TestAsyncSinkInstallation(FoundationTestCase):
+    def test_install_routes_log_stream_through_sink(self) -> None:
+        original = core_module._PROVIDE_LOG_STREAM
+        sink = install_async_sink(buffer_size=100, batch_size=10, flush_interval=0.05, overflow_policy="block")
+        try:
+            assert get_async_sink() is sink
+            assert core_module._PROVIDE_LOG_STREAM is sink
+            assert sink.target is original
+        finally:
+            uninstall_async_sink()
+        assert get_async_sink() is None
+        assert core_module._PROVIDE_LOG_STREAM is original
+
+    def test_flush_and_close_drain_file_sink(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "async.log"
+            configure_file_logging(str(log_file))
+            sink = install_async_sink(
+                buffer_size=100,
+                batch_size=1000,
+                flush_interval=10.0,
+                overflow_policy="block",
+            )
+            sink.write("hello\n")
+            flush_log_streams()
+            assert log_file.read_text() == "hello\n"
+
+            sink.write("bye\n")
+            close_log_streams()
+            assert get_async_sink() is None
+            assert log_file.read_text() == "hello\nbye\n"
+
+
+# 🧱🏗️🔚